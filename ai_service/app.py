@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import os, json, importlib
+import os, sys, json, importlib
 from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 from dotenv import load_dotenv
 load_dotenv()
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.stats import compute_stats
 
 # ----------------------------------------------------------------------
 # Dynamic import so we can support both SDK versions -------------------
@@ -64,10 +66,12 @@ CORS(app)
 @app.route("/report", methods=["POST"])
 def report():
     data = request.get_json(silent=True) or {}
-    articles = data.get("articles", [])[:20]
-    stats = data.get("stats", {})
-    if not articles:
-        return jsonify({"error": "no articles supplied"}), 400
+    # compact payload: pre-computed stats (gateway /stats) + a sample of articles
+    all_articles = data.get("articles") or []
+    stats = data.get("stats") or (compute_stats(all_articles) if all_articles else {})
+    articles = all_articles[:20]
+    if not articles and not stats:
+        return jsonify({"error": "no articles or stats supplied"}), 400
 
     text_block = "\n\n".join(
         f"{a.get('title','')} – {a.get('description','')}" for a in articles
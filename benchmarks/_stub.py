@@ -0,0 +1,59 @@
+"""
+Petits serveurs HTTP locaux utilisés par les benchmarks.
+
+    with serve(handler) as base_url:
+        requests.get(base_url + "/...")
+
+`handler(path, query, headers)` renvoie (status, headers, body) ;
+body peut être un itérable de bytes pour simuler un serveur lent.
+keep_alive=True répond en HTTP/1.1 (connexions réutilisables, body en bytes).
+"""
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+
+def _make_handler(handler, keep_alive=False):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+            status, headers, body = handler(parts.path, query, self.headers)
+            if isinstance(body, str):
+                body = body.encode()
+            try:
+                self.send_response(status)
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                if isinstance(body, bytes):
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                else:
+                    self.end_headers()
+                    for chunk in body or ():
+                        self.wfile.write(chunk)
+                        self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # client parti (délai dépassé côté client)
+
+        def log_message(self, *args):
+            pass
+
+    return _Handler
+
+
+@contextmanager
+def serve(handler, keep_alive=False):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(handler, keep_alive))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
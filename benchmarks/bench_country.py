@@ -0,0 +1,62 @@
+"""
+extract_country : démarrage à froid et débit.
+
+* démarrage : premier appel dans un processus neuf, cache tldextract vide
+  (tldextract par défaut tente de télécharger la public suffix list) vs
+  utils.lang (liste embarquée chargée à l'import, langdetect compris).
+  Sans réseau, le premier dépend du délai de résolution DNS / connexion ;
+* débit : N URLs réalistes (quelques domaines très répétés), ancien
+  appel tldextract.extract par item vs extract_country / extract_countries.
+
+    python benchmarks/bench_country.py [nb_urls]
+"""
+import os, sys, time, random, subprocess, tempfile, logging
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+COLD_OLD = "import time; t=time.perf_counter(); import tldextract; tldextract.extract('https://www.rts.sn/x'); print(time.perf_counter()-t)"
+COLD_NEW = "import time; t=time.perf_counter(); from utils.lang import extract_country; extract_country('https://www.rts.sn/x'); print(time.perf_counter()-t)"
+
+HOSTS = ["https://twitter.com/i/web/status/{}", "https://www.youtube.com/watch?v={}",
+         "https://www.linkedin.com/posts/{}", "https://www.rts.sn/actualites/{}",
+         "https://www.senenews.com/{}", "https://www.lemonde.fr/{}", "https://www.bbc.co.uk/{}",
+         "https://i.redd.it/{}.jpg", "https://www.seneweb.com/news/{}"]
+
+
+def cold(code):
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ, TLDEXTRACT_CACHE=cache, PYTHONPATH=ROOT)
+        out = subprocess.run([sys.executable, "-c", code], env=env, cwd=ROOT,
+                             capture_output=True, text=True, timeout=120)
+        return float(out.stdout.strip().splitlines()[-1])
+
+
+def old_country(url):
+    import tldextract
+    if not url:
+        return ''
+    last = tldextract.extract(url).suffix.split('.')[-1].lower()
+    return last if len(last) == 2 else ('us' if last == 'com' else '')
+
+
+def main(n=100000):
+    print(f"démarrage à froid : tldextract par défaut {cold(COLD_OLD):.2f}s   "
+          f"liste embarquée {cold(COLD_NEW):.2f}s")
+
+    logging.disable(logging.CRITICAL)       # pas de traces réseau de tldextract
+    from utils.lang import extract_country, extract_countries, PSL_VERSION
+    rng = random.Random(3)
+    urls = [rng.choice(HOSTS).format(i) for i in range(n)]
+    old_country(urls[0])                    # chargement hors chrono
+
+    t0 = time.perf_counter(); old = [old_country(u) for u in urls]
+    t1 = time.perf_counter(); one = [extract_country(u) for u in urls]
+    t2 = time.perf_counter(); batch = extract_countries(urls)
+    t3 = time.perf_counter()
+    assert old == one == batch
+    print(f"PSL {PSL_VERSION}, {n} URLs : tldextract {t1 - t0:.2f}s   "
+          f"extract_country {t2 - t1:.2f}s   extract_countries {t3 - t2:.2f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,76 @@
+"""
+Normalisation des dates : ancien code des handlers vs utils.dates.
+
+* démarrage : import de dateutil.parser seul vs import de utils.dates ;
+* par item : N valeurs mêlant ISO (Twitter/RSS/YouTube), epochs (Reddit)
+  et formes relatives (LinkedIn), filtrées sur une fenêtre de dates.
+
+    python benchmarks/bench_dates.py [nb_valeurs]
+"""
+import os, sys, time, random, subprocess
+from datetime import date, datetime, timedelta, timezone
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+
+def import_time(module):
+    code = f"import time; t=time.perf_counter(); import {module}; print(time.perf_counter()-t)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                         env=dict(os.environ, PYTHONPATH=ROOT))
+    return float(out.stdout.strip())
+
+
+def old_window(values, start, end):
+    """Boucle historique : isoparse, puis parse, epoch à part, try/except nu."""
+    from dateutil import parser
+    out = []
+    for v in values:
+        try:
+            if isinstance(v, (int, float)):
+                dt = datetime.fromtimestamp(float(v)).astimezone()
+            else:
+                try:
+                    dt = parser.isoparse(v)
+                except Exception:
+                    dt = parser.parse(v)
+        except Exception:
+            out.append(None)
+            continue
+        out.append(dt if start <= dt.date() <= end else None)
+    return out
+
+
+def make_values(n, rng):
+    base = datetime(2025, 7, 21, tzinfo=timezone.utc)
+    values = []
+    for _ in range(n):
+        dt = base - timedelta(seconds=rng.randint(0, 90 * 86400))
+        r = rng.random()
+        if r < 0.5:
+            values.append(dt.isoformat())                       # Twitter / RSS
+        elif r < 0.7:
+            values.append(dt.strftime("%Y-%m-%dT%H:%M:%SZ"))    # YouTube
+        elif r < 0.9:
+            values.append(dt.timestamp())                       # Reddit
+        else:
+            values.append(rng.choice(["3h", "2d", "1w", "Aujourd'hui", "yesterday"]))  # LinkedIn
+    return values
+
+
+def main(n=100000):
+    print(f"import dateutil.parser {1e3 * import_time('dateutil.parser'):.0f} ms   "
+          f"import utils.dates {1e3 * import_time('utils.dates'):.0f} ms")
+
+    from utils.dates import filter_window
+    values = make_values(n, random.Random(5))
+    start, end = date(2025, 6, 1), date(2025, 7, 21)
+    t0 = time.perf_counter(); old = old_window(values, start, end)
+    t1 = time.perf_counter(); new = filter_window(values, start, end)
+    t2 = time.perf_counter()
+    print(f"{n} valeurs : dateutil par item {t1 - t0:.2f}s ({1e6 * (t1 - t0) / n:.1f} µs/item)   "
+          f"filter_window {t2 - t1:.2f}s ({1e6 * (t2 - t1) / n:.1f} µs/item)")
+    print(f"retenues : ancien {sum(d is not None for d in old)}   nouveau {sum(d is not None for d in new)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
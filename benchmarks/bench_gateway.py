@@ -0,0 +1,99 @@
+"""
+Résultats multi-sources : un fetch par service côté navigateur
+(Promise.allSettled, rien d'affiché avant le plus lent) vs passerelle
+gateway_service qui interroge les services en parallèle et diffuse en NDJSON.
+
+Six faux services locaux répondent après LATENCIES secondes (linkedin le plus
+lent, youtube en erreur) avec ARTICLES articles, dont une partie des URL se
+recoupent d'un service à l'autre (http/https, www., utm_*, / final). On mesure
+le temps avant le premier résultat (TTFR) et le temps total, et on vérifie
+que la passerelle rend les mêmes articles, sans doublon d'URL.
+
+    python benchmarks/bench_gateway.py
+"""
+import json, logging, os, sys, time, threading
+from concurrent.futures import ThreadPoolExecutor
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "gateway_service"))
+
+import requests
+from werkzeug.serving import make_server
+from _stub import serve                                      # noqa: E402
+
+LATENCIES = {"rss": 0.15, "presse": 0.3, "twitter": 0.6, "reddit": 1.2, "youtube": 0.8, "linkedin": 2.5}
+ARTICLES  = 200
+SHARED    = ["https://www.exemple.sn/actualites/%d", "http://exemple.sn/actualites/%d/",
+             "https://exemple.sn/actualites/%d?utm_source=twitter"]
+
+
+def handler(path, query, headers):
+    name = path.strip("/").split("/")[0]
+    time.sleep(LATENCIES[name])
+    if name == "youtube":
+        return 500, {"Content-Type": "application/json"}, json.dumps({"error": "quota dépassé"})
+    arts = [{"service": name, "id": f"{name}-{i}", "title": f"{query.get('q', '')} {name} {i}",
+             "url": (SHARED[i % 3] % i) if i % 4 == 0 else f"https://{name}.exemple/{i}",
+             "date": "2025-07-21T10:00:00+00:00"} for i in range(ARTICLES)]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"articles": arts})
+
+
+def browser(base):
+    """Comportement actuel d'App.jsx : un fetch par service, attente de tous."""
+    t0 = time.perf_counter()
+    def one(name):
+        resp = requests.get(f"{base}/{name}/articles", params={"q": "sonko"}, timeout=10)
+        resp.raise_for_status()
+        return resp.json()["articles"]
+    with ThreadPoolExecutor(len(LATENCIES)) as pool:
+        futures = [pool.submit(one, n) for n in LATENCIES]
+    out = []
+    for f in futures:
+        if f.exception() is None:
+            out += f.result()
+    total = time.perf_counter() - t0
+    return total, total, out           # rien n'est affiché avant la fin
+
+
+def gateway(url):
+    t0, first, out, done = time.perf_counter(), None, [], None
+    with requests.get(url, params={"q": "sonko"}, stream=True, timeout=10) as resp:
+        for line in resp.iter_lines():
+            ev = json.loads(line)
+            if ev["event"] == "articles" and ev["articles"] and first is None:
+                first = time.perf_counter() - t0
+            if ev["event"] == "articles":
+                out += ev["articles"]
+            elif ev["event"] == "done":
+                done = ev
+    return first, time.perf_counter() - t0, out, done
+
+
+def main():
+    with serve(handler, keep_alive=True) as base:
+        for name in LATENCIES:
+            os.environ[f"GATEWAY_{name.upper()}_URL"] = f"{base}/{name}"
+        import app
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        server = make_server("127.0.0.1", 0, app.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        gw = f"http://127.0.0.1:{server.server_port}/articles"
+        try:
+            ttfr, total, ref = browser(base)
+            print(f"navigateur (allSettled) TTFR={ttfr:5.2f}s  total={total:5.2f}s  articles={len(ref)}")
+            ttfr, total, out, done = gateway(gw)
+            print(f"passerelle (NDJSON)     TTFR={ttfr:5.2f}s  total={total:5.2f}s  articles={len(out)}  "
+                  f"doublons retirés={done['duplicates']}")
+            for name, s in done["services"].items():
+                print(f"  {name:9s} {s['elapsed']:5.2f}s  {s['count']:4d} articles  erreur={s['error']}")
+
+            from fanout import article_url, canonical_url
+            keys = [canonical_url(article_url(a)) for a in out]
+            assert len(keys) == len(set(keys)), "URL en double dans la sortie de la passerelle"
+            assert set(keys) == {canonical_url(article_url(a)) for a in ref}, "articles différents"
+            print("mêmes articles que le navigateur, sans doublon d'URL")
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Chargement des fichiers LinkedIn par /articles : relecture vs cache parsé.
+
+Pour chaque fichier de linkedin_service/data/, coût d'un /articles qui
+charge le fichier puis normalise ses posts (date → datetime UTC, corps
+titre + description en minuscules) :
+
+  - "json indenté" : json.load du fichier actuel à chaque requête (ancien _load) ;
+  - "json compact" : shard JSON sans indentation, relu à chaque requête ;
+  - "cache"        : ShardStore, fichier parsé et records gardés en mémoire
+                     tant que le mtime ne change pas.
+
+    python benchmarks/bench_linkedin_load.py
+"""
+import os, sys, json, time, tempfile
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "linkedin_service"))
+
+import shards                                # noqa: E402
+from records import build_records           # noqa: E402
+
+DATA = os.path.join(ROOT, "linkedin_service", "data")
+FILES = sorted(f[:-5] for f in os.listdir(DATA) if f.endswith(".json"))
+ROUNDS = 20
+
+
+def per_request(fn):
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for name in FILES:
+            fn(name)
+    return (time.perf_counter() - t0) / ROUNDS / len(FILES) * 1000
+
+
+def legacy(name):
+    with open(os.path.join(DATA, name + ".json"), encoding="utf-8") as f:
+        return build_records(json.load(f))
+
+
+def main():
+    sizes = [os.path.getsize(os.path.join(DATA, n + ".json")) for n in FILES]
+    print(f"{len(FILES)} fichiers, {sum(sizes) / 1024:.0f} Ko, max {max(sizes) / 1024:.0f} Ko ; "
+          f"ms par requête (moyenne sur les fichiers)")
+    rows = [("json indenté", per_request(legacy), sum(sizes))]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = shards.ShardStore(tmp, 3600, lambda kw: kw)
+        for name in FILES:
+            with open(os.path.join(DATA, name + ".json"), encoding="utf-8") as f:
+                store.save(name, json.load(f), 1000)
+        size = sum(os.path.getsize(store.path(n)) for n in FILES)
+
+        def reread(name):
+            return build_records(shards._read(store.path(name))["posts"])
+        rows.append(("json compact", per_request(reread), size))
+
+        store = shards.ShardStore(tmp, 3600, lambda kw: kw)
+        rows.append(("cache", per_request(lambda name: store.records(store.load(name))), 0))
+        assert store.stats()["misses"] == len(FILES)
+
+    base = rows[0][1]
+    for label, ms, size in rows:
+        disk = f"{size / 1024:6.0f} Ko" if size else "       -"
+        print(f"{label:13s}: {ms:7.3f} ms  x{base / ms:6.1f}   {disk}")
+
+
+if __name__ == "__main__":
+    main()
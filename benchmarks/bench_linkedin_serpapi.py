@@ -0,0 +1,83 @@
+"""
+LinkedIn /collect : pagination SerpAPI séquentielle vs pool + cache disque.
+
+Une fausse SerpAPI locale (GoogleSearch.BACKEND via SERPAPI_BACKEND) sert,
+pour chaque mot-clé, AVAILABLE résultats par pages de 100 avec LATENCY s
+par appel (SerpAPI met 1 à 3 s en vrai). On compare pour une requête à
+plusieurs mots-clés et n=N :
+
+  - "ancien" : mots-clés et pages l'un après l'autre, plafond partagé
+               (le premier mot-clé affame les suivants) ;
+  - "froid"  : search_posts, pool borné et budget par mot-clé ;
+  - "chaud"  : même collecte, réponses servies par le cache disque.
+
+    python benchmarks/bench_linkedin_serpapi.py
+"""
+import os, sys, json, time, re, tempfile, threading
+from collections import Counter
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "linkedin_service"))
+
+from _stub import serve                      # noqa: E402
+
+QUERY = "sonko, diomaye, faye, dias"
+AVAILABLE, N, LATENCY = {"sonko": 900, "diomaye": 400, "faye": 250, "dias": 120}, 1000, 0.2
+state = {"calls": 0}
+lock = threading.Lock()
+
+
+def fake_serpapi(path, query, headers):
+    time.sleep(LATENCY)
+    with lock:
+        state["calls"] += 1
+    kw = re.search(r'intitle:"([^"]+)"', query["q"]).group(1)
+    start, num = int(query.get("start", 0)), int(query.get("num", 10))
+    results = [{"position": i + 1, "title": f"{kw} post {i}", "snippet": "...", "date": "2d",
+                "link": f"https://www.linkedin.com/posts/{kw}-{i}"}
+               for i in range(start, min(start + num, AVAILABLE.get(kw, 0)))]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"organic_results": results})
+
+
+def legacy_search(query, max_posts):
+    """Boucle d'avant : séquentielle, plafond `all_posts` partagé."""
+    from serpapi import GoogleSearch
+    all_posts = []
+    for kw in [k.strip() for k in re.split(r"[,\s]+", query) if k.strip()]:
+        start = 0
+        while len(all_posts) < max_posts:
+            params = {"engine": "google", "q": f'site:linkedin.com/posts intitle:"{kw}"',
+                      "api_key": "fake", "num": min(100, max_posts - len(all_posts)), "start": start}
+            posts = GoogleSearch(params).get_dict().get("organic_results", [])
+            if not posts:
+                break
+            all_posts += posts
+            start += 100
+            if len(posts) < 100:
+                break
+    return [{"url": p["link"]} for p in all_posts]
+
+
+def run(label, fn):
+    state["calls"] = 0
+    t0 = time.perf_counter()
+    posts = fn()
+    dt = time.perf_counter() - t0
+    per_kw = Counter(p["url"].rsplit("/", 1)[1].rsplit("-", 1)[0] for p in posts)
+    print(f"{label:7s}: {state['calls']:2d} appels  {dt:6.2f}s   " +
+          "  ".join(f"{kw}={per_kw.get(kw, 0)}" for kw in AVAILABLE))
+
+
+def main():
+    with serve(fake_serpapi) as base, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(SERPAPI_BACKEND=base, SERPAPI_KEY="fake",
+                          LINKEDIN_SERP_CACHE_DIR=os.path.join(tmp, "serpapi"))
+        import linkedin_client
+        print(f"requête {QUERY!r}, n={N}, {LATENCY * 1000:.0f} ms par appel SerpAPI")
+        run("ancien", lambda: legacy_search(QUERY, N))
+        run("froid", lambda: linkedin_client.search_posts(QUERY, N))
+        run("chaud", lambda: linkedin_client.search_posts(QUERY, N))
+        print("cache :", linkedin_client.CACHE.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+LinkedIn /articles : cache par requête complète vs shards par mot-clé.
+
+Rejoue les requêtes dont linkedin_service/data/ garde une copie (un fichier
+par requête complète, souvent presque identiques) contre une fausse
+SerpAPI locale, cache de réponses brutes désactivé :
+
+  - "par requête" : ancien _load/_save, une collecte payante par slug ;
+  - "shards"      : collect_posts, un shard par mot-clé partagé entre requêtes.
+
+On compte les appels SerpAPI (= crédits) et le taux de hit.
+
+    python benchmarks/bench_linkedin_shards.py
+"""
+import os, sys, json, re, tempfile, threading
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "linkedin_service"))
+
+from _stub import serve                      # noqa: E402
+
+DATA = os.path.join(ROOT, "linkedin_service", "data")
+QUERIES = [name[:-5].replace("-", " ") for name in sorted(os.listdir(DATA)) if name.endswith(".json")]
+N, PER_KEYWORD = 1000, 150
+state = {"calls": 0}
+lock = threading.Lock()
+
+
+def fake_serpapi(path, query, headers):
+    with lock:
+        state["calls"] += 1
+    kw = re.search(r'intitle:"([^"]+)"', query["q"]).group(1)
+    start, num = int(query.get("start", 0)), int(query.get("num", 10))
+    results = [{"position": i + 1, "title": f"{kw} {i}", "link": f"https://www.linkedin.com/posts/{kw}-{i}"}
+               for i in range(start, min(start + num, PER_KEYWORD))]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"organic_results": results})
+
+
+def main():
+    with serve(fake_serpapi) as base, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(SERPAPI_BACKEND=base, SERPAPI_KEY="fake", LINKEDIN_SERP_CACHE_TTL="0",
+                          LINKEDIN_SHARD_DIR=os.path.join(tmp, "shards"))
+        import linkedin_client as lc
+
+        cached = {}
+        for q in QUERIES:                                  # ancien cache par slug de requête
+            if lc.slugify(q) not in cached:
+                cached[lc.slugify(q)] = lc.search_posts(q, N)
+        legacy_calls, state["calls"] = state["calls"], 0
+
+        hits = total = 0
+        for q in QUERIES:
+            _, report = lc.collect_posts(q, N)
+            hits, total = hits + report["hits"], total + report["keywords"]
+        shard_calls = state["calls"]
+
+    keywords = {kw for q in QUERIES for kw in lc.split_keywords(q)}
+    print(f"{len(QUERIES)} requêtes, {len(keywords)} mots-clés distincts, n={N}")
+    print(f"par requête : {legacy_calls:3d} appels SerpAPI, hit rate 0 (aucune requête répétée)")
+    print(f"shards      : {shard_calls:3d} appels SerpAPI, {hits}/{total} mots-clés servis par un shard "
+          f"({hits / total:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+QueryMatcher vs match_query + `any(w in text for w in ex)` : débit du
+filtrage de N textes avec des requêtes de veille typiques. L'équivalence
+des deux est vérifiée par tests/test_search.py.
+
+    python benchmarks/bench_match.py [nb_textes]
+"""
+import os, sys, re, random, time
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from utils import search                                  # noqa: E402
+from utils.search import QueryMatcher, split_exclude      # noqa: E402
+
+WORDS = ["sonko", "diomaye", "faye", "Ousmane", "SÉNÉGAL", "dakar", "pastef",
+         "foot", "ball", "football", "président", "mctn", "new", "deal", "é"]
+SPACES = [" ", "  ", "\t", "\n", " ", " ", ""]
+
+
+def reference(q, ex, text):
+    """Comportement historique des services (référence chronométrée)."""
+    q_raw = (q or "").strip().lower()
+    if not q_raw:
+        ok = True
+    else:
+        low = (text or "").lower()
+        if "," in q_raw:
+            ok = any(kw and kw in low for kw in (k.strip() for k in q_raw.split(",")))
+        else:
+            ok = re.sub(r"\s+", " ", q_raw) in re.sub(r"\s+", " ", low)
+    return ok and not (ex and any(w in (text or "").lower() for w in ex))
+
+
+def rand_text(rng, n):
+    return "".join(rng.choice(WORDS) + rng.choice(SPACES) for _ in range(n))
+
+
+def main(n=20000):
+    rng = random.Random(7)
+    print(f"moteur : {'pyahocorasick' if search.ahocorasick else 'regex'}")
+
+    texts = [rand_text(rng, rng.randint(20, 80)) for _ in range(n)]
+    cases = {
+        "phrase":     ("ousmane sonko", "football, foot"),
+        "OR 6 mots":  ("sonko,diomaye,faye,pastef,mctn,new deal", "football foot ball"),
+    }
+    for label, (q, raw_ex) in cases.items():
+        ex = split_exclude(raw_ex)
+        t0 = time.perf_counter()
+        old = [reference(q, ex, t) for t in texts]
+        t1 = time.perf_counter()
+        new = QueryMatcher(q, ex).filter(texts)
+        t2 = time.perf_counter()
+        print(f"{label:<10} {n} textes : ancien {1e3 * (t1 - t0):7.1f} ms   "
+              f"QueryMatcher {1e3 * (t2 - t1):7.1f} ms   (x{(t1 - t0) / (t2 - t1):.1f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,91 @@
+"""
+/articles : réponse JSON complète vs flux NDJSON (?stream=1) vs pages
+(?limit= puis ?cursor=), sur le service reddit.
+
+fetch_reddit_posts est remplacé par un faux qui attend UPSTREAM secondes
+(l'appel à Reddit) et renvoie N posts ; la détection de langue (utils.lang)
+est le gros du travail restant. Le serveur tourne vraiment (werkzeug) pour
+mesurer le temps avant le premier octet (TTFB). Chaque scénario a ses propres
+textes, le cache de langue ne sert donc pas d'un scénario à l'autre.
+
+    python benchmarks/bench_paging.py [N]
+"""
+import json, logging, os, sys, time, random, threading
+from datetime import datetime, timedelta, timezone
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "reddit_service"))
+
+import requests
+from werkzeug.serving import make_server
+
+UPSTREAM, PAGE = 0.5, 100
+WORDS = ("le gouvernement annonce une réforme du budget pour la santé et l'école "
+         "the government announced a new budget for health and schools in dakar").split()
+calls = {"n": 0}
+
+
+def fake_posts(run, n):
+    rng, now = random.Random(run), datetime.now(timezone.utc)
+    return [{"title": f"{run} sonko " + " ".join(rng.choice(WORDS) for _ in range(12)),
+             "selftext": "", "url": f"https://reddit.com/r/senegal/{run}/{i}",
+             "created_utc": (now - timedelta(minutes=i)).timestamp()} for i in range(n)]
+
+
+def main(n=1000):
+    os.environ.update(REDDIT_CLIENT_ID="fake", REDDIT_CLIENT_SECRET="fake", REDDIT_USER_AGENT="bench")
+    import app
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    runs = {"run": 0}
+
+    def fetch(q, limit, lo, hi):
+        calls["n"] += 1
+        time.sleep(UPSTREAM)
+        return fake_posts(f"r{runs['run']}", n)
+    app.fetch_reddit_posts = fetch
+
+    server = make_server("127.0.0.1", 0, app.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/articles"
+
+    def get(params):
+        t0 = time.perf_counter()
+        with requests.get(url, params=params, stream=True, timeout=120) as resp:
+            chunks = resp.iter_content(chunk_size=None)
+            first = next(chunks)
+            ttfb = time.perf_counter() - t0
+            body = first + b"".join(chunks)
+        return ttfb, time.perf_counter() - t0, body
+
+    try:
+        runs["run"] += 1
+        ttfb, total, body = get({"q": "sonko"})
+        ref = json.loads(body)
+        print(f"json complet   TTFB={ttfb:5.2f}s  total={total:5.2f}s  {len(ref)} articles")
+
+        runs["run"] += 1
+        ttfb, total, body = get({"q": "sonko", "stream": "1"})
+        lines = body.decode().splitlines()
+        print(f"ndjson         TTFB={ttfb:5.2f}s  total={total:5.2f}s  {len(lines) - 1} articles  "
+              f"fin={json.loads(lines[-1])['done']}")
+
+        runs["run"] += 1
+        calls["n"] = 0
+        ttfb, total, body = get({"q": "sonko", "limit": PAGE})
+        page = json.loads(body)
+        got, times = page["articles"], [total]
+        while page["next_cursor"]:
+            t0 = time.perf_counter()
+            page = requests.get(url, params={"cursor": page["next_cursor"]}, timeout=60).json()
+            times.append(time.perf_counter() - t0)
+            got += page["articles"]
+        print(f"pages de {PAGE}   1re={times[0]:5.2f}s  suivantes={sum(times[1:]) / max(1, len(times) - 1):5.2f}s "
+              f"en moyenne  total={sum(times):5.2f}s  {len(got)} articles en {len(times)} pages  "
+              f"appels Reddit={calls['n']}")
+        assert len(got) == len(ref) and len({a['url'] for a in got}) == len(got)
+        assert requests.get(url, params={"cursor": "expiré"}).status_code == 410
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
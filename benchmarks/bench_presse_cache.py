@@ -0,0 +1,67 @@
+"""
+/articles presse : scraping séquentiel en direct vs cache par site rafraîchi en fond.
+
+Les extracteurs sont remplacés par des faux qui dorment comme un site lent
+(DELAYS, en secondes ; "lequotidien" échoue). On mesure le temps de réponse
+de /articles (client de test Flask) :
+
+  - "ancien"      : chaque extracteur appelé l'un après l'autre dans la requête ;
+  - "froid"       : premier /articles, sites récupérés en parallèle ;
+  - "chaud"       : requêtes suivantes, servies depuis le cache ;
+  - "périmé"      : TTL dépassé, cache servi pendant le rafraîchissement de fond.
+
+    python benchmarks/bench_presse_cache.py
+"""
+import os, sys, time
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "presse_service"))
+
+DELAYS = {"gfm": 1.2, "rts": 0.8, "senepeople": 0.5, "lequotidien": 0.3}
+
+
+def fake_extractor(site):
+    def get_articles():
+        time.sleep(DELAYS[site])
+        if site == "lequotidien":
+            raise ConnectionError("Read timed out")
+        return [{"id": f"https://{site}.sn/{i}", "source": site, "texte": f"Sonko {site} {i}",
+                 "date": "2025-07-21T10:00:00"} for i in range(30)]
+    return get_articles
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return (time.perf_counter() - t0) * 1000, out
+
+
+def main():
+    os.environ.update(PRESSE_REFRESH_TICK="0", PRESSE_SITE_TTL="2")
+    import app, site_cache
+    site_cache.get_extractor = fake_extractor
+    client = app.app.test_client()
+
+    def legacy():
+        out = []
+        for svc in DELAYS:
+            try:
+                out += fake_extractor(svc)()
+            except Exception:
+                pass                              # l'ancienne route renvoyait un 500
+        return out
+
+    ms, _ = timed(legacy)
+    print(f"ancien  : {ms:7.0f} ms  (somme des sites)")
+    ms, r = timed(lambda: client.get("/articles?q=sonko"))
+    print(f"froid   : {ms:7.0f} ms  {len(r.json['articles'])} articles (site le plus lent)")
+    warm = [timed(lambda: client.get("/articles?q=sonko"))[0] for _ in range(20)]
+    print(f"chaud   : {sorted(warm)[10]:7.1f} ms  (médiane sur 20)")
+    time.sleep(2.1)
+    ms, r = timed(lambda: client.get("/articles?q=sonko"))
+    print(f"périmé  : {ms:7.1f} ms  {len(r.json['articles'])} articles servis, rafraîchissement en fond")
+    for svc, info in r.json["sites"].items():
+        print(f"  {svc:12s} fresh={info['fresh']!s:5s} age={info['age']}s  error={info['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Enrichissement presse (enrich.py) : pages d'articles une à une vs pool
+borné par hôte, avec budget de temps et cache par URL.
+
+Un serveur local sert N pages d'articles (LATENCY s chacune) sous deux noms
+d'hôte (127.0.0.1 et localhost) ; on mesure :
+
+  - "séquentiel" : chaque page téléchargée puis analysée l'une après l'autre ;
+  - "1er passage": Enricher (per_host, delay), budget BUDGET secondes ;
+  - "2e passage" : les pages déjà enrichies viennent du cache, le reste est fini ;
+  - "3e passage" : tout vient du cache.
+
+Le serveur compte les requêtes simultanées par hôte (jamais plus que per_host)
+et l'écart minimal entre deux débuts de requête sur un même hôte (~ delay).
+
+    python benchmarks/bench_presse_enrich.py [nb_articles]
+"""
+import os, sys, time, tempfile, threading
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "presse_service"))
+
+import requests
+from _stub import serve                             # noqa: E402
+from enrich import Enricher                         # noqa: E402
+from extractors.parsing import extract_page         # noqa: E402
+
+LATENCY, PER_HOST, DELAY, BUDGET = 0.2, 2, 0.05, 3.0
+
+PAGE = """<html><head><meta property="article:published_time" content="2025-07-2{d}T0{d}:00:00+00:00">
+<script>var x = 1;</script></head><body><nav><p>Accueil Politique Sport</p></nav>
+<article><h1>Article {n}</h1>
+<p>Le ministre a présenté ce matin à Dakar le projet de loi de finances numéro {n}, qui prévoit une hausse du budget de la santé.</p>
+<p>Selon le <b>gouvernement</b>, la réforme doit entrer en vigueur avant la fin de l'année.</p>
+<p>Publicité</p></article></body></html>"""
+
+lock, active, peak, starts = threading.Lock(), {}, {}, {}
+
+
+def handler(path, query, headers):
+    host = headers.get("Host", "").split(":")[0]
+    with lock:
+        active[host] = active.get(host, 0) + 1
+        peak[host]   = max(peak.get(host, 0), active[host])
+        starts.setdefault(host, []).append(time.monotonic())
+    time.sleep(LATENCY)
+    with lock:
+        active[host] -= 1
+    n = int(path.rsplit("/", 1)[-1])
+    return 200, {"Content-Type": "text/html; charset=utf-8"}, PAGE.format(n=n, d=n % 10)
+
+
+def articles(base, count):
+    alt = base.replace("127.0.0.1", "localhost")
+    return [{"id": f"{(base, alt)[i % 2]}/actualites/{i}", "date": "2025-07-21T10:00:00",
+             "source": "rts", "texte": f"Article {i}",
+             "métadonnées": {"url": f"{(base, alt)[i % 2]}/actualites/{i}"}} for i in range(count)]
+
+
+def main(count=60):
+    with serve(handler) as base, tempfile.TemporaryDirectory() as tmp:
+        arts = articles(base, count)
+
+        t0 = time.perf_counter()
+        for a in arts:
+            extract_page(requests.get(a["id"], timeout=5).text)
+        print(f"séquentiel   {time.perf_counter() - t0:6.2f}s  {count} pages")
+
+        starts.clear(); peak.clear()
+        enricher = Enricher(tmp, per_host=PER_HOST, delay=DELAY, max_workers=8)
+        for label in ("1er passage", "2e passage", "3e passage"):
+            t0 = time.perf_counter()
+            out, report = enricher.enrich(arts, budget=BUDGET)
+            done = sum(bool((a.get("métadonnées") or {}).get("enrichi")) for a in out)
+            print(f"{label:12s} {time.perf_counter() - t0:6.2f}s  enrichis={done:3d}/{count}  {report}")
+            time.sleep(LATENCY * 2)       # les requêtes en cours finissent en fond
+
+        gaps = {h: min(b - a for a, b in zip(sorted(s), sorted(s)[1:])) for h, s in starts.items()}
+        print(f"simultanées max par hôte : {peak}  (per_host={PER_HOST})")
+        print("écart min entre requêtes : " + ", ".join(f"{h}={g * 1000:.0f} ms" for h, g in gaps.items())
+              + f"  (delay={DELAY * 1000:.0f} ms)")
+        print(f"exemple : {out[0]['date']} | {out[0]['description'][:80]}...")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60)
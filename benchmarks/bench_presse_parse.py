@@ -0,0 +1,187 @@
+"""
+Extracteurs presse : ancienne analyse (BeautifulSoup + html.parser, arbre
+complet) vs couche extractors/parsing.py (moteur lxml, ou bs4 avec analyse
+partielle), sur des pages d'accueil enregistrées.
+
+Pas de réseau ici : les « snapshots » sont générés (même structure que les
+pages de gfm.sn et rts.sn, avec menus, scripts, commentaires, &nbsp;, liens
+externes, et une variante sans <article> / sans « A LA UNE » pour le
+fallback). On peut aussi donner ses propres fichiers :
+
+    python benchmarks/bench_presse_parse.py [gfm=page.html] [rts=page.html]
+
+Chaque moteur doit rendre exactement les mêmes articles que l'ancien code
+(date « maintenant » figée), sinon le script s'arrête.
+"""
+import os, sys, time, random
+from datetime import datetime
+from urllib.parse import urljoin
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "presse_service"))
+
+from bs4 import BeautifulSoup
+from extractors import gfm, rts, parsing
+
+NOW = datetime(2025, 7, 21, 10, 0, 0)
+
+
+class _Frozen(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+
+# --- ancien code (extracteurs avant la couche parsing), date figée ---------
+def legacy_gfm(html, datetime=_Frozen):
+    base_url = "https://www.gfm.sn"
+    soup = BeautifulSoup(html, "html.parser")
+    articles = []
+    for art in soup.find_all('article'):
+        link = art.find('a', href=True)
+        if not link: continue
+        href = urljoin(base_url, link['href'])
+        title = link.get_text(strip=True)
+        if not title or base_url not in href: continue
+        date = datetime.now().isoformat()
+        time_tag = art.find('time')
+        if time_tag and time_tag.has_attr('datetime'):
+            date = time_tag['datetime']
+        articles.append({"id": href, "date": date, "source": "gfm", "texte": title,
+                         "métadonnées": {"url": href}})
+    if not articles:
+        for link in soup.find_all('a', href=True):
+            href = urljoin(base_url, link['href'])
+            title = link.get_text(strip=True)
+            if len(title) < 20: continue
+            if not href.startswith(base_url): continue
+            articles.append({"id": href, "date": datetime.now().isoformat(), "source": "gfm",
+                             "texte": title, "métadonnées": {"url": href}})
+    return articles
+
+
+def legacy_rts(html, datetime=_Frozen):
+    base_url = "https://www.rts.sn"
+    soup = BeautifulSoup(html, "html.parser")
+    articles = []
+    header = soup.find(lambda t: t.name in ('h2', 'h3')
+                       and 'A LA UNE' in t.get_text(strip=True).upper())
+    if header:
+        for sib in header.find_next_siblings():
+            if sib.name in ('h2', 'h3'):
+                break
+            for a in sib.find_all('a', href=True):
+                href = urljoin(base_url, a['href'])
+                if '/actualites/' not in href:
+                    continue
+                title = a.get_text(strip=True)
+                if not title:
+                    continue
+                articles.append({"id": href, "date": datetime.now().isoformat(), "source": "rts",
+                                 "texte": title, "métadonnées": {"url": href}})
+    if not articles:
+        for a in soup.find_all('a', href=True):
+            href = urljoin(base_url, a['href'])
+            title = a.get_text(strip=True)
+            if '/actualites/' in href and len(title) > 20:
+                articles.append({"id": href, "date": datetime.now().isoformat(), "source": "rts",
+                                 "texte": title, "métadonnées": {"url": href}})
+    return articles
+
+
+# --- snapshots générés ------------------------------------------------------
+WORDS = ("Sonko Diomaye gouvernement Assemblée budget Dakar Thiès pêcheurs "
+         "réforme élections jeunesse santé école Sénégal Lions CAN port").split()
+
+
+def _title(rng, n=None):
+    return " ".join(rng.choice(WORDS) for _ in range(n or rng.randint(2, 9)))
+
+
+def _chrome(rng):
+    menu = "".join(f'<li><a href="/rubrique/{w.lower()}">{w}</a></li>' for w in WORDS)
+    return (f'<head><title>Accueil</title><style>.a{{color:red}}</style>'
+            f'<script>var ads = "<a href=\'/x\'>pub</a>";</script></head>'
+            f'<body><nav><ul>{menu}</ul></nav><!-- bandeau -->'
+            + "".join(f'<div class="w"><p>{_title(rng, 40)}</p><span>&copy; 2025</span></div>'
+                      for _ in range(60)))
+
+
+def gfm_page(rng, blocks=120, with_articles=True):
+    out = ["<!DOCTYPE html><html lang=\"fr\">", _chrome(rng), "<main>"]
+    for i in range(blocks):
+        href = rng.choice([f"/actualite/{i}-{rng.randint(1, 9999)}",
+                           f"https://www.gfm.sn/politique/{i}",
+                           f"https://facebook.com/share?u={i}", ""])
+        title = rng.choice([_title(rng), f"  {_title(rng)}&nbsp;<b>{_title(rng, 2)}</b> <!-- x -->", ""])
+        date = rng.choice(['<time datetime="2025-07-2%dT08:00:00+00:00">hier</time>' % (i % 10),
+                           '<time>hier</time>', ""])
+        tag = "article" if with_articles else "div"
+        out.append(f'<{tag} class="post"><figure><img src="/i/{i}.jpg"></figure>'
+                   f'<h3><a href="{href}">{title}</a></h3>{date}'
+                   f'<p>{_title(rng, 30)} <a href="/tag/{i}">tag</a></p></{tag}>')
+    out.append("</main><footer><a href=\"https://www.gfm.sn/contact\">Contactez la rédaction de GFM</a>"
+               "</footer></body></html>")
+    return "".join(out)
+
+
+def rts_page(rng, items=150, with_une=True):
+    def links(n):
+        return "".join(
+            f'<li><a href="{rng.choice(["/actualites/", "/sport/", "https://www.rts.sn/actualites/"])}'
+            f'{rng.randint(1, 99999)}-article">{rng.choice([_title(rng), _title(rng, 5) + "<br/> " + _title(rng), ""])}'
+            f'</a><span>il y a 2h</span></li>' for _ in range(n))
+    out = ["<!DOCTYPE html><html lang=\"fr\">", _chrome(rng), "<section>"]
+    out.append('<h2 class="titre">Vidéos</h2>' f'<ul>{links(20)}</ul>')
+    out.append(f'<h2 class="titre"> <span>{"A la une" if with_une else "En continu"}</span></h2>')
+    out.append(f'<div class="une"><ul>{links(items // 3)}</ul></div><!-- pub --><p>texte</p>'
+               f'<div class="une2"><ul>{links(items // 3)}</ul></div>')
+    out.append(f'<h3>Sport</h3><ul>{links(items // 3)}</ul>')
+    out.append("</section></body></html>")
+    return "".join(out)
+
+
+def timed(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        ms = (time.perf_counter() - t0) * 1000
+        best = ms if best is None else min(best, ms)
+    return best, out
+
+
+def main():
+    rng = random.Random(7)
+    snapshots = [("gfm", "gfm (<article>)", gfm_page(rng)),
+                 ("gfm", "gfm (fallback)", gfm_page(rng, with_articles=False)),
+                 ("rts", "rts (A LA UNE)", rts_page(rng)),
+                 ("rts", "rts (fallback)", rts_page(rng, with_une=False)),
+                 ("gfm", "gfm (vide)", ""), ("rts", "rts (vide)", "")]
+    for arg in sys.argv[1:]:
+        site, path = arg.split("=", 1)
+        with open(path, encoding="utf-8") as f:
+            snapshots.append((site, f"{site} ({os.path.basename(path)})", f.read()))
+
+    legacy  = {"gfm": legacy_gfm, "rts": legacy_rts}
+    modules = {"gfm": gfm, "rts": rts}
+    engines = ["bs4"] + (["lxml"] if parsing.lxml is not None else [])
+    print(f"moteur par défaut : {parsing.ENGINE}")
+    print(f"{'snapshot':18s} {'Ko':>5s} {'articles':>8s} {'ancien':>9s} "
+          + " ".join(f"{e:>16s}" for e in engines))
+    for site, label, html in snapshots:
+        repeat = 5 if html else 1
+        ref_ms, ref = timed(lambda: legacy[site](html), repeat)
+        cols = []
+        for engine in engines:
+            ms, out = timed(lambda: modules[site].parse_articles(html, now=NOW, engine=engine), repeat)
+            if out != ref:
+                diff = next((i for i, (a, b) in enumerate(zip(out, ref)) if a != b), min(len(out), len(ref)))
+                sys.exit(f"{label} / {engine} : sortie différente de l'ancien code "
+                         f"({len(out)} vs {len(ref)} articles, premier écart à l'index {diff})")
+            cols.append(f"{ms:7.1f} ms x{ref_ms / ms if ms else 0:4.1f}")
+        print(f"{label:18s} {len(html) // 1024:5d} {len(ref):8d} {ref_ms:6.1f} ms " + " ".join(f"{c:>16s}" for c in cols))
+    print("sorties identiques à l'ancien code pour tous les moteurs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Pages d'accueil presse : nouvelle connexion + analyse à chaque passage vs
+session longue par site et pages inchangées non ré-analysées.
+
+Un serveur local (HTTP/1.1 keep-alive) sert une page façon gfm.sn qui ne
+change qu'un passage sur CHANGE_EVERY ; on enchaîne PASSES rafraîchissements :
+
+  - "ancien"   : session neuve à chaque appel (requests.get / create_scraper)
+                 puis analyse complète ;
+  - "session"  : extractors/fetching.scrape, session gardée, empreinte du corps ;
+  - "etag"     : idem, le serveur envoie un ETag et répond 304 ;
+  - "instable" : une requête sur deux répond d'abord 503 (réessai avec backoff).
+
+Sur le vrai site en HTTPS derrière Cloudflare, chaque connexion neuve coûte
+en plus une poignée de main TLS et, pour gfm, un nouveau challenge.
+
+    python benchmarks/bench_presse_session.py
+"""
+import hashlib, os, sys, time, random
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "presse_service"))
+
+import requests
+from _stub import serve                                   # noqa: E402
+from bench_presse_parse import gfm_page, legacy_gfm       # noqa: E402
+from extractors import fetching, gfm                      # noqa: E402
+
+PASSES, CHANGE_EVERY = 30, 5
+rng    = random.Random(3)
+PAGES  = [gfm_page(rng) for _ in range(PASSES // CHANGE_EVERY + 1)]
+served = {"n": 0, "flaky": 0}
+
+
+def handler(path, query, headers):
+    served["n"] += 1
+    body  = PAGES[int(query.get("v", 0))].encode()
+    etag  = '"%s"' % hashlib.md5(body).hexdigest()
+    if path == "/flaky":
+        served["flaky"] += 1
+        if served["flaky"] % 2:
+            return 503, {"Content-Type": "text/plain"}, b"surcharge"
+    if path == "/etag":
+        if headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"Content-Type": "text/html; charset=utf-8", "ETag": etag}, body
+    return 200, {"Content-Type": "text/html; charset=utf-8"}, body
+
+
+def run(label, fetch_one, connections):
+    served["n"] = 0
+    t0, ok, errors = time.perf_counter(), 0, 0
+    for i in range(PASSES):
+        try:
+            ok += bool(fetch_one(i // CHANGE_EVERY))
+        except Exception:
+            errors += 1
+    dt = (time.perf_counter() - t0) * 1000
+    print(f"{label:12s} {dt:7.0f} ms  requêtes={served['n']:3d}  connexions={connections():3d}  "
+          f"ok={ok:2d}  échecs={errors:2d}")
+
+
+def main():
+    with serve(handler, keep_alive=True) as base:
+        def legacy(v):
+            with requests.Session() as s:        # comme requests.get / create_scraper à chaque appel
+                resp = s.get(f"{base}/page", params={"v": v}, timeout=5)
+                resp.raise_for_status()
+                return legacy_gfm(resp.text)
+        run("ancien", legacy, lambda: PASSES)
+
+        for label, path in (("session", "/page"), ("etag", "/etag"), ("instable", "/flaky")):
+            def new(v, path=path, label=label):
+                return fetching.scrape(label, f"{base}{path}?v={v}", gfm.parse_articles)
+
+            def conns(label=label):
+                pools = fetching.session(label).get_adapter(base).poolmanager.pools
+                return sum(pools[key].num_connections for key in pools.keys())
+            run(label, new, conns)
+            print(f"             dernier passage : {fetching.page_stats(label)}")
+
+        served["flaky"] = 0
+        def bare(v):
+            resp = requests.get(f"{base}/flaky", params={"v": v}, timeout=5)
+            resp.raise_for_status()
+            return legacy_gfm(resp.text)
+        run("inst. ancien", bare, lambda: PASSES)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Recherche Reddit multi-mots-clés : une recherche brute vs éclatement parallèle.
+
+Un faux Reddit remplace praw : search(sort='new') sert une chronologie où
+chaque post cite un ou deux noms de la liste de veille, par pages de 100
+avec LATENCY s par page. Comme Reddit, une requête "a,b,c" ne renvoie que
+les posts qui contiennent tous les termes. On compare, pour une fenêtre de
+WINDOW heures :
+
+  - "brute"        : la chaîne à virgules envoyée telle quelle, filtre OR local
+                     (ancien fetch_reddit_posts) ;
+  - "séquentiel"   : un search par mot-clé, l'un après l'autre ;
+  - "pool"         : fetch_reddit_posts, un search par mot-clé dans le pool borné,
+                     fusion par created_utc et dédoublonnage par id.
+
+    python benchmarks/bench_reddit_fanout.py
+"""
+import os, sys, time, random, tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import SimpleNamespace
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "reddit_service"))
+
+NAMES = ["sonko", "diomaye", "macky sall", "barthélémy dias", "khalifa sall", "amadou ba"]
+QUERY = ",".join(NAMES)
+RATE, WINDOW, N, PAGE, LATENCY = 20, 72, 2000, 100, 0.05
+NOW = time.time()
+
+rng = random.Random(0)
+TIMELINE = []
+for i in range(10 * 24 * RATE):
+    names = rng.sample(NAMES, 2 if rng.random() < 0.05 else 1)
+    TIMELINE.append(SimpleNamespace(id=f"p{i}", title=" et ".join(names), url=f"https://reddit.com/p{i}",
+                                    created_utc=NOW - i * 3600 / RATE))
+state = {"pages": 0}
+
+
+class FakeSubreddit:
+    def search(self, query, sort="new", limit=None, params=None):
+        terms = [t.strip() for t in query.lower().split(",") if t.strip()]
+        items = [s for s in TIMELINE if all(t in s.title for t in terms)]
+        after = (params or {}).get("after")
+        if after:
+            items = items[[s.id for s in items].index(after[3:]) + 1:]
+        for offset in range(0, max(len(items), 1), PAGE):   # une page vide coûte aussi un appel
+            state["pages"] += 1
+            time.sleep(LATENCY)
+            yield from items[offset:offset + PAGE]
+
+
+def run(label, fetch):
+    state["pages"] = 0
+    t0 = time.perf_counter()
+    posts = fetch()
+    dt = time.perf_counter() - t0
+    print(f"{label:12s}: {len(posts):5d} posts  {state['pages']:3d} pages  {dt:6.2f}s")
+    return posts
+
+
+def main():
+    from post_store import PostStore
+    os.environ.update(REDDIT_CLIENT_ID="fake", REDDIT_CLIENT_SECRET="fake", REDDIT_USER_AGENT="bench")
+    import reddit_client
+    from utils.search import QueryMatcher
+    reddit_client.make_reddit = lambda: SimpleNamespace(subreddit=lambda name: FakeSubreddit())
+    start = datetime.fromtimestamp(NOW - WINDOW * 3600, timezone.utc)
+    expected = sum(1 for s in TIMELINE if s.created_utc >= start.timestamp())
+    matcher = QueryMatcher(QUERY)
+
+    def raw():
+        listing = FakeSubreddit().search(QUERY, sort="new", limit=None)
+        posts, _ = reddit_client.walk_listing(listing, None, N)
+        return [p for p in posts if p["created_utc"] >= start.timestamp() and matcher(p["title"])]
+
+    def fanout(workers):
+        def fetch():
+            with tempfile.TemporaryDirectory() as store:
+                reddit_client.STORE = PostStore(store)
+                reddit_client._POOL = ThreadPoolExecutor(workers)
+                return reddit_client.fetch_reddit_posts(QUERY, N, start)
+        return fetch
+
+    print(f"{len(NAMES)} mots-clés, fenêtre {WINDOW} h : {expected} posts attendus (n={N}), "
+          f"{LATENCY * 1000:.0f} ms/page")
+    run("brute", raw)
+    seq  = run("séquentiel", fanout(1))
+    pool = run("pool", fanout(len(NAMES)))
+    assert [p["id"] for p in seq] == [p["id"] for p in pool]
+    times = [p["created_utc"] for p in pool]
+    assert times == sorted(times, reverse=True) and len({p["id"] for p in pool}) == len(pool)
+
+
+if __name__ == "__main__":
+    main()
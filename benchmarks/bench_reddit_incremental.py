@@ -0,0 +1,78 @@
+"""
+Tableau de bord horaire sur Reddit : parcours complet vs arrêt anticipé + filigrane.
+
+Un faux subreddit remplace praw : search(sort='new') renvoie une chronologie
+de RATE posts/heure par pages de 100 et compte les pages servies. On rejoue
+HOURS rafraîchissements d'une fenêtre de WINDOW heures avec n=N, de nouveaux
+posts apparaissant entre deux passages :
+
+  - "complet"     : chaque passage parcourt le listing jusqu'à n posts puis
+                    filtre la fenêtre (ancien fetch_reddit_posts) ;
+  - "incrémental" : fetch_reddit_posts s'arrête sous `start` et, ensuite,
+                    sous le filigrane created_utc du store.
+
+    python benchmarks/bench_reddit_incremental.py
+"""
+import os, sys, time, tempfile
+from datetime import datetime, timezone
+from types import SimpleNamespace
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "reddit_service"))
+
+RATE, WINDOW, HOURS, N, PAGE, LATENCY = 10, 48, 24, 1000, 100, 0.02
+NOW = time.time()
+# chronologie du plus récent au plus ancien, sur 30 jours
+TIMELINE = [SimpleNamespace(id=f"p{i}", title=f"sonko {i}", url=f"https://reddit.com/p{i}",
+                            created_utc=NOW - i * 3600 / RATE)
+            for i in range(30 * 24 * RATE)]
+state = {"visible": NOW, "pages": 0}
+
+
+class FakeSubreddit:
+    def search(self, query, sort="new", limit=None, params=None):
+        after = (params or {}).get("after")
+        items = [s for s in TIMELINE if s.created_utc <= state["visible"]]
+        if after:
+            items = items[[s.id for s in items].index(after[3:]) + 1:]
+        for offset in range(0, len(items), PAGE):
+            state["pages"] += 1           # une requête HTTP par page chez praw
+            time.sleep(LATENCY)
+            yield from items[offset:offset + PAGE]
+
+
+def replay(fetch):
+    state["pages"] = 0
+    t0, sizes = time.perf_counter(), []
+    for k in range(HOURS + 1):
+        state["visible"] = NOW - (HOURS - k) * 3600
+        start = datetime.fromtimestamp(state["visible"] - WINDOW * 3600, timezone.utc)
+        sizes.append(len(fetch(start)))
+    return state["pages"], time.perf_counter() - t0, sizes
+
+
+def main():
+    with tempfile.TemporaryDirectory() as store:
+        os.environ.update(REDDIT_CLIENT_ID="fake", REDDIT_CLIENT_SECRET="fake",
+                          REDDIT_USER_AGENT="bench", REDDIT_STORE_DIR=store)
+        import reddit_client
+        reddit_client.make_reddit = lambda: SimpleNamespace(subreddit=lambda name: FakeSubreddit())
+
+        def full(start):
+            listing = FakeSubreddit().search("sonko", sort="new", limit=None)
+            posts, _ = reddit_client.walk_listing(listing, None, N)
+            return [p for p in posts if p["created_utc"] >= start.timestamp()]
+
+        def incremental(start):
+            return reddit_client.fetch_reddit_posts("sonko", N, start)
+
+        pages_full, t_full, sizes_full = replay(full)
+        pages_inc, t_inc, sizes_inc = replay(incremental)
+
+    assert sizes_full == sizes_inc, (sizes_full, sizes_inc)
+    print(f"{HOURS + 1} passages, fenêtre {WINDOW} h, {RATE} posts/h, n={N}, {LATENCY * 1000:.0f} ms/page")
+    print(f"complet     : {pages_full:4d} pages  {t_full:6.2f}s")
+    print(f"incrémental : {pages_inc:4d} pages  {t_inc:6.2f}s   (x{pages_full / pages_inc:.1f} moins de pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Téléchargement des flux RSS : séquentiel vs pool borné.
+
+Un serveur local sert N flux dont certains sont lents et d'autres
+répondent au-delà du délai ; on compare la durée totale et on vérifie
+que les flux en échec sont bien signalés.
+
+    python benchmarks/bench_rss_fetch.py [nb_flux]
+"""
+import os, sys, time
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rss_service"))
+
+from _stub import serve                      # noqa: E402
+from rss_scraper import fetch_feeds          # noqa: E402
+
+RSS = """<?xml version="1.0"?><rss version="2.0"><channel><title>Flux {n}</title>
+<item><title>Sonko à Dakar {n}</title><link>https://exemple.sn/{n}</link>
+<pubDate>Mon, 21 Jul 2025 10:00:00 GMT</pubDate></item></channel></rss>"""
+
+
+def handler(path, query, headers):
+    n = int(path.strip("/").split("/")[-1])
+    if n % 10 == 0:                # flux qui ne répond pas à temps
+        time.sleep(3)
+    elif n % 3 == 0:                 # flux lent
+        time.sleep(0.5)
+    else:
+        time.sleep(0.05)
+    return 200, {"Content-Type": "application/rss+xml"}, RSS.format(n=n)
+
+
+def main(count=40, timeout=1.0):
+    with serve(handler) as base:
+        urls = [f"{base}/feed/{i}" for i in range(count)]
+        for label, workers in (("séquentiel", 1), ("pool x8", 8), ("pool x16", 16)):
+            t0 = time.perf_counter()
+            feeds, errors = fetch_feeds(urls, max_workers=workers, timeout=timeout)
+            dt = time.perf_counter() - t0
+            print(f"{label:<11} {dt:6.2f}s  ok={len(feeds):3d}  échecs={len(errors):3d}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
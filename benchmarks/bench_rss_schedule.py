@@ -0,0 +1,94 @@
+"""
+Simulation : polling à intervalle fixe vs ordonnanceur adaptatif.
+
+On génère N flux dont le rythme de publication va de plusieurs articles
+par heure à un par mois, puis on rejoue une semaine. Fraîcheur = délai
+moyen entre la publication d'un article et le polling qui le découvre.
+La dernière ligne donne l'intervalle fixe qui atteint la même fraîcheur
+que l'ordonnanceur, et le nombre de requêtes qu'il coûte.
+
+    python benchmarks/bench_rss_schedule.py [nb_flux]
+"""
+import os, sys, random
+from bisect import bisect_left, bisect_right
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "rss_service"))
+
+from scheduler import FeedScheduler, WINDOW   # noqa: E402
+
+DAY     = 86400
+HISTORY = 3 * DAY      # articles déjà présents dans les flux au démarrage
+HORIZON = 7 * DAY
+TICK    = 60
+
+
+def make_feeds(n, rng):
+    feeds = []
+    for _ in range(n):
+        per_day = min(100.0, rng.lognormvariate(0.5, 1.8))   # ~ 0.03 à 100 / jour
+        t, pubs = -HISTORY, []
+        while True:
+            t += rng.expovariate(per_day / DAY)
+            if t > HORIZON:
+                break
+            pubs.append(t)
+        feeds.append(pubs)
+    return feeds
+
+
+def freshness(feeds, polls):
+    delays = []
+    for pubs, times in zip(feeds, polls):
+        for p in pubs:
+            if p < 0:
+                continue
+            i = bisect_left(times, p)
+            if i < len(times):
+                delays.append(times[i] - p)
+    delays.sort()
+    return sum(delays) / len(delays), delays[int(len(delays) * 0.9)]
+
+
+def fixed(feeds, interval, rng):
+    polls = []
+    for _ in feeds:
+        t0 = rng.uniform(0, interval)
+        polls.append([t0 + k * interval for k in range(int((HORIZON - t0) // interval) + 1)])
+    return polls
+
+
+def adaptive(feeds, rng, limit=64):
+    sched = FeedScheduler(min_interval=300, max_interval=6 * 3600, rng=rng)
+    sched.sync(range(len(feeds)), 0)
+    polls = [[] for _ in feeds]
+    now = 0
+    while now <= HORIZON:
+        for i in sched.due(now, limit):
+            pubs = feeds[i]
+            seen = pubs[max(0, bisect_right(pubs, now) - WINDOW):bisect_right(pubs, now)]
+            sched.record_success(i, seen, now)
+            polls[i].append(now)
+        now += TICK
+    return polls
+
+
+def report(label, feeds, polls):
+    reqs = sum(len(p) for p in polls) / (HORIZON / 3600)
+    mean, p90 = freshness(feeds, polls)
+    print(f"{label:<26} {reqs:10.0f} req/h   délai moyen {mean / 60:6.1f} min   p90 {p90 / 60:6.1f} min")
+    return mean
+
+
+def main(n=2000):
+    rng = random.Random(42)
+    feeds = make_feeds(n, rng)
+    print(f"{n} flux, {sum(1 for f in feeds for p in f if p >= 0)} articles sur 7 jours\n")
+    for minutes in (5, 15, 60):
+        report(f"fixe {minutes} min", feeds, fixed(feeds, minutes * 60, rng))
+    mean = report("adaptatif", feeds, adaptive(feeds, rng))
+    # polling fixe : délai moyen ≈ intervalle / 2
+    report(f"fixe, même fraîcheur ({2 * mean / 60:.0f} min)", feeds, fixed(feeds, 2 * mean, rng))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
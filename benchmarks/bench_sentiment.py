@@ -0,0 +1,77 @@
+"""
+Sentiment : un `includes` par mot et par texte (méthode de App.jsx, portée
+en Python, avec tous les termes du lexique) vs utils.sentiment.score_many
+(une seule passe multi-motifs sur le lot, négations comprises), à froid
+puis avec le cache par contenu (mêmes textes redemandés, comme un service
+qui resert ses articles), sur N textes synthétiques FR/EN.
+
+    python benchmarks/bench_sentiment.py [N]
+"""
+import os, sys, time, random
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from utils import sentiment                                   # noqa: E402
+from utils.sentiment import load_lexicon, LEXICON_FILES, NEG  # noqa: E402
+
+WORDS = ("le gouvernement a annoncé une réforme du budget pour la santé et l'école à dakar "
+         "the minister said the new plan will support farmers and fishermen in the region "
+         "sonko diomaye assemblée nationale élections jeunesse emploi port autonome").split()
+
+
+def texts(n, lexicon):
+    rng   = random.Random(0)
+    terms = [t.strip("*") for t in lexicon]
+    out = []
+    for _ in range(n):
+        words = [rng.choice(terms) if rng.random() < 0.05 else rng.choice(WORDS)
+                 for _ in range(rng.randint(8, 40))]
+        out.append(" ".join(words).capitalize())
+    return out
+
+
+def includes_loop(texts, lexicon):
+    """Un test de sous-chaîne par terme et par texte, sans négation."""
+    pos = [t.strip("*") for t, w in lexicon.items() if w != NEG and w > 0]
+    neg = [t.strip("*") for t, w in lexicon.items() if w != NEG and w < 0]
+    out = []
+    for text in texts:
+        text = text.lower()
+        out.append(sum(w in text for w in pos) - sum(w in text for w in neg))
+    return out
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main(n=100_000):
+    lexicon = load_lexicon(LEXICON_FILES)
+    batch   = texts(n, lexicon)
+    print(f"{n} textes, {len(lexicon)} termes, pyahocorasick={'oui' if sentiment.ahocorasick else 'non'}")
+
+    dt_loop, _ = timed(lambda: includes_loop(batch, lexicon))
+    print(f"includes par terme      {dt_loop:6.3f}s")
+    sentiment._cache.clear()
+    dt_cold, cold = timed(lambda: sentiment.score_many(batch))
+    print(f"score_many (froid)      {dt_cold:6.3f}s  x{dt_loop / dt_cold:4.1f}")
+    # le cache garde CACHE_SIZE textes : on redemande les derniers
+    recent = batch[-min(n, sentiment.CACHE_SIZE):]
+    dt_warm, warm = timed(lambda: sentiment.score_many(recent))
+    print(f"score_many (cache)      {dt_warm:6.3f}s  pour {len(recent)} textes déjà vus  "
+          f"{sentiment.stats}")
+    assert cold[-len(recent):] == warm
+
+    # en lot ou un par un : mêmes scores (un texte ne déborde pas sur le suivant)
+    sample = batch[:2000]
+    assert [sentiment.ANALYZER.score(t) for t in sample] == sentiment.ANALYZER.scores(sample)
+    counts = {lab: 0 for lab in ("positive", "negative", "neutral")}
+    for s in cold:
+        counts[sentiment.label(s)] += 1
+    print(f"labels {counts}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,104 @@
+"""
+Statistiques du rapport : boucle article par article (computeStats de
+App.jsx, portée en Python) vs utils.stats.compute_stats (colonnes NumPy),
+sur N articles normalisés synthétiques portant leur label "sentiment"
+comme ceux des services.
+
+Les deux doivent donner exactement les mêmes totalMentions / topSources /
+timeline (par jour) / sentiment. On mesure aussi les buckets semaine et
+heure, des articles sans label (scorés par utils.sentiment) et la taille
+de la charge utile envoyée à ai_service avant / après.
+
+    python benchmarks/bench_stats.py [N]
+"""
+import json, os, sys, time, random
+from datetime import datetime, timedelta, timezone
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from utils.stats import compute_stats                  # noqa: E402
+from utils.dates import to_utc                          # noqa: E402
+from utils.sentiment import annotate, ahocorasick       # noqa: E402
+
+SERVICES = ["twitter", "reddit", "rss", "youtube", "linkedin", "presse", None]
+WORDS = ("le gouvernement a annoncé une réforme du budget pour la santé et l'école à dakar "
+         "the minister said the new plan will support farmers and fishermen in the region "
+         "sonko diomaye assemblée nationale élections jeunesse emploi port autonome").split()
+# anciennes listes de App.jsx
+SENTIMENT_WORDS = ["good", "great", "excellent", "positive", "success", "gain", "happy", "benefit",
+                   "favorable", "bien", "bon", "hausse", "bad", "poor", "terrible", "negative",
+                   "loss", "fail", "down", "unfavorable", "mauvais", "baisse", "crise", "pas"]
+
+
+def articles(n):
+    rng, now = random.Random(0), datetime(2025, 7, 21, tzinfo=timezone.utc)
+    out = []
+    for i in range(n):
+        words = [rng.choice(SENTIMENT_WORDS) if rng.random() < 0.03 else rng.choice(WORDS)
+                 for _ in range(rng.randint(8, 40))]
+        svc = rng.choice(SERVICES)
+        dt  = now - timedelta(seconds=rng.randint(0, 90 * 86400))
+        out.append({"service": svc, "title": " ".join(words[:10]).capitalize(),
+                    "description": " ".join(words[10:]),
+                    "url": f"https://{rng.choice(['seneweb.com', 'www.dakaractu.com', 'lequotidien.sn'])}/{i}",
+                    # formats des services : isoformat UTC, "Z" (youtube), naïf avec µs (presse)
+                    "date": rng.choice([dt.isoformat()] * 7 + [dt.strftime("%Y-%m-%dT%H:%M:%SZ")] * 2
+                                       + [dt.replace(tzinfo=None, microsecond=rng.randint(0, 999999)).isoformat()])})
+    return out
+
+
+def compute_stats_loop(arts):
+    """computeStats d'App.jsx, ligne à ligne (avec le label de chaque article)."""
+    stats = {"totalMentions": len(arts), "topSources": [], "timeline": [],
+             "sentiment": {"positive": 0, "negative": 0, "neutral": 0}}
+    by_source, by_date = {}, {}
+    for a in arts:
+        src = a.get("service") or (a.get("url") and a["url"].split("/")[2]) or "Inconnu"
+        by_source[src] = by_source.get(src, 0) + 1
+        day = to_utc(a.get("date")).date().isoformat()
+        by_date[day] = by_date.get(day, 0) + 1
+        stats["sentiment"][a["sentiment"]] += 1
+    stats["topSources"] = [{"name": k, "count": v}
+                           for k, v in sorted(by_source.items(), key=lambda kv: -kv[1])[:5]]
+    stats["timeline"] = [{"date": k, "count": v} for k, v in sorted(by_date.items())]
+    return stats
+
+
+def timed(fn, repeat=3):
+    """Meilleur temps sur `repeat` essais (la machine est bruyante)."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, out
+
+
+def main(n=100_000):
+    bare = articles(n)
+    arts = list(annotate(dict(a) for a in bare))
+    print(f"{n} articles, pyahocorasick={'oui' if ahocorasick else 'non'}")
+    dt_loop, ref = timed(lambda: compute_stats_loop(arts))
+    print(f"boucle (computeStats)   {dt_loop:6.3f}s")
+    for bucket in ("day", "week", "hour"):
+        dt, out = timed(lambda: compute_stats(arts, bucket))
+        print(f"compute_stats {bucket:5s}     {dt:6.3f}s  x{dt_loop / dt:4.1f}  "
+              f"{len(out['timeline'])} points  {out['sentiment']}")
+        if bucket == "day":
+            out.pop("bucket")
+            assert out == ref, "résultats différents de computeStats"
+    # sans label : scorés en lot par utils.sentiment, hors de son cache
+    from utils import sentiment
+    seen = dict(sentiment.stats)
+    dt, out = timed(lambda: compute_stats(bare))
+    assert sentiment.stats == seen, "compute_stats ne doit pas remplir le cache"
+    assert out["sentiment"] == ref["sentiment"]
+    print(f"compute_stats sans label {dt:6.3f}s  (sentiment calculé, mêmes comptes)")
+    before = len(json.dumps({"articles": arts, "stats": ref}, ensure_ascii=False))
+    after  = len(json.dumps({"articles": arts[:20], "stats": ref}, ensure_ascii=False))
+    print(f"mêmes stats que computeStats ; charge vers ai_service {before / 1e6:.1f} Mo -> {after / 1e3:.1f} Ko")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,110 @@
+"""
+Tableau de bord horaire sur Twitter : fetch complet vs delta since_id.
+
+Une fausse API search/recent sert une chronologie de RATE tweets/heure
+(start_time / end_time / since_id / next_token pris en charge). On rejoue
+HOURS rafraîchissements d'une fenêtre de WINDOW heures, de nouveaux tweets
+apparaissant entre deux passages :
+
+  - "complet"     : chaque passage repagine depuis le plus récent jusqu'à
+                    n tweets (ancien fetch_tweets) ;
+  - "incrémental" : fetch_tweets avec le store local, seul le delta au-dessus
+                    du filigrane since_id est demandé.
+
+Même résultat attendu ; on compare le nombre d'appels API et le temps,
+avec n plus grand que le volume de la fenêtre puis n plus petit (seuls les
+n plus récents comptent : l'ancienne partie de la fenêtre n'est pas
+parcourue).
+
+    python benchmarks/bench_twitter_incremental.py
+"""
+import os, sys, time, tempfile, threading
+from datetime import datetime, timedelta, timezone
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "twitter_service"))
+
+from _stub import serve                      # noqa: E402
+
+RATE, WINDOW, HOURS, LATENCY = 40, 48, 24, 0.02
+NOW = datetime.now(timezone.utc)
+# chronologie : ids croissants avec le temps, fenêtre + HOURS heures à révéler
+TIMELINE = [(1_000_000 + i, NOW - timedelta(hours=WINDOW + HOURS) + timedelta(hours=i / RATE))
+            for i in range((WINDOW + HOURS) * RATE)]
+state = {"visible": NOW, "calls": 0}
+lock = threading.Lock()
+
+
+def _dt(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def fake_api(path, query, headers):
+    time.sleep(LATENCY)
+    with lock:
+        state["calls"] += 1
+    lo = _dt(query["start_time"]) if "start_time" in query else NOW - timedelta(days=7)
+    hi = min(_dt(query["end_time"]) if "end_time" in query else NOW, state["visible"])
+    since = int(query.get("since_id", 0))
+    hits = [(i, dt) for i, dt in reversed(TIMELINE) if lo <= dt < hi and i > since]
+    offset, size = int(query.get("next_token", 0)), int(query.get("max_results", 10))
+    page = hits[offset:offset + size]
+    data = ",".join(f'{{"id": "{i}", "text": "sonko {i}", "edit_history_tweet_ids": ["{i}"], '
+                    f'"created_at": "{dt.strftime("%Y-%m-%dT%H:%M:%S.000Z")}"}}' for i, dt in page)
+    meta = f'"result_count": {len(page)}'
+    if page and offset == 0:
+        meta += f', "newest_id": "{page[0][0]}"'
+    if offset + size < len(hits):
+        meta += f', "next_token": "{offset + size}"'
+    return 200, {"Content-Type": "application/json"}, f'{{"data": [{data}], "meta": {{{meta}}}}}'
+
+
+def replay(fetch):
+    state["calls"] = 0
+    t0, sizes, calls = time.perf_counter(), [], []
+    for k in range(HOURS + 1):
+        # la fausse API ne montre que les tweets publiés avant « maintenant » simulé
+        state["visible"] = NOW - timedelta(hours=HOURS - k)
+        before = state["calls"]
+        sizes.append(len(fetch()))
+        calls.append(state["calls"] - before)
+    return calls, time.perf_counter() - t0, sizes
+
+
+def scenario(twitter_client, n, store):
+    twitter_client.STORE.directory = store
+    start = NOW - timedelta(hours=WINDOW)
+
+    def full():
+        with twitter_client.LIMITER.lease() as lease:
+            tweets = twitter_client._paginate(lease, "sonko", n)[0]
+        return [t for t in tweets if t["created_at"] >= start.isoformat()]
+
+    def incremental():
+        return twitter_client.fetch_tweets("sonko", n, start)[0]
+
+    calls_full, t_full, sizes_full = replay(full)
+    calls_inc, t_inc, sizes_inc = replay(incremental)
+    assert sizes_full == sizes_inc, (sizes_full, sizes_inc)
+    assert all(i <= f for i, f in zip(calls_inc, calls_full)), (calls_full, calls_inc)
+    print(f"n = {n} ({'toute la fenêtre' if n > WINDOW * RATE else 'moins que la fenêtre'})")
+    print(f"  complet     : {sum(calls_full):4d} appels API  {t_full:6.2f}s   "
+          f"(premier passage {calls_full[0]}, puis {calls_full[1]} par passage)")
+    print(f"  incrémental : {sum(calls_inc):4d} appels API  {t_inc:6.2f}s   "
+          f"(premier passage {calls_inc[0]}, puis {calls_inc[1]} par passage, "
+          f"x{sum(calls_full) / sum(calls_inc):.1f} moins d'appels)")
+
+
+def main():
+    with serve(fake_api) as base, tempfile.TemporaryDirectory() as store:
+        os.environ.update(TWITTER_API_BASE=base, BEARER_TOKEN="fake",
+                          TWITTER_STORE_DIR=store, TWITTER_REFRESH="0")
+        import twitter_client
+        twitter_client.LIMITER.limit = twitter_client.LIMITER.remaining = 10 ** 6
+        print(f"{HOURS + 1} passages, fenêtre {WINDOW} h, {RATE} tweets/h, {LATENCY * 1000:.0f} ms/appel")
+        # n couvre toute la fenêtre, puis n plus petit que son volume (les n plus récents)
+        for k, n in enumerate((WINDOW * RATE + 100, 200)):
+            scenario(twitter_client, n, os.path.join(store, str(k)))
+
+
+if __name__ == "__main__":
+    main()
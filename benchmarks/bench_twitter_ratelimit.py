@@ -0,0 +1,66 @@
+"""
+Client Twitter contre une fausse API locale qui applique un quota.
+
+La fausse API /2/tweets/search/recent accepte LIMIT requêtes par fenêtre,
+renvoie les en-têtes x-rate-limit-* et répond 429 au-delà. Plusieurs
+requêtes /articles concurrentes paginent en même temps : on vérifie
+qu'aucune ne bloque, que le quota est partagé (chacune obtient au moins
+une page), qu'aucun 429 n'est provoqué et que retry_after est renseigné.
+L'ancien search_tweets aurait dormi 15 minutes au premier 429.
+
+    python benchmarks/bench_twitter_ratelimit.py
+"""
+import os, sys, time, threading
+from concurrent.futures import ThreadPoolExecutor
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "twitter_service"))
+
+from _stub import serve                      # noqa: E402
+
+LIMIT, WINDOW, LATENCY = 6, 60, 0.05
+state = {"calls": 0, "throttled": 0, "reset": time.time() + WINDOW}
+lock = threading.Lock()
+
+
+def fake_api(path, query, headers):
+    time.sleep(LATENCY)
+    with lock:
+        now = time.time()
+        if now >= state["reset"]:
+            state.update(calls=0, reset=now + WINDOW)
+        state["calls"] += 1
+        remaining = LIMIT - state["calls"]
+        rl = {"x-rate-limit-limit": str(LIMIT), "x-rate-limit-remaining": str(max(0, remaining)),
+              "x-rate-limit-reset": str(int(state["reset"])), "Content-Type": "application/json"}
+        if remaining < 0:
+            state["throttled"] += 1
+            return 429, rl, '{"title": "Too Many Requests"}'
+    page = int(query.get("next_token", 0))
+    size = int(query.get("max_results", 10))
+    data = ",".join(
+        f'{{"id": "{page * 100 + i}", "text": "tweet {page}-{i} sonko", "created_at": "2025-07-21T10:00:00.000Z"}}'
+        for i in range(size))
+    return 200, rl, f'{{"data": [{data}], "meta": {{"result_count": {size}, "next_token": "{page + 1}"}}}}'
+
+
+def main(clients=3, n=500):
+    with serve(fake_api) as base:
+        os.environ.update(TWITTER_API_BASE=base, BEARER_TOKEN="fake")
+        import twitter_client
+        twitter_client.LIMITER.limit = twitter_client.LIMITER.remaining = LIMIT
+
+        def one(i):
+            t0 = time.perf_counter()
+            tweets, retry_after = twitter_client.fetch_tweets(f"sonko {i}", n)
+            return time.perf_counter() - t0, len(tweets), retry_after
+
+        with ThreadPoolExecutor(clients) as pool:
+            results = list(pool.map(one, range(clients)))
+
+    for i, (dt, count, retry_after) in enumerate(results):
+        print(f"requête {i} : {count:4d} tweets en {dt:5.2f}s   retry_after={retry_after}s")
+    print(f"appels API : {state['calls']} (quota {LIMIT})   429 reçus : {state['throttled']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+/collect YouTube : un channels.list par vidéo vs un appel groupé + cache.
+
+Une fausse API locale (search.list et channels.list, LATENCY s par appel)
+remplace googleapis.com via client_options api_endpoint. Chaque vidéo
+vient d'une chaîne différente (pire cas pour l'ancien code) :
+
+  - "ancien" : build() à chaque appel puis channels.list par vidéo ;
+  - "froid"  : search_youtube, un channels.list groupé (≤ 50 ids) ;
+  - "chaud"  : search_youtube, chaînes déjà dans le cache longue durée.
+
+    python benchmarks/bench_youtube_channels.py
+"""
+import os, sys, json, time, tempfile, threading
+from urllib.parse import unquote
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "youtube_service"))
+
+from _stub import serve                      # noqa: E402
+
+LATENCY = 0.03
+state = {"calls": 0}
+lock = threading.Lock()
+
+
+def fake_api(path, query, headers):
+    time.sleep(LATENCY)
+    with lock:
+        state["calls"] += 1
+    if path.endswith("/search"):
+        n = int(query.get("maxResults", 5))
+        items = [{"id": {"videoId": f"v{i}"},
+                  "snippet": {"title": f"sonko {i}", "channelId": f"UC{i}", "channelTitle": f"Chaîne {i}",
+                              "publishedAt": "2025-07-21T10:00:00Z"}} for i in range(n)]
+    else:
+        items = [{"id": cid, "snippet": {"title": f"Chaîne {cid}", "customUrl": f"@{cid}",
+                                         "thumbnails": {"default": {"url": f"https://yt3/{cid}.jpg"}}}}
+                 for cid in unquote(query["id"]).split(",")]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"items": items})
+
+
+def legacy_search(base, query, max_results):
+    """search_youtube d'avant : build() à chaque appel, channels.list par vidéo."""
+    from googleapiclient.discovery import build
+    youtube = build("youtube", "v3", developerKey="fake", client_options={"api_endpoint": base},
+                    cache_discovery=False)
+    resp = youtube.search().list(q=query, part="snippet", type="video", maxResults=max_results).execute()
+    results = []
+    for item in resp["items"]:
+        ch_resp = youtube.channels().list(part="snippet", id=item["snippet"]["channelId"]).execute()
+        results.append(ch_resp["items"][0]["snippet"]["title"])
+    return results
+
+
+def timed(fn):
+    state["calls"] = 0
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, state["calls"], out
+
+
+def main():
+    with serve(fake_api) as base, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(YOUTUBE_API_URL=base + "/youtube/v3", YOUTUBE_API_KEY="fake",
+                          YOUTUBE_CHANNEL_CACHE_PATH=os.path.join(tmp, "channels.json"),
+                          YOUTUBE_QUOTA_PATH=os.path.join(tmp, "quota.json"))
+        import youtube_client as yc
+        print(f"{LATENCY * 1000:.0f} ms par appel API")
+        for n in (5, 20, 50):
+            yc.CHANNELS._channels.clear()
+            t_old, c_old, old = timed(lambda: legacy_search(base, "sonko", n))
+            t_cold, c_cold, cold = timed(lambda: yc.search_youtube("sonko", n))
+            t_warm, c_warm, warm = timed(lambda: yc.search_youtube("sonko", n))
+            assert old == [r["source"] for r in cold] == [r["source"] for r in warm]
+            print(f"n={n:2d}  ancien {c_old:2d} appels {t_old * 1000:6.0f} ms   "
+                  f"froid {c_cold} appels {t_cold * 1000:5.0f} ms   "
+                  f"chaud {c_warm} appel {t_warm * 1000:5.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+YouTube /articles : unités de quota avec et sans fenêtre, cache de pages et comptable.
+
+Une fausse API search.list (servie en local) publie RATE vidéos/jour sur
+deux ans, prend en charge publishedAfter/publishedBefore/pageToken et
+renvoie 403 quotaExceeded au-delà de KEY_QUOTA unités, comme la vraie clé.
+On rejoue REQUESTS appels /articles (n=1000, fenêtre de WINDOW jours) :
+
+  - "ancien"   : sans fenêtre ni cache (ancien fetch_videos) ;
+  - "fenêtre"  : publishedAfter/Before seulement ;
+  - "cache"    : fenêtre + cache de pages (requêtes répétées dans le TTL) ;
+  - "comptable": requêtes distinctes sur une clé presque vide ; le comptable
+                 réduit puis refuse avant le 403 (réserve de 500 unités gardée).
+
+    python benchmarks/bench_youtube_quota.py
+"""
+import os, sys, json, tempfile, threading
+from datetime import datetime, timedelta, timezone
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT, "youtube_service"))
+
+from _stub import serve                      # noqa: E402
+
+RATE, WINDOW, REQUESTS, N, KEY_QUOTA = 40, 7, 6, 1000, 10000
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+VIDEOS = [(f"v{i}", NOW - timedelta(days=i / RATE)) for i in range(2 * 365 * RATE)]
+state = {"units": 0, "forbidden": 0}
+lock = threading.Lock()
+
+
+def _dt(value):
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def fake_api(path, query, headers):
+    with lock:
+        if state["units"] + 100 > KEY_QUOTA:
+            state["forbidden"] += 1
+            body = {"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}}
+            return 403, {"Content-Type": "application/json"}, json.dumps(body)
+        state["units"] += 100
+    lo = _dt(query["publishedAfter"]) if "publishedAfter" in query else None
+    hi = _dt(query["publishedBefore"]) if "publishedBefore" in query else None
+    hits = [v for v in VIDEOS if (lo is None or v[1] >= lo) and (hi is None or v[1] < hi)][:500]
+    offset, size = int(query.get("pageToken", 0)), int(query.get("maxResults", 5))
+    page = hits[offset:offset + size]
+    body = {"items": [{"id": {"videoId": vid},
+                       "snippet": {"title": f"sonko {vid}", "publishedAt": dt.strftime("%Y-%m-%dT%H:%M:%SZ")}}
+                      for vid, dt in page]}
+    if offset + size < len(hits):
+        body["nextPageToken"] = str(offset + size)
+    return 200, {"Content-Type": "application/json"}, json.dumps(body)
+
+
+def run(label, yc, window, key_units=0, distinct=False):
+    state.update(units=key_units, forbidden=0)
+    yc.PAGES.counters.update(hits=0, misses=0)
+    yc.QUOTA.spent = key_units
+    videos, hits, downgraded, refused = 0, 0, 0, 0
+    for i in range(REQUESTS):
+        got, report = yc.fetch_videos(f"sonko {i}" if distinct else "sonko", N, *window)
+        videos    += len(got)
+        hits      += report["cache_hits"]
+        downgraded += report["downgraded"]
+        refused   += report["refused"]
+    print(f"{label:10s}: {state['units'] - key_units:6d} unités  {videos:5d} vidéos  "
+          f"{hits:3d} pages en cache  {downgraded} réduites  {refused} refusées  "
+          f"{state['forbidden']} × 403")
+
+
+def main():
+    with serve(fake_api) as base, tempfile.TemporaryDirectory() as tmp:
+        os.environ.update(YOUTUBE_API_URL=base + "/youtube/v3", YOUTUBE_API_KEY="fake",
+                          YOUTUBE_PAGE_CACHE_DIR=os.path.join(tmp, "pages"),
+                          YOUTUBE_QUOTA_PATH=os.path.join(tmp, "quota.json"))
+        import youtube_client as yc
+        window = (NOW - timedelta(days=WINDOW), NOW + timedelta(days=1))
+        print(f"{REQUESTS} requêtes n={N}, fenêtre {WINDOW} j ({RATE * WINDOW} vidéos), "
+              f"quota {KEY_QUOTA} unités/jour")
+
+        ttl, yc.PAGES.ttl = yc.PAGES.ttl, 0
+        run("ancien", yc, (None, None))
+        run("fenêtre", yc, window)
+        yc.PAGES.ttl = ttl
+        run("cache", yc, window)
+        # requêtes toutes différentes (pas de cache) sur une clé presque vide
+        run("comptable", yc, window, key_units=KEY_QUOTA - 2000, distinct=True)
+
+
+if __name__ == "__main__":
+    main()
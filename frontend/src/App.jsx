@@ -58,68 +58,31 @@ export default function App() {
     return p.toString();
   };
 
-  const POSITIVE = [
-    "good", "great", "excellent", "positive", "success", "gain",
-    "happy", "benefit", "favorable", "bien", "bon", "hausse"
-  ];
-  const NEGATIVE = [
-    "bad", "poor", "terrible", "negative", "loss", "fail",
-    "down", "unfavorable", "mauvais", "baisse", "crise"
-  ];
-
-  const computeStats = (arts) => {
-    const stats = {
-      totalMentions: arts.length,
-      topSources: [],
-      timeline: [],
-      sentiment: { positive: 0, negative: 0, neutral: 0 }
-    };
-
-    const bySource = {};
-    const byDate = {};
-
-    arts.forEach((a) => {
-      const text = `${a.title || ""} ${a.description || ""}`.toLowerCase();
-      const src = (() => {
-        if (a.service) return a.service;
-        if (a.url) {
-          try { return new URL(a.url).host; } catch { /* ignore */ }
-        }
-        return "Inconnu";
-      })();
-      bySource[src] = (bySource[src] || 0) + 1;
-
-      const day = new Date(a.date).toISOString().slice(0, 10);
-      byDate[day] = (byDate[day] || 0) + 1;
-
-      let score = 0;
-      POSITIVE.forEach((w) => text.includes(w) && score++);
-      NEGATIVE.forEach((w) => text.includes(w) && score--);
-      if (score > 0) stats.sentiment.positive++;
-      else if (score < 0) stats.sentiment.negative++;
-      else stats.sentiment.neutral++;
+  /* Statistiques calculées côté serveur (gateway_service /stats, utils/stats.py) :
+     seules les colonnes utiles sont envoyées */
+  const fetchStats = async (arts) => {
+    const res = await fetch("/api/gateway/stats", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        articles: arts.map(({ service, url, date, title, description, sentiment }) =>
+          ({ service, url, date, title, description, sentiment })),
+      }),
     });
-
-    stats.topSources = Object.entries(bySource)
-      .map(([name, count]) => ({ name, count }))
-      .sort((a, b) => b.count - a.count)
-      .slice(0, 5);
-
-    stats.timeline = Object.entries(byDate)
-      .map(([date, count]) => ({ date, count }))
-      .sort((a, b) => a.date.localeCompare(b.date));
-
-    return stats;
+    if (!res.ok) throw new Error("Erreur statistiques");
+    return (await res.json()).stats;
   };
 
-  const generateReport = async (arts) => {
-    const stats = computeStats(arts);
+  const generateReport = async (arts, precomputed) => {
     setReportLoading(true);
+    let stats = precomputed;
     try {
+      stats = stats || await fetchStats(arts);
+      // le rapport n'a besoin que des stats compactes et d'un échantillon d'articles
       const res = await fetch("/api/ai/report", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ articles: arts, stats })
+        body: JSON.stringify({ articles: arts.slice(0, 20), stats })
       });
       if (!res.body) return;
       const reader = res.body.getReader();
@@ -166,18 +129,52 @@ export default function App() {
       return arr.map((item) => ({ ...item, service: svc.label }));
     };
 
+    /* "all" : passerelle (gateway_service), résultats diffusés en NDJSON
+       au fil des réponses des services, déjà dédoublonnés par URL */
+    const fetchAll = async () => {
+      const labels = Object.fromEntries(SERVICES.map((s) => [s.value, s.label]));
+      const p = new URLSearchParams(buildParams("all"));
+      p.append("services", SERVICES.filter((s) => s.endpoint).map((s) => s.value).join(","));
+      p.append("stats", "1");   // stats de l'ensemble fusionné dans l'évènement "done"
+      const res = await fetch(`/api/gateway/articles?${p.toString()}`);
+      if (!res.ok || !res.body) throw new Error("Erreur passerelle");
+
+      const reader  = res.body.getReader();
+      const decoder = new TextDecoder("utf-8");
+      let buffer = "";
+      let collected = [];
+      let stats = null;
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split("\n");
+        buffer = lines.pop();
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const ev = JSON.parse(line);
+          if (ev.event === "done") stats = ev.stats;
+          if (ev.event !== "articles" || !ev.articles.length) continue;
+          collected = collected.concat(
+            ev.articles.map((item) => ({ ...item, service: labels[ev.service] || ev.service }))
+          );
+          setArticles(collected);
+          setLoading(false);          // premiers résultats affichés sans attendre les autres
+        }
+      }
+      return { collected, stats };
+    };
+
     try {
       let collected = [];
+      let stats = null;
       if (service === "all") {
-        const results = await Promise.allSettled(
-          SERVICES.filter((s) => s.endpoint).map(fetchOne)
-        );
-        results.forEach((r) => r.status === "fulfilled" && (collected = collected.concat(r.value)));
+        ({ collected, stats } = await fetchAll());
       } else {
         const svc = SERVICES.find((s) => s.value === service);
         collected = await fetchOne(svc);
       }
-      generateReport(collected);
+      generateReport(collected, stats);
       setArticles(collected);
     } catch (e) {
       setError(e.message);
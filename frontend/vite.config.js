@@ -14,7 +14,8 @@ export default defineConfig({
       '/api/twitter':  { target: 'http://localhost:5001', changeOrigin: true, rewrite: p => p.replace(/^\/api\/twitter/,  '') },
       '/api/youtube':  { target: 'http://localhost:5004', changeOrigin: true, rewrite: p => p.replace(/^\/api\/youtube/,  '') },
       '/api/linkedin': { target: 'http://localhost:5006', changeOrigin: true, rewrite: p => p.replace(/^\/api\/linkedin/, '') },
-      '/api/ai':       { target: 'http://localhost:5007', changeOrigin: true, rewrite: p => p.replace(/^\/api\/ai/, '') }
+      '/api/ai':       { target: 'http://localhost:5007', changeOrigin: true, rewrite: p => p.replace(/^\/api\/ai/, '') },
+      '/api/gateway':  { target: 'http://localhost:5008', changeOrigin: true, rewrite: p => p.replace(/^\/api\/gateway/, '') }
     }
   },
   plugins: [react()],
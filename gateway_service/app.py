@@ -0,0 +1,114 @@
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask_cors import CORS
+import json, os, sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.stats import compute_stats
+from config import (SERVICE_URLS, SERVICE_LABELS, DEFAULT_SERVICES, SERVICE_PARAMS,
+                    GATEWAY_TIMEOUT, GATEWAY_WORKERS)
+from fanout import fan_out
+
+app = Flask(__name__)
+CORS(app)
+
+FORWARD = ("q", "exclude", "lang", "country", "start", "end")
+POOL    = ThreadPoolExecutor(max_workers=GATEWAY_WORKERS, thread_name_prefix="gateway")
+
+def _events():
+    """(évènements de fan_out, None) ou (None, réponse d'erreur)."""
+    names = [s for s in (request.args.get("services") or "").split(",") if s] or DEFAULT_SERVICES
+    unknown = [s for s in names if s not in SERVICE_URLS]
+    if unknown:
+        return None, (jsonify({"error": f"Unknown service(s): {', '.join(unknown)}"}), 400)
+
+    services = {s: SERVICE_URLS[s].rstrip("/") + "/articles" for s in names}
+    params   = {k: request.args[k] for k in FORWARD if request.args.get(k)}
+    if request.args.get("n"):
+        extra = {s: {"n": request.args["n"]} for s in names}
+    else:
+        extra = SERVICE_PARAMS
+    return fan_out(services, params, GATEWAY_TIMEOUT, POOL, extra), None
+
+def _with_stats(events, bucket):
+    """Ajoute "stats" (utils.stats) à l'évènement "done", calculées sur tous les articles fusionnés."""
+    merged = []
+    for ev in events:
+        if ev["event"] == "articles":
+            merged += ev["articles"]
+        elif ev["event"] == "done":
+            ev = {**ev, "stats": compute_stats(merged, bucket, names=SERVICE_LABELS)}
+        yield ev
+
+@app.route("/articles", methods=["GET"])
+def articles():
+    """
+    Interroge tous les services en parallèle et renvoie les articles au fil de l'eau
+    /articles?q=&exclude=&lang=&country=&start=&end=&services=twitter,rss&format=ndjson|sse|json
+      ndjson (défaut) : un évènement JSON par ligne dès qu'un service répond (voir fanout.py)
+      sse             : mêmes évènements en text/event-stream
+      json            : tout d'un bloc, {"articles", "services", "total", "duplicates", "elapsed"}
+    &stats=1[&bucket=day|week|hour] : statistiques compactes dans l'évènement "done"
+    """
+    events, error = _events()
+    if error:
+        return error
+    if request.args.get("stats") == "1":
+        events = _with_stats(events, request.args.get("bucket", "day"))
+
+    fmt = request.args.get("format") or (
+        "sse" if "text/event-stream" in request.headers.get("Accept", "") else "ndjson")
+    if fmt == "json":
+        out = []
+        for ev in events:
+            if ev["event"] == "articles":
+                out += ev["articles"]
+            elif ev["event"] == "done":
+                return jsonify({"articles": out, **{k: v for k, v in ev.items() if k != "event"}})
+
+    if fmt == "sse":
+        body, mimetype = (f"event: {ev['event']}\ndata: {json.dumps(ev, ensure_ascii=False)}\n\n"
+                          for ev in events), "text/event-stream"
+    else:
+        body, mimetype = (json.dumps(ev, ensure_ascii=False) + "\n" for ev in events), "application/x-ndjson"
+    return Response(stream_with_context(body), mimetype=mimetype,
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route("/stats", methods=["GET", "POST"])
+def stats():
+    """
+    Statistiques compactes (totalMentions, topSources, timeline, sentiment), voir utils.stats ;
+    topSources porte les noms du frontend ("RSS", "Presse"...), pas les ids des services
+      GET  /stats?<mêmes paramètres que /articles>&bucket=day|week|hour : interroge les services
+      POST /stats {"articles": [...], "bucket": "day"}                  : articles fournis
+    &sample=N ajoute les N premiers articles (contexte du rapport IA).
+    """
+    sample = int(request.args.get("sample", 0))
+    if request.method == "POST":
+        data     = request.get_json(silent=True) or {}
+        articles = data.get("articles") or []
+        bucket   = data.get("bucket") or request.args.get("bucket", "day")
+        services = None
+    else:
+        events, error = _events()
+        if error:
+            return error
+        articles, services, bucket = [], None, request.args.get("bucket", "day")
+        for ev in events:
+            if ev["event"] == "articles":
+                articles += ev["articles"]
+            elif ev["event"] == "done":
+                services = ev["services"]
+
+    out = {"stats": compute_stats(articles, bucket, names=SERVICE_LABELS)}
+    if services is not None:
+        out["services"] = services
+    if sample:
+        out["sample"] = articles[:sample]
+    return jsonify(out)
+
+@app.route("/services", methods=["GET"])
+def services():
+    return jsonify({"services": SERVICE_URLS, "default": DEFAULT_SERVICES})
+
+if __name__ == "__main__":
+    app.run(port=5008, debug=True)
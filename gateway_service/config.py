@@ -0,0 +1,30 @@
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Micro-services interrogés par la passerelle (URL de base, /articles ajouté)
+SERVICE_URLS = {
+    "twitter":  os.getenv("GATEWAY_TWITTER_URL",  "http://localhost:5001"),
+    "rss":      os.getenv("GATEWAY_RSS_URL",      "http://localhost:5002"),
+    "reddit":   os.getenv("GATEWAY_REDDIT_URL",   "http://localhost:5003"),
+    "youtube":  os.getenv("GATEWAY_YOUTUBE_URL",  "http://localhost:5004"),
+    "presse":   os.getenv("GATEWAY_PRESSE_URL",   "http://localhost:5005"),
+    "linkedin": os.getenv("GATEWAY_LINKEDIN_URL", "http://localhost:5006"),
+}
+# noms affichés par le frontend (SERVICES de App.jsx), repris dans topSources
+SERVICE_LABELS = {"twitter": "Twitter", "rss": "RSS", "reddit": "Reddit",
+                  "youtube": "YouTube", "presse": "Presse", "linkedin": "LinkedIn"}
+# services interrogés quand la requête n'en précise pas (services=a,b)
+DEFAULT_SERVICES = [s for s in os.getenv("GATEWAY_SERVICES", ",".join(SERVICE_URLS)).split(",") if s]
+
+# paramètres ajoutés par service (ce que le frontend envoyait)
+SERVICE_PARAMS = {
+    "twitter":  {"n": "1000"},
+    "reddit":   {"n": "1000"},
+    "youtube":  {"n": "1000"},
+    "linkedin": {"n": "1000"},
+}
+
+# délai maximal (secondes) de la requête entière ; taille du pool de requêtes sortantes
+GATEWAY_TIMEOUT = float(os.getenv("GATEWAY_TIMEOUT", 90))
+GATEWAY_WORKERS = int(os.getenv("GATEWAY_WORKERS", 32))
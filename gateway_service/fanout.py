@@ -0,0 +1,129 @@
+"""
+Interrogation parallèle des micro-services et fusion des résultats.
+
+`fan_out(services, params, timeout, pool)` lance un GET /articles par service
+dans le pool et génère un évènement dès qu'un service répond :
+
+    {"event": "articles", "service", "articles", "meta", "count", "duplicates", "elapsed"}
+    {"event": "error",    "service", "error", "elapsed"}
+    {"event": "done",     "total", "duplicates", "elapsed", "services": {nom: résumé}}
+
+"articles" ne contient que les articles dont l'URL n'a pas déjà été envoyée
+par un autre service (voir canonical_url) ; "meta" reprend le reste de
+l'enveloppe du service (partial, retry_after, quota, sites...). Au bout de
+`timeout` secondes les services qui n'ont pas répondu sont signalés en erreur.
+"""
+import threading
+import time
+from concurrent.futures import TimeoutError, as_completed
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+_local = threading.local()
+
+# paramètres de suivi retirés avant de comparer deux URL
+_TRACKING = {"fbclid", "gclid", "igshid", "ref_src", "mc_cid", "mc_eid"}
+
+
+def _session():
+    # une session (keep-alive) par thread du pool
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        sess = _local.session = requests.Session()
+    return sess
+
+
+def canonical_url(url):
+    """
+    Clé de dédoublonnage : sans schéma, www., fragment, / final ni paramètres
+    de suivi. Une URL mal formée (port non numérique, IPv6 tronquée) est sa
+    propre clé : un lien cassé ne doit pas interrompre le flux.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port  = parts.port
+    except ValueError:
+        return url.strip()
+    host  = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port:
+        host = f"{host}:{port}"
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                             if not k.lower().startswith("utm_") and k.lower() not in _TRACKING))
+    path  = parts.path.rstrip("/")
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def article_url(a):
+    url = a.get("url") or a.get("link") or (a.get("métadonnées") or {}).get("url")
+    if not url and str(a.get("id", "")).startswith("http"):
+        url = a["id"]
+    return url or None
+
+
+def fetch_service(url, params, timeout):
+    """(articles, meta) d'un service ; accepte une liste ou une enveloppe {"articles": ...}."""
+    resp = _session().get(url, params=params, timeout=timeout)
+    try:
+        data = resp.json()
+    except ValueError:
+        data = None
+    if not resp.ok:
+        error = data.get("error") if isinstance(data, dict) else None
+        raise RuntimeError(error or f"HTTP {resp.status_code}")
+    if isinstance(data, list):
+        return data, {}
+    if not isinstance(data, dict):
+        raise RuntimeError("réponse non JSON")
+    return data.get("articles") or [], {k: v for k, v in data.items() if k != "articles"}
+
+
+def fan_out(services, params, timeout, pool, extra=None):
+    """Évènements au fil des réponses ; `services` = {nom: url /articles}."""
+    t0      = time.monotonic()
+    extra   = extra or {}
+    futures = {pool.submit(fetch_service, url, {**params, **extra.get(name, {})}, timeout): name
+               for name, url in services.items()}
+    seen, summary = set(), {}
+    total = duplicates = 0
+
+    def elapsed():
+        return round(time.monotonic() - t0, 3)
+
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            name = futures[future]
+            try:
+                items, meta = future.result()
+            except Exception as e:
+                summary[name] = {"count": 0, "elapsed": elapsed(), "error": f"{type(e).__name__}: {e}"}
+                yield {"event": "error", "service": name, "error": summary[name]["error"],
+                       "elapsed": summary[name]["elapsed"]}
+                continue
+
+            kept, dups = [], 0
+            for a in items:
+                url = article_url(a)
+                key = canonical_url(url) if url else None
+                if key is not None and key in seen:
+                    dups += 1
+                    continue
+                if key is not None:
+                    seen.add(key)
+                kept.append({**a, "service": a.get("service") or name})
+            total      += len(kept)
+            duplicates += dups
+            summary[name] = {"count": len(kept), "duplicates": dups, "elapsed": elapsed(), "error": None}
+            yield {"event": "articles", "service": name, "articles": kept, "meta": meta,
+                   "count": len(kept), "duplicates": dups, "elapsed": summary[name]["elapsed"]}
+    except TimeoutError:
+        for future, name in futures.items():
+            if not future.done():
+                future.cancel()
+                summary[name] = {"count": 0, "elapsed": elapsed(), "error": "timeout"}
+                yield {"event": "error", "service": name, "error": "timeout", "elapsed": elapsed()}
+
+    yield {"event": "done", "total": total, "duplicates": duplicates, "elapsed": elapsed(),
+           "services": summary}
@@ -1,12 +1,13 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import os, re, json, sys
-from datetime import datetime, date
-from dateutil import parser
-from linkedin_client import search_posts, slugify
+import os, json, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.search import match_query
-from utils.lang import detect_language, extract_country
+from linkedin_client import collect_posts, slugify
+from utils.search import QueryMatcher
+from utils.lang import detect_languages, extract_country
+from utils.dates import parse_window, window_bounds
+from utils import paging
+from utils.sentiment import annotate
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}}, expose_headers=["Content-Type"])
@@ -21,73 +22,64 @@ def _save(query: str, articles):
     with open(_path(query), 'w', encoding='utf-8') as f:
         json.dump(articles, f, ensure_ascii=False, indent=2)
 
-def _load(query: str):
-    path = _path(query)
-    if not os.path.exists(path):
-        return []
-    with open(path, encoding='utf-8') as f:
-        return json.load(f)
-
 @app.route('/collect', methods=['GET'])
 def collect():
     q = request.args.get('q', '').lower()
     n = int(request.args.get('n', 1000))
-    out = search_posts(q, n)
+    # refreshes every keyword shard, and keeps the full-query export
+    records, report = collect_posts(q, n, refresh=True)
+    out = [r.item for r in records]
     _save(q, out)
-    return jsonify({'status': 'ok', 'count': len(out)})
+    return jsonify({'status': 'ok', 'count': len(out), 'shards': report})
+
+def _normalize(candidates, lang_filter, country_filter):
+    # language detection in batches (cached, see utils.lang) so items stream out early
+    for batch in paging.batched(candidates, 200):
+        langs = detect_languages(body for *_, body, _ in batch)
+        for (a, title, desc, body, dt), lang in zip(batch, langs):
+            if lang_filter and lang != lang_filter: continue
+
+            url     = a.get('url') or a.get('link') or ''
+            cc      = extract_country(url)
+            if country_filter and cc != country_filter: continue
+
+            yield {
+                'service':    'linkedin',
+                'id':          a.get('id'),
+                'title':       title,
+                'description': desc,
+                'url':         url,
+                'date':        dt.isoformat(),
+                'langue':      lang,
+                'country':     cc
+            }
 
 @app.route('/articles', methods=['GET'])
 def articles():
+    # next page of a previous result (?cursor=), no shard is reloaded
+    page = paging.resume()
+    if page is not None:
+        return page
+
     q              = request.args.get('q', '').lower()
-    ex             = [w for w in re.split(r"[,\s]+", request.args.get('exclude', '').lower()) if w]
+    matcher        = QueryMatcher(q, request.args.get('exclude', ''))
     lang_filter    = request.args.get('lang', '').lower()
     country_filter = request.args.get('country', '').lower()
     n              = int(request.args.get('n', 1000))
 
-    start_str = request.args.get('start')
-    start = parser.isoparse(start_str).date() if start_str else date(2023, 1, 1)
-    end_str   = request.args.get('end')
-    end       = parser.isoparse(end_str).date() if end_str else date.today()
-
-    items = _load(q)
-    if not items:
-        items = search_posts(q, n)
-        _save(q, items)
-
-    normalized = []
-    for a in items:
-        title = a.get('title', '')
-        desc  = a.get('description') or a.get('summary') or ''
-        body  = f"{title}\n\n{desc}".strip()
-
-        date_val = a.get('published') or a.get('publishedAt') or a.get('date')
-        try:
-            dt = parser.isoparse(date_val)
-        except:
-            continue
-        if dt.date() < start or dt.date() > end: continue
+    start, end = parse_window(request.args.get('start'), request.args.get('end'))
 
-        if not match_query(q, body.lower()): continue
-        if ex and any(w in body.lower() for w in ex): continue
-        
-        lang = detect_language(body)
-        if lang_filter and lang != lang_filter: continue
+    # built from per-keyword shards (data/shards) ; only missing/stale keywords are fetched.
+    # records come pre-normalized (date parsed, body lower-cased) from the parsed-file cache
+    records, report = collect_posts(q, n)
 
-        url     = a.get('url') or a.get('link') or ''
-        cc      = extract_country(url)
-        if country_filter and cc != country_filter: continue
+    lo, hi = window_bounds(start, end)
+    records = [r for r in records if r.dt is not None and lo <= r.dt < hi]
+    keep    = matcher.filter((r.lower for r in records), lowered=True)
+    candidates = [(r.item, r.title, r.desc, r.body, r.dt) for r, kept in zip(records, keep) if kept]
 
-        normalized.append({
-            'service':    'linkedin',
-            'id':          a.get('id'),
-            'title':       title,
-            'description': desc,
-            'url':         url,
-            'date':        dt.isoformat(),
-            'langue':      lang,
-            'country':     cc
-        })
-    return jsonify(normalized)
+    # full list, ?limit= pages or ?stream=1 NDJSON (see utils.paging)
+    return paging.respond(annotate(_normalize(candidates, lang_filter, country_filter)), {'shards': report})
 
 if __name__ == "__main__":
     app.run(port=5006, debug=True)
@@ -5,3 +5,20 @@ load_dotenv()
 # Use an env-var in production, hard-coded value while prototyping
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 MAX_RESULTS = int(os.getenv("LINKEDIN_MAX_RESULTS", 1000))
+
+# SerpAPI : autre point d'accès (fausse API locale pour les tests), taille du pool
+SERPAPI_BACKEND = os.getenv("SERPAPI_BACKEND")
+SERP_WORKERS    = int(os.getenv("LINKEDIN_SERP_WORKERS", 4))
+# Budget de résultats par mot-clé (0 = part égale de n entre les mots-clés)
+KEYWORD_BUDGET  = int(os.getenv("LINKEDIN_KEYWORD_BUDGET", 0))
+
+# Cache disque des réponses SerpAPI brutes (secondes, 0 = désactivé)
+SERP_CACHE_DIR = os.getenv("LINKEDIN_SERP_CACHE_DIR", "data/cache/serpapi")
+SERP_CACHE_TTL = float(os.getenv("LINKEDIN_SERP_CACHE_TTL", 6 * 3600))
+
+# Cache par mot-clé (data/shards) : durée de vie d'un shard (secondes)
+SHARD_DIR = os.getenv("LINKEDIN_SHARD_DIR", "data/shards")
+SHARD_TTL = float(os.getenv("LINKEDIN_SHARD_TTL", 24 * 3600))
+
+# Nombre de fichiers parsés gardés en mémoire
+PARSED_CACHE = int(os.getenv("LINKEDIN_PARSED_CACHE", 256))
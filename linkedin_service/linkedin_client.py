@@ -1,93 +1,157 @@
 from serpapi import GoogleSearch
-from dateutil import parser, relativedelta
-from datetime import datetime, timedelta
-from config import SERPAPI_KEY, MAX_RESULTS
-import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from config import (SERPAPI_KEY, MAX_RESULTS, SERPAPI_BACKEND, SERP_WORKERS,
+                    KEYWORD_BUDGET, SERP_CACHE_DIR, SERP_CACHE_TTL, SHARD_DIR, SHARD_TTL,
+                    PARSED_CACHE)
+from shards import ShardStore
+import math
+import os, re, sys
 import unicodedata as ud 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.dates import to_utc
+from utils.disk_cache import DiskCache
 
-def search_posts(query: str, max_posts: int = MAX_RESULTS):
+if SERPAPI_BACKEND:
+    GoogleSearch.BACKEND = SERPAPI_BACKEND.rstrip("/")
+
+PAGE_SIZE = 100
+# réponses brutes SerpAPI ; les réponses en erreur ({"error": ...}) ne sont pas gardées
+CACHE = DiskCache(SERP_CACHE_DIR, SERP_CACHE_TTL, secret="api_key",
+                  keep=lambda data: isinstance(data, dict) and "error" not in data)
+_POOL = ThreadPoolExecutor(max_workers=SERP_WORKERS, thread_name_prefix='serpapi')
+
+
+def _page(kw: str, start: int, num: int):
+    """Une page de résultats Google pour `kw` (cache disque d'abord)."""
+    params = {
+        "engine": "google",
+        "q": f'site:linkedin.com/posts intitle:"{kw}"',
+        "api_key": SERPAPI_KEY,
+        "num": num,
+        "start": start,
+    }
+    data = CACHE.get(params)
+    if data is None:
+        data = GoogleSearch(dict(params)).get_dict()   # le client ajoute ses propres clés
+        CACHE.put(params, data)
+    if "error" in data and "hasn't returned any results" not in data["error"]:
+        raise RuntimeError(f"SerpAPI: {data['error']}")
+    return data.get("organic_results", [])
+
+
+def split_keywords(query: str):
+    return list(dict.fromkeys(k.strip() for k in re.split(r"[,\s]+", query or "") if k.strip()))
+
+
+def _budget(keywords, max_posts):
+    return KEYWORD_BUDGET or math.ceil(max_posts / max(1, len(keywords)))
+
+
+def _normalize(p, now):
+    # SerpAPI’s fuzzy “date” field (“Today”, “Aujourd’hui”, “3h”, “2d”…)
+    # goes through utils.dates ; unreadable dates fall back to now
+    return {
+        "service":     "linkedin",
+        "source":      p.get("source") or "LinkedIn", 
+        "id":          p.get("position"),
+        "title":       p.get("title") or "",
+        "description": p.get("snippet") or "",
+        "url":         p.get("link"),
+        "date":        (to_utc(p.get("date"), now) or now).isoformat(),
+    }
+
+
+def fetch_keywords(keywords, budget):
     """
-    Fetch public LinkedIn posts via SerpAPI's LinkedIn Public
-    Search Results API. Falls back gracefully if a timestamp
-    can't be parsed.
+    {keyword: [normalized posts] or None on error}, up to `budget` each.
+
+    Keywords are fetched concurrently on a bounded pool. Within a keyword,
+    the next page is only asked for once the previous one came back full:
+    no paid call is made past the end of the results.
     """
-    keywords = [k.strip() for k in re.split(r"[,\s]+", query) if k.strip()]
-    all_posts = []
-    for kw in keywords:
-        start = 0
-        while len(all_posts) < max_posts:
-            params = {
-                "engine": "google",
-                "q": f'site:linkedin.com/posts intitle:"{kw}"',
-                "api_key": SERPAPI_KEY,
-                "num": min(100, max_posts - len(all_posts)),
-                "start": start,
-            }
-            data = GoogleSearch(params).get_dict()
-            posts = data.get("organic_results", [])
-            if not posts:
-                break
-            all_posts += posts
-            start += 100
-            if len(posts) < 100:
-                break
+    def pages(kw):
+        posts = []
+        for start in range(0, budget, PAGE_SIZE):
+            try:
+                page = _page(kw, start, min(PAGE_SIZE, budget - start))
+            except Exception as e:
+                print(f"⚠️ LinkedIn « {kw} » : {e}")
+                return posts if start else None
+            posts += page
+            if len(page) < PAGE_SIZE:
+                break                   # fin des résultats
+        return posts
+
+    per_keyword = list(_POOL.map(pages, keywords))
+    now = datetime.now(timezone.utc)
+    return {kw: None if posts is None else [_normalize(p, now) for p in posts[:budget]]
+            for kw, posts in zip(keywords, per_keyword)}
 
+
+def _merge(lists, url=lambda p: p.get("url")):
     # deduplicate across several keywords
     seen = set()
     posts = []
-    for p in all_posts:
-        url = p.get("link")
-        if url in seen:
+    for p in (p for lst in lists for p in lst):
+        key = url(p)
+        if key in seen:
             continue
-        seen.add(url)
+        seen.add(key)
         posts.append(p)
+    return posts
+
+
+def search_posts(query: str, max_posts: int = MAX_RESULTS):
+    """
+    Fetch public LinkedIn posts via SerpAPI's LinkedIn Public
+    Search Results API. Falls back gracefully if a timestamp
+    can't be parsed.
 
-    results = []
-    # ------------------------------------------------------------------
-    # Robust conversion of SerpAPI’s fuzzy “date” field
-    #  • “Today” / “Aujourd’hui”
-    #  • “Yesterday”
-    #  • “3h”, “2d”, “4w”, …
-    # ------------------------------------------------------------------
-    _REL_RX = re.compile(r"(?P<num>\d+)\s*(?P<unit>[hdwmy])", re.I)
-
-    def _norm(raw: str) -> datetime:
-        raw = (raw or "").strip().lower()
-        now = datetime.utcnow()
-        if raw in ("today", "aujourd'hui", "aujourd'hui"):
-            return now
-        if raw == "yesterday":
-            return now - timedelta(days=1)
-        m = _REL_RX.fullmatch(raw)
-        if m:
-            num = int(m["num"])
-            u   = m["unit"]
-            return (
-                now - (timedelta(hours=num)        if u == "h" else
-                       timedelta(days=num)         if u == "d" else
-                       timedelta(weeks=num)        if u == "w" else
-                       relativedelta.relativedelta(months=num) if u == "m" else
-                       relativedelta.relativedelta(years=num)) # “y”
-            )
-        # last resort: dateutil.parse or fall back to now
-        try:
-            return parser.parse(raw)
-        except Exception:
-            return now
-
-    for p in posts:
-        date_iso = _norm(p.get("date")).isoformat()
-
-        results.append({
-            "service":     "linkedin",
-            "source":      p.get("source") or "LinkedIn", 
-            "id":          p.get("position"),
-            "title":       p.get("title") or "",
-            "description": p.get("snippet") or "",
-            "url":         p.get("link"),
-            "date":        date_iso,
-        })
-    return results
+    Each keyword has its own result budget (LINKEDIN_KEYWORD_BUDGET, or an
+    equal share of `max_posts`), keywords and pages are fetched
+    concurrently and raw responses are cached on disk for
+    LINKEDIN_SERP_CACHE_TTL seconds.
+    """
+    keywords = split_keywords(query)
+    fetched  = fetch_keywords(keywords, _budget(keywords, max_posts))
+    return _merge(fetched[kw] or [] for kw in keywords)
+
+
+def collect_posts(query: str, max_posts: int = MAX_RESULTS, refresh: bool = False):
+    """
+    `search_posts` built from the per-keyword shards (see shards.py): only
+    keywords whose shard is missing, stale or too small are fetched. When a
+    fetch fails the stale shard, if any, is used instead. A query collected
+    before the shards existed (data/<query>.json) is served from that file
+    while one of its keywords still has no shard.
+
+    Returns (records, report) : pre-normalized records (see records.py, the
+    raw post is `record.item`) ; report = {keywords, hits, fetched, stale}
+    plus "export" when the old file was served.
+    """
+    keywords = split_keywords(query)
+    budget   = _budget(keywords, max_posts)
+    shards   = {kw: SHARDS.load(kw) for kw in keywords}
+    todo     = [kw for kw in keywords if refresh or not SHARDS.usable(shards[kw], budget)]
+    if not refresh and any(shards[kw] is None for kw in todo):
+        # requête collectée avant les shards : servie depuis son fichier, sans appel SerpAPI
+        export = SHARDS.load_export(query)
+        if export is not None:
+            report = {"keywords": len(keywords), "hits": len(keywords) - len(todo),
+                      "fetched": [], "stale": [], "export": SHARDS.slug(query) + ".json"}
+            return SHARDS.records(export), report
+    stale    = []
+    if todo:
+        for kw, posts in fetch_keywords(todo, budget).items():
+            if posts is None:
+                stale.append(kw)
+            else:
+                shards[kw] = SHARDS.save(kw, posts, budget)
+    report = {"keywords": len(keywords), "hits": len(keywords) - len(todo),
+              "fetched": [kw for kw in todo if kw not in stale], "stale": stale}
+    records = _merge((SHARDS.records(shards[kw])[:budget] for kw in keywords), url=lambda r: r.url)
+    return records, report
 
 
 _slug_re = re.compile(r"[^a-z0-9]+")
@@ -117,3 +181,7 @@ def slugify(text: str) -> str:
     text = _slug_re.sub("-", text).strip("-")
 
     return text or "untitled"
+
+
+SHARDS = ShardStore(SHARD_DIR, SHARD_TTL, slugify, legacy_dir=os.path.dirname(SHARD_DIR) or "data",
+                    max_parsed=PARSED_CACHE)
@@ -0,0 +1,30 @@
+"""
+Enregistrements LinkedIn pré-normalisés pour /articles.
+
+Un `Record` garde le post brut et ce que /articles recalculait à chaque
+requête : la date déjà convertie en datetime UTC, le corps « titre +
+description » et sa version en minuscules pour le QueryMatcher. Les
+records d'un fichier sont construits une fois et gardés avec le fichier
+parsé dans le cache du processus (voir shards.py).
+"""
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.dates import to_utc_many
+
+
+class Record:
+    __slots__ = ("item", "url", "title", "desc", "body", "lower", "dt")
+
+    def __init__(self, item, dt):
+        self.item  = item
+        self.url   = item.get("url") or item.get("link") or ""
+        self.title = item.get("title", "")
+        self.desc  = item.get("description") or item.get("summary") or ""
+        self.body  = f"{self.title}\n\n{self.desc}".strip()
+        self.lower = self.body.lower()
+        self.dt    = dt
+
+
+def build_records(items):
+    dts = to_utc_many(a.get("published") or a.get("publishedAt") or a.get("date") for a in items)
+    return [Record(a, dt) for a, dt in zip(items, dts)]
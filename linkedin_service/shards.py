@@ -0,0 +1,142 @@
+"""
+Cache des résultats LinkedIn par mot-clé (« shard »).
+
+search_posts découpe déjà une requête en mots-clés : chaque mot-clé a son
+fichier data/shards/<slug>.json avec sa propre date de collecte
+
+    {"keyword", "fetched_at", "budget", "complete", "posts": [...]}
+
+Une requête se reconstruit à partir des shards déjà présents ; seuls les
+mots-clés absents, périmés (plus de `ttl` secondes) ou collectés avec un
+budget trop petit sont redemandés à SerpAPI. Deux requêtes qui se
+recouvrent (« alioune sall ministere ... ») partagent ainsi leurs shards.
+
+Les fichiers écrits avant les shards (data/<requête>.json, export de
+/collect) restent servis tels quels, sans appel SerpAPI, comme avant : un
+data/<mot-clé>.json devient le shard « importé » de ce mot-clé, valable
+quel que soit le budget demandé ; une requête dont un mot-clé n'a encore
+aucun shard est servie depuis data/<requête>.json s'il existe. Le
+prochain /collect de la requête les remplace par de vrais shards.
+
+Les fichiers parsés restent en mémoire (LRU) tant que leur mtime/taille ne
+change pas, avec leurs records pré-normalisés (records.py) : une requête
+répétée ne relit ni ne re-normalise rien. Les shards s'écrivent en JSON
+compact.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from records import build_records
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(path, obj):
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+class ShardStore:
+    def __init__(self, directory, ttl, slug, legacy_dir=None, max_parsed=256):
+        self.directory  = directory
+        self.ttl        = ttl
+        self.slug       = slug
+        self.legacy_dir = legacy_dir
+        self.max_parsed = max_parsed
+        self._parsed    = OrderedDict()   # path -> ((mtime_ns, size), shard)
+        self._lock      = threading.Lock()
+        self.counters   = {"hits": 0, "misses": 0}
+
+    def path(self, keyword):
+        return os.path.join(self.directory, self.slug(keyword) + ".json")
+
+    # --- cache des fichiers parsés ----------------------------------------
+    def _cached(self, path, convert):
+        """Fichier parsé (et converti) ; relu seulement si mtime/taille ont changé."""
+        st    = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            hit = self._parsed.get(path)
+            if hit and hit[0] == stamp:
+                self._parsed.move_to_end(path)
+                self.counters["hits"] += 1
+                return hit[1]
+            self.counters["misses"] += 1
+        shard = convert(_read(path), st)
+        self._remember(path, stamp, shard)
+        return shard
+
+    def _remember(self, path, stamp, shard):
+        with self._lock:
+            self._parsed[path] = (stamp, shard)
+            self._parsed.move_to_end(path)
+            while len(self._parsed) > self.max_parsed:
+                self._parsed.popitem(last=False)
+
+    def records(self, shard):
+        """Records pré-normalisés du shard, construits une seule fois."""
+        if shard is None:
+            return []
+        records = shard.get("_records")
+        if records is None:
+            records = shard["_records"] = build_records(shard["posts"])
+        return records
+
+    # --- accès ------------------------------------------------------------
+    def load(self, keyword):
+        try:
+            return self._cached(self.path(keyword), lambda obj, st: obj)
+        except (OSError, ValueError):
+            return self._legacy(keyword)
+
+    def _legacy(self, keyword):
+        return self.load_export(keyword)
+
+    def load_export(self, query):
+        """Ancien fichier data/<requête>.json, sous forme de shard importé (None s'il n'existe pas)."""
+        if not self.legacy_dir:
+            return None
+
+        def convert(posts, st):
+            if not isinstance(posts, list):
+                raise ValueError("ancien fichier : liste attendue")
+            # collecté avec le budget de l'époque : complet, et servi jusqu'au prochain /collect
+            return {"keyword": query, "fetched_at": st.st_mtime, "budget": len(posts),
+                    "complete": True, "imported": True, "posts": posts}
+
+        try:
+            return self._cached(os.path.join(self.legacy_dir, self.slug(query) + ".json"), convert)
+        except (OSError, ValueError):
+            return None
+
+    def usable(self, shard, budget, now=None):
+        """Shard importé, ou frais et assez fourni pour `budget` résultats."""
+        if not shard:
+            return False
+        if shard.get("imported"):
+            return True
+        if (now or time.time()) - shard["fetched_at"] >= self.ttl:
+            return False
+        return shard["complete"] or shard["budget"] >= budget
+
+    def save(self, keyword, posts, budget):
+        shard = {"keyword": keyword, "fetched_at": time.time(), "budget": budget,
+                 "complete": len(posts) < budget, "posts": posts}
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(keyword)
+        _write(path, shard)
+        st = os.stat(path)
+        self._remember(path, (st.st_mtime_ns, st.st_size), shard)
+        return shard
+
+    def stats(self):
+        with self._lock:
+            return {**self.counters, "parsed": len(self._parsed)}
@@ -2,13 +2,33 @@ from flask import Flask, request, jsonify
 from extractors import get_extractor, list_extractors
 import os, re, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils import save_articles
+from storage import save_articles
+from utils import paging
+from utils.sentiment import annotate
 from datetime import datetime
+import time
 from flask_cors import CORS
+from config import (SITE_TTL, SITE_WORKERS, REFRESH_TICK, COLD_TIMEOUT, ENRICH, ENRICH_BUDGET,
+                    ENRICH_PER_HOST, ENRICH_DELAY, ENRICH_WORKERS, PAGES_DIR)
+from site_cache import SiteCache
+from enrich import Enricher
 
 app = Flask(__name__)
 CORS(app)
 
+# texte intégral des articles, pages gardées par URL
+ENRICHER = Enricher(PAGES_DIR, ENRICH_PER_HOST, ENRICH_DELAY, ENRICH_WORKERS)
+
+# articles de chaque site, rafraîchis en fond : /articles ne scrape plus en direct
+SITES = SiteCache(list_extractors(), SITE_TTL, SITE_WORKERS, REFRESH_TICK, COLD_TIMEOUT,
+                  enrich=(lambda arts: ENRICHER.enrich(arts, ENRICH_BUDGET)[0]) if ENRICH else None)
+
+@app.before_request
+def _start_refresh():
+    # lancé à la première requête et non à l'import (tests, outils) ; avec le
+    # reloader de debug, seul le processus qui sert les requêtes le lance
+    SITES.start()
+
 @app.route("/collect", methods=["GET"])
 def collect():
     site = request.args.get("site")
@@ -20,43 +40,68 @@ def collect():
         return jsonify({"error": f"Unknown site '{site}'"}), 400
 
     articles = extractor()
-    path = save_articles(articles)
+    report   = None
+    if request.args.get("enrich") == "1":
+        budget = float(request.args.get("budget", ENRICH_BUDGET))
+        articles, report = ENRICHER.enrich(articles, min(budget, ENRICH_BUDGET))
+
+    folder = os.path.join("data", "raw", datetime.now().date().isoformat())
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"{site}_scraper.json")
+    save_articles(articles, path)
     return jsonify(
-        {"status": "ok", "count": len(articles), "fichier": path}
+        {"status": "ok", "count": len(articles), "fichier": path, "enrich": report}
     )
 
+def _matching(states, q, ex):
+    for svc, state in states.items():
+        for a in state["articles"]:
+            title_desc = f"{a.get('title','')} {a.get('texte','')} {a.get('description','')}".lower()
+
+            # positive filter
+            if q and q not in title_desc:
+                continue
+            # negative filter
+            if ex and any(word in title_desc for word in ex):
+                continue
+
+            yield {**a, "service": svc}
+
 @app.route("/articles", methods=["GET"])
 def articles():
     """
     Agrège tous les articles des extracteurs presse
-    /articles?service=gfm&rts...&q=&exclude=
+    /articles?service=gfm&rts...&q=&exclude=&limit=&cursor=&stream=1
     """
+    # page suivante d'un résultat précédent (?cursor=)
+    page = paging.resume()
+    if page is not None:
+        return page
+
     service = request.args.get("service")
     q  = request.args.get("q", "").lower()
     # split on comma or ANY whitespace
     ex = [w for w in re.split(r"[,\s]+", request.args.get("exclude", "").lower()) if w]
 
-    results  = []
     targets  = [service] if service else list_extractors()
+    if service and service not in list_extractors():
+        return jsonify({"articles": [], "sites": {service: {"error": "Unknown site"}}})
+
+    # servis depuis le cache par site ; les sites périmés sont rafraîchis en fond
+    states = SITES.get(targets)
+    now = time.time()
+    # liste complète, pages ?limit= ou flux ?stream=1 (voir utils.paging)
+    return paging.respond(annotate(_matching(states, q, ex)), {
+        "sites": {svc: SITES.freshness(state, now) for svc, state in states.items()},
+    })
+
 
-    for svc in targets:
-        try:
-            extractor = get_extractor(svc)
-            for a in extractor():
-                title_desc = f"{a.get('title','')} {a.get('description','')}".lower()
-
-                # positive filter
-                if q and q not in title_desc:
-                    continue
-                # negative filter
-                if ex and any(word in title_desc for word in ex):
-                    continue
-
-                a["service"] = svc
-                results.append(a)
-        except ImportError:
-            continue
-    return jsonify(results)
+@app.route("/sites", methods=["GET"])
+def sites():
+    """Fraîcheur et dernière erreur de chaque site, sans rien déclencher."""
+    now = time.time()
+    return jsonify({svc: SITES.freshness(state, now)
+                    for svc, state in SITES.get_cached().items()})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,24 @@
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Cache par site des extracteurs : durée de vie (secondes), taille du pool,
+# période du rafraîchissement de fond (0 = désactivé, à la demande seulement)
+SITE_TTL        = float(os.getenv("PRESSE_SITE_TTL", 900))
+SITE_WORKERS    = int(os.getenv("PRESSE_SITE_WORKERS", 4))
+REFRESH_TICK    = float(os.getenv("PRESSE_REFRESH_TICK", 30))
+# attente maximale d'une requête pour un site jamais encore récupéré
+COLD_TIMEOUT    = float(os.getenv("PRESSE_COLD_TIMEOUT", 15))
+
+# Téléchargement des pages d'accueil : délai (secondes) et réessais par requête
+FETCH_TIMEOUT   = float(os.getenv("PRESSE_FETCH_TIMEOUT", 10))
+FETCH_RETRIES   = int(os.getenv("PRESSE_FETCH_RETRIES", 2))
+
+# Enrichissement (texte intégral + date des pages d'articles, voir enrich.py) :
+# ENRICH=1 l'active aussi au rafraîchissement de fond ; /collect?enrich=1 à la demande
+ENRICH          = os.getenv("PRESSE_ENRICH", "0") == "1"
+ENRICH_BUDGET   = float(os.getenv("PRESSE_ENRICH_BUDGET", 20))
+ENRICH_PER_HOST = int(os.getenv("PRESSE_ENRICH_PER_HOST", 2))
+ENRICH_DELAY    = float(os.getenv("PRESSE_ENRICH_DELAY", 1.0))
+ENRICH_WORKERS  = int(os.getenv("PRESSE_ENRICH_WORKERS", 8))
+PAGES_DIR       = os.getenv("PRESSE_PAGES_DIR", "data/pages")
@@ -0,0 +1,172 @@
+"""
+Enrichissement des articles presse : texte intégral et vraie date.
+
+Les extracteurs ne voient que la page d'accueil ("texte" = titre du lien).
+`Enricher.enrich(articles, budget)` télécharge en parallèle la page de
+chaque article, en extrait le corps et la date de publication
+(extractors.parsing.extract_page) et les ajoute à l'article :
+
+    "description" : corps du texte (ce que lisent le filtre q / exclude,
+                    le frontend et le rapport IA)
+    "date"        : date de publication de la page, si trouvée
+
+Politesse : au plus `per_host` requêtes simultanées par hôte, et au moins
+`delay` secondes entre deux débuts de requête sur le même hôte.
+
+Chaque page est gardée sur disque par URL (data/pages/<sha1>.json) : une URL
+déjà enrichie n'est plus jamais retéléchargée, une URL en échec est retentée
+après `retry_after` secondes. Au bout de `budget` secondes enrich() rend la
+main avec ce qu'il a : les requêtes pas encore commencées sont annulées, celles
+en cours finissent en fond et serviront au prochain passage.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import requests
+
+from extractors.parsing import extract_page
+
+_local = threading.local()
+
+
+def _session():
+    # une session (keep-alive) par thread du pool
+    sess = getattr(_local, "session", None)
+    if sess is None:
+        sess = _local.session = requests.Session()
+        sess.headers["User-Agent"] = "Mozilla/5.0 (compatible; comTracker)"
+    return sess
+
+
+class _Host:
+    def __init__(self, per_host):
+        self.slots     = threading.Semaphore(per_host)
+        self.lock      = threading.Lock()
+        self.next_slot = 0.0
+
+
+class Enricher:
+    def __init__(self, directory, per_host=2, delay=1.0, max_workers=8, timeout=10,
+                 retry_after=3600, min_paragraph=40):
+        self.directory     = directory
+        self.per_host      = per_host
+        self.delay         = delay
+        self.timeout       = timeout
+        self.retry_after   = retry_after
+        self.min_paragraph = min_paragraph
+        self._pages        = {}   # url -> {"url", "body", "date", "fetched_at", "error"}
+        self._hosts        = {}   # hôte -> _Host
+        self._pool         = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="enrich")
+        self._lock         = threading.Lock()
+
+    # --- cache par URL ------------------------------------------------------
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+    def page(self, url):
+        """Page en cache (mémoire, sinon disque), ou None."""
+        with self._lock:
+            page = self._pages.get(url)
+        if page is not None:
+            return page
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                page = json.load(f)
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            self._pages[url] = page
+        return page
+
+    def _save(self, page):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(page["url"])
+        tmp  = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(page, f, ensure_ascii=False)
+        os.replace(tmp, path)
+        with self._lock:
+            self._pages[page["url"]] = page
+
+    def _usable(self, page, now):
+        return page is not None and (not page.get("error") or now - page["fetched_at"] < self.retry_after)
+
+    # --- téléchargement -----------------------------------------------------
+    def _host(self, url):
+        host = urlsplit(url).hostname or ""
+        with self._lock:
+            return self._hosts.setdefault(host, _Host(self.per_host))
+
+    def _fetch(self, url, deadline):
+        host = self._host(url)
+        with host.slots:
+            with host.lock:
+                now   = time.monotonic()
+                start = max(now, host.next_slot)
+                if start >= deadline:
+                    return None          # hors budget : retenté au prochain passage
+                host.next_slot = start + self.delay
+            time.sleep(start - now)
+            page = {"url": url, "body": "", "date": None, "fetched_at": time.time(), "error": None}
+            try:
+                resp = _session().get(url, timeout=self.timeout)
+                resp.raise_for_status()
+                if "html" not in resp.headers.get("Content-Type", "text/html"):
+                    raise ValueError(f"pas du HTML : {resp.headers.get('Content-Type')}")
+                page.update(extract_page(resp.text, self.min_paragraph))
+            except Exception as e:
+                page["error"] = f"{type(e).__name__}: {e}"
+        self._save(page)
+        return page
+
+    # --- étape d'enrichissement ---------------------------------------------
+    def enrich(self, articles, budget=20):
+        """(articles enrichis, rapport) ; rend la main au bout de `budget` secondes."""
+        t0, now  = time.monotonic(), time.time()
+        deadline = t0 + budget
+        report   = {"cached": 0, "fetched": 0, "failed": 0, "skipped": 0}
+
+        todo = {}
+        for a in articles:
+            url = (a.get("métadonnées") or {}).get("url") or a.get("id")
+            if url and url not in todo and not self._usable(self.page(url), now):
+                todo[url] = self._pool.submit(self._fetch, url, deadline)
+        if todo:
+            wait(todo.values(), timeout=budget)
+            for future in todo.values():
+                future.cancel()          # pas encore commencées
+
+        out = []
+        for a in articles:
+            url  = (a.get("métadonnées") or {}).get("url") or a.get("id")
+            page = self.page(url) if url else None
+            if url in todo:
+                future = todo[url]
+                if (not future.done() or future.cancelled() or future.exception()
+                        or future.result() is None):
+                    report["skipped"] += 1
+                elif page and page.get("error"):
+                    report["failed"] += 1
+                else:
+                    report["fetched"] += 1
+            elif page is not None:
+                report["cached"] += 1
+            out.append(self._apply(a, page))
+        report["elapsed"] = round(time.monotonic() - t0, 3)
+        return out, report
+
+    def _apply(self, article, page):
+        if not page or page.get("error") or not (page.get("body") or page.get("date")):
+            return article
+        out = dict(article)
+        if page.get("body"):
+            out["description"] = page["body"]
+        if page.get("date"):
+            out["date"] = page["date"]
+        out["métadonnées"] = {**(article.get("métadonnées") or {}), "enrichi": True}
+        return out
@@ -0,0 +1,96 @@
+"""
+Récupération des pages d'accueil presse : sessions longues et pages inchangées.
+
+Chaque site garde sa session HTTP (requests ou cloudscraper) d'un appel à
+l'autre : connexions keep-alive, cookies Cloudflare déjà résolus, et
+réessais avec backoff sur les erreurs réseau / 429 / 5xx. SiteCache ne
+lance jamais deux rafraîchissements du même site à la fois, une session
+n'est donc utilisée que par un thread à la fois. Après un échec la session
+est jetée et recréée au prochain appel (challenge expiré, connexion morte).
+
+`scrape(site, url, parse, factory)` envoie If-None-Match / If-Modified-Since
+quand le site a donné un ETag / Last-Modified, et garde l'empreinte SHA-1 du
+corps : page inchangée (304 ou même empreinte) -> la liste d'articles
+précédente est réutilisée sans ré-analyser le HTML.
+
+Les durées de téléchargement et d'analyse du dernier passage de chaque
+site sont dans `page_stats(site)`.
+"""
+import hashlib
+import threading
+import time
+
+import requests
+from requests.adapters import Retry
+
+from config import FETCH_RETRIES, FETCH_TIMEOUT
+
+_sessions = {}   # site -> session
+_pages    = {}   # site -> {"digest", "etag", "last_modified", "articles"}
+_stats    = {}   # site -> timings du dernier passage
+_lock     = threading.Lock()
+
+
+def _retry():
+    return Retry(total=FETCH_RETRIES, backoff_factor=0.5,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 allowed_methods=("GET", "HEAD"), raise_on_status=False)
+
+
+def session(site, factory=requests.Session):
+    """Session du site, créée une fois ; réessais posés sur ses adaptateurs existants
+    (cloudscraper monte son propre adaptateur TLS, on ne le remplace pas)."""
+    with _lock:
+        sess = _sessions.get(site)
+        if sess is None:
+            sess = factory()
+            for adapter in sess.adapters.values():
+                adapter.max_retries = _retry()
+            _sessions[site] = sess
+        return sess
+
+
+def reset_session(site):
+    with _lock:
+        sess = _sessions.pop(site, None)
+    if sess is not None:
+        sess.close()
+
+
+def scrape(site, url, parse, factory=requests.Session, timeout=None):
+    """Articles de la page `url`, analysée par `parse(html)` seulement si elle a changé."""
+    prev    = _pages.get(site)
+    headers = {}
+    if prev and prev.get("etag"):
+        headers["If-None-Match"] = prev["etag"]
+    if prev and prev.get("last_modified"):
+        headers["If-Modified-Since"] = prev["last_modified"]
+
+    t0 = time.perf_counter()
+    try:
+        resp = session(site, factory).get(url, headers=headers, timeout=timeout or FETCH_TIMEOUT)
+        resp.raise_for_status()
+    except Exception:
+        reset_session(site)
+        raise
+    fetch = time.perf_counter() - t0
+
+    digest = prev["digest"] if resp.status_code == 304 and prev else hashlib.sha1(resp.content).hexdigest()
+    unchanged = bool(prev) and prev["digest"] == digest
+    t1 = time.perf_counter()
+    articles = prev["articles"] if unchanged else parse(resp.text)
+    parse_s = time.perf_counter() - t1
+
+    _pages[site] = {"digest": digest, "articles": articles,
+                    "etag": resp.headers.get("ETag") or (prev or {}).get("etag"),
+                    "last_modified": resp.headers.get("Last-Modified") or (prev or {}).get("last_modified")}
+    _stats[site] = {"fetch": round(fetch, 3), "parse": round(parse_s, 3),
+                    "status": resp.status_code, "bytes": len(resp.content),
+                    "unchanged": unchanged}
+    return list(articles)
+
+
+def page_stats(site):
+    """Timings du dernier passage du site, ou None."""
+    stats = _stats.get(site)
+    return dict(stats) if stats else None
@@ -0,0 +1,229 @@
+"""
+Couche d'analyse HTML commune aux extracteurs presse.
+
+Chaque extracteur décrit ce qu'il cherche dans un dictionnaire de règles
+(`RULES`) ; `extract(html, rules, now)` applique ces règles avec le moteur
+choisi et renvoie les articles, sans aucun accès réseau :
+
+    "source"   : nom du site (champ "source" des articles)
+    "base_url" : URL de base pour urljoin
+    "only"     : balises à garder en analyse partielle (moteur bs4)
+    "section"  : liens des blocs frères qui suivent un titre
+                 {"headers": ("h2", "h3"), "contains": "A LA UNE", "links": filtre}
+    "blocks"   : un article par bloc, premier <a href> + <time datetime>
+                 {"tag": "article", "links": filtre}
+    "fallback" : si rien trouvé, tous les <a href> du document passant le filtre
+
+Un filtre de lien est {"href_contains", "href_prefix", "min_title"}.
+
+`extract_page(html)` lit une page d'article (étape d'enrichissement, voir
+enrich.py) : corps du texte et vraie date de publication.
+
+Moteurs : "bs4" par défaut (BeautifulSoup + html.parser, le comportement
+historique, avec SoupStrainer pour l'analyse partielle) ; PRESSE_PARSER=lxml
+active libxml2 (en C) quand il est installé. Sur une page mal formée,
+libxml2 ne construit pas le même arbre que html.parser (frères d'un titre
+différents) : lxml reste donc un choix explicite.
+"""
+import os
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:                                   # optional : pip install lxml
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+ENGINE = os.getenv("PRESSE_PARSER") or "bs4"
+
+# contenu ignoré par get_text() de BeautifulSoup
+_SKIP_TEXT = {"script", "style", "template"}
+
+
+class _LxmlBackend:
+    def __init__(self, html, only=None):
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        try:
+            self.root = lxml.html.fromstring(html.encode("utf-8"), parser=parser)
+        except (etree.ParserError, ValueError):
+            self.root = None        # document vide
+
+    def find_all(self, tags, within=None):
+        node = self.root if within is None else within
+        if node is None:
+            return []
+        tags = (tags,) if isinstance(tags, str) else tags
+        return [el for el in node.iter(*tags) if el is not within]
+
+    def find(self, tag, within, attr=None):
+        for el in within.iter(tag):
+            if el is not within and (attr is None or el.get(attr) is not None):
+                return el
+        return None
+
+    def attr(self, el, name):
+        return el.get(name)
+
+    def name(self, el):
+        return el.tag
+
+    def next_siblings(self, el):
+        return [sib for sib in el.itersiblings() if isinstance(sib.tag, str)]
+
+    def text(self, el, sep=""):
+        """Comme Tag.get_text(sep, strip=True)."""
+        parts = []
+        self._text(el, parts)
+        return sep.join(parts)
+
+    def _text(self, el, parts):
+        if el.text and el.tag not in _SKIP_TEXT:
+            s = el.text.strip()
+            if s:
+                parts.append(s)
+        for child in el:
+            if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT:
+                self._text(child, parts)
+            if child.tail:
+                s = child.tail.strip()
+                if s:
+                    parts.append(s)
+
+
+class _SoupBackend:
+    def __init__(self, html, only=None):
+        strainer = SoupStrainer(list(only)) if only else None
+        self.root = BeautifulSoup(html, "html.parser", parse_only=strainer)
+
+    def find_all(self, tags, within=None):
+        node = self.root if within is None else within
+        return node.find_all(list(tags) if not isinstance(tags, str) else tags)
+
+    def find(self, tag, within, attr=None):
+        return within.find(tag, **({attr: True} if attr else {}))
+
+    def attr(self, el, name):
+        return el.get(name)
+
+    def name(self, el):
+        return el.name
+
+    def next_siblings(self, el):
+        return el.find_next_siblings()
+
+    def text(self, el, sep=""):
+        return el.get_text(sep, strip=True)
+
+
+_BACKENDS = {"lxml": _LxmlBackend, "bs4": _SoupBackend}
+
+
+def parse(html, only=None, engine=None):
+    engine = engine or ENGINE
+    if engine == "lxml" and lxml is None:
+        engine = "bs4"
+    return _BACKENDS[engine](html, only if engine == "bs4" else None)
+
+
+def _keep(href, title, rule):
+    if not title or len(title) < rule.get("min_title", 1):
+        return False
+    if "href_contains" in rule and rule["href_contains"] not in href:
+        return False
+    if "href_prefix" in rule and not href.startswith(rule["href_prefix"]):
+        return False
+    return True
+
+
+def _article(href, date, source, title):
+    return {"id": href, "date": date, "source": source, "texte": title,
+            "métadonnées": {"url": href}}
+
+
+def extract(html, rules, now=None, engine=None):
+    """Articles d'une page selon `rules` (voir le module) ; fonction pure."""
+    doc      = parse(html, rules.get("only"), engine)
+    base     = rules["base_url"]
+    source   = rules["source"]
+    default  = (now or datetime.now()).isoformat()
+    articles = []
+
+    section = rules.get("section")
+    if section:
+        header = next((h for h in doc.find_all(section["headers"])
+                       if section["contains"] in doc.text(h).upper()), None)
+        if header is not None:
+            for sib in doc.next_siblings(header):
+                if doc.name(sib) in section["headers"]:
+                    break
+                for a in doc.find_all("a", within=sib):
+                    if doc.attr(a, "href") is None:
+                        continue
+                    href, title = urljoin(base, doc.attr(a, "href")), doc.text(a)
+                    if _keep(href, title, section["links"]):
+                        articles.append(_article(href, default, source, title))
+
+    blocks = rules.get("blocks")
+    if blocks:
+        for block in doc.find_all(blocks["tag"]):
+            link = doc.find("a", block, attr="href")
+            if link is None:
+                continue
+            href, title = urljoin(base, doc.attr(link, "href")), doc.text(link)
+            if not _keep(href, title, blocks["links"]):
+                continue
+            date = default
+            time_tag = doc.find("time", block)
+            if time_tag is not None and doc.attr(time_tag, "datetime") is not None:
+                date = doc.attr(time_tag, "datetime")
+            articles.append(_article(href, date, source, title))
+
+    fallback = rules.get("fallback")
+    if not articles and fallback:
+        for a in doc.find_all("a"):
+            if doc.attr(a, "href") is None:
+                continue
+            href, title = urljoin(base, doc.attr(a, "href")), doc.text(a)
+            if _keep(href, title, fallback):
+                articles.append(_article(href, default, source, title))
+
+    return articles
+
+
+# métadonnées de date de publication, par ordre de préférence
+_DATE_META = ("article:published_time", "og:published_time", "datepublished",
+              "publishdate", "pubdate", "date", "dc.date", "dc.date.issued")
+_JSONLD_DATE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+
+
+def extract_page(html, min_paragraph=40, engine=None):
+    """
+    {"body", "date"} d'une page d'article : paragraphes <p> du premier
+    <article> (sinon de toute la page) d'au moins `min_paragraph` caractères,
+    date des balises meta, de JSON-LD ou du premier <time datetime>.
+    """
+    doc = parse(html, engine=engine)
+
+    metas = {}
+    for meta in doc.find_all("meta"):
+        key = doc.attr(meta, "property") or doc.attr(meta, "name") or doc.attr(meta, "itemprop")
+        if key and doc.attr(meta, "content"):
+            metas.setdefault(key.lower(), doc.attr(meta, "content").strip())
+    date = next((metas[k] for k in _DATE_META if metas.get(k)), None)
+    if not date:
+        m = _JSONLD_DATE.search(html)
+        date = m.group(1) if m else None
+
+    scope = next(iter(doc.find_all("article")), None)
+    if not date:
+        time_tag = next((t for t in doc.find_all("time", within=scope)
+                         if doc.attr(t, "datetime")), None)
+        date = doc.attr(time_tag, "datetime") if time_tag is not None else None
+
+    paragraphs = [doc.text(p, " ") for p in doc.find_all("p", within=scope)]
+    body = "\n".join(t for t in paragraphs if len(t) >= min_paragraph)
+    return {"body": body, "date": date}
@@ -0,0 +1,133 @@
+"""
+Cache par site des extracteurs presse, rafraîchi en tâche de fond.
+
+/articles ne scrape plus en direct : il lit les derniers articles de chaque
+site. Un site plus vieux que `ttl` est rafraîchi dans un pool borné (un
+seul rafraîchissement en cours par site) pendant qu'on sert la version en
+cache ; un thread de fond repasse toutes les `tick` secondes. Seul un site
+jamais récupéré fait attendre la requête, au plus `cold_timeout` secondes.
+
+Pour chaque site on garde la date de collecte, la durée, les temps de
+téléchargement / d'analyse (extractors/fetching.py) et la dernière erreur,
+renvoyés avec les articles. `enrich(articles)`, si donné, est appliqué
+après l'extracteur (texte intégral, voir enrich.py).
+"""
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from extractors import get_extractor
+from extractors.fetching import page_stats
+
+
+class SiteCache:
+    def __init__(self, sites, ttl=900, max_workers=4, tick=30, cold_timeout=15, enrich=None):
+        self.sites        = list(sites)
+        self.enrich       = enrich
+        self.ttl          = ttl
+        self.tick         = tick
+        self.cold_timeout = cold_timeout
+        self._state       = {}   # site -> {"articles", "fetched_at", "duration", "timings", "error", "error_at"}
+        self._inflight    = {}   # site -> Future
+        self._pool        = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="presse")
+        self._lock        = threading.Lock()
+        self._thread      = None
+        self._stop        = threading.Event()
+
+    # --- rafraîchissement ---------------------------------------------------
+    def _run(self, site):
+        t0 = time.time()
+        try:
+            articles = get_extractor(site)()
+            if self.enrich:
+                articles = self.enrich(articles)
+        except Exception as e:
+            with self._lock:
+                state = self._state.setdefault(site, {"articles": [], "fetched_at": None})
+                state.update(error=f"{type(e).__name__}: {e}", error_at=time.time(),
+                             duration=round(time.time() - t0, 3))
+            return
+        with self._lock:
+            self._state[site] = {"articles": articles, "fetched_at": time.time(),
+                                 "duration": round(time.time() - t0, 3),
+                                 "timings": page_stats(site),
+                                 "error": None, "error_at": None}
+
+    def _stale(self, site, now):
+        state = self._state.get(site)
+        if state is None:
+            return True
+        last = max(state["fetched_at"] or 0, state.get("error_at") or 0)
+        return now - last >= self.ttl
+
+    def refresh(self, sites=None, force=False):
+        """Lance le rafraîchissement des sites périmés ; renvoie {site: Future}."""
+        now, futures = time.time(), {}
+        with self._lock:
+            for site in sites or self.sites:
+                future = self._inflight.get(site)
+                if future is None or future.done():
+                    if not force and not self._stale(site, now):
+                        continue
+                    future = self._pool.submit(self._run, site)
+                    self._inflight[site] = future
+                futures[site] = future
+        return futures
+
+    def get(self, sites):
+        """
+        {site: state} pour /articles : périmés rafraîchis en fond, sites
+        jamais récupérés attendus au plus `cold_timeout` secondes.
+        """
+        futures = self.refresh(sites)
+        with self._lock:
+            cold = [f for s, f in futures.items() if s not in self._state]
+        if cold:
+            wait(cold, timeout=self.cold_timeout)
+        with self._lock:
+            return {s: dict(self._state.get(s) or {"articles": [], "fetched_at": None,
+                                                  "error": "en cours de récupération"})
+                    for s in sites}
+
+    def get_cached(self):
+        """{site: state} tel quel, sans rafraîchir."""
+        with self._lock:
+            return {s: dict(self._state.get(s) or {"articles": [], "fetched_at": None})
+                    for s in self.sites}
+
+    # --- thread de fond -----------------------------------------------------
+    def _loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                traceback.print_exc()   # on garde le thread en vie
+            if self._stop.wait(self.tick):
+                return
+
+    def start(self):
+        """Lance le thread de fond (une seule fois ; sans effet si tick <= 0)."""
+        with self._lock:
+            if self.tick <= 0 or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="presse-refresh", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # --- état ---------------------------------------------------------------
+    def freshness(self, state, now=None):
+        now = now or time.time()
+        fetched = state.get("fetched_at")
+        return {
+            "count":      len(state.get("articles") or ()),
+            "fetched_at": fetched,
+            "age":        round(now - fetched, 1) if fetched else None,
+            "fresh":      bool(fetched) and now - fetched < self.ttl,
+            "duration":   state.get("duration"),
+            "timings":    state.get("timings"),
+            "error":      state.get("error"),
+            "error_at":   state.get("error_at"),
+        }
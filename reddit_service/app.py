@@ -1,69 +1,75 @@
-from flask import Flask, request, jsonify
-import os, re, sys
-from dateutil import parser
-from datetime import datetime, date
+from flask import Flask, request
+import os, sys
 from flask_cors import CORS
 
 from reddit_client import fetch_reddit_posts
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.search import match_query
+from utils.search import QueryMatcher
 
-from utils.lang import detect_language, extract_country
+from utils.lang import detect_languages, extract_country
+from utils.dates import parse_window, filter_window, window_bounds
+from utils import paging
+from utils.sentiment import annotate
 
 app = Flask(__name__)
 CORS(app)
 
+def _normalize(candidates, lang_filter, country_filter):
+    # language detection in batches (cached, see utils.lang) so items stream out early
+    for batch in paging.batched(candidates, 200):
+        langs = detect_languages(body for _, _, body, _ in batch)
+        for (p, title, body, dt), lang in zip(batch, langs):
+            # language filter
+            if lang_filter and lang != lang_filter: continue
+
+            # country detection & filter
+            url = p.get('url','')
+            cc  = extract_country(url)
+            if country_filter and cc != country_filter: continue
+
+            yield {
+                'service': 'reddit',
+                'title':   title,
+                'url':     url,
+                'date':    dt.isoformat(),
+                'langue':  lang,
+                'country': cc
+            }
+
 @app.route("/articles", methods=["GET"])
 def articles():
+    # next page of a previous result (?cursor=), nothing is fetched again
+    page = paging.resume()
+    if page is not None:
+        return page
+
     q              = request.args.get('q','')
-    ex             = [w for w in re.split(r"[,\s]+", request.args.get('exclude','').lower()) if w]
+    matcher        = QueryMatcher(q, request.args.get('exclude',''))
     lang_filter    = request.args.get('lang','').lower()
     country_filter = request.args.get('country','').lower()
     n              = int(request.args.get('n', 1000))  # fetch at least 1000 posts by default
 
     # default date window Jan 1, 2023 - today
-    start_str = request.args.get('start')
-    start = parser.isoparse(start_str).date() if start_str else date(2023, 1, 1)
-    end_str = request.args.get('end')
-    end = parser.isoparse(end_str).date() if end_str else date.today()
+    start, end = parse_window(request.args.get('start'), request.args.get('end'))
 
-    posts = fetch_reddit_posts(q, n)
-    normalized = []
-    for p in posts:
+    # stops paging below `start`; repeat queries only walk posts above the watermark
+    posts = fetch_reddit_posts(q, n, *window_bounds(start, end))
+    dts   = filter_window((p.get('created_utc') for p in posts), start, end)
+    candidates = []
+    for p, dt in zip(posts, dts):
         title    = p.get('title','')
         selftext = p.get('selftext','')
         body     = f"{title}\n\n{selftext}".strip()
 
         # text filters
-        if not match_query(q, body.lower()): continue
-        if ex and any(w in body.lower() for w in ex): continue
-
-        # date filter
-        try:
-            dt = datetime.fromtimestamp(float(p.get('created_utc'))).astimezone()
-        except Exception:
-            continue
-        if dt.date() < start or dt.date() > end: continue
-
-        # language detection & filter
-        lang = detect_language(body)
-        if lang_filter and lang != lang_filter: continue
-
-        # country detection & filter
-        url = p.get('url','')
-        cc  = extract_country(url)
-        if country_filter and cc != country_filter: continue
+        if not matcher(body): continue
 
-        normalized.append({
-            'service': 'reddit',
-            'title':   title,
-            'url':     url,
-            'date':    dt.isoformat(),
-            'langue':  lang,
-            'country': cc
-        })
+        # date filter (created_utc → UTC, see utils.dates)
+        if dt is None: continue
+        candidates.append((p, title, body, dt))
 
-    return jsonify(normalized)
+    # bare list as before, ?limit= pages or ?stream=1 NDJSON (see utils.paging)
+    return paging.respond(annotate(_normalize(candidates, lang_filter, country_filter)))
 
 if __name__ == "__main__":
     app.run(port=5003, debug=True)
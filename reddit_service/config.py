@@ -5,3 +5,12 @@ load_dotenv()
 REDDIT_CLIENT_ID = os.getenv("REDDIT_CLIENT_ID")
 REDDIT_CLIENT_SECRET = os.getenv("REDDIT_CLIENT_SECRET")
 REDDIT_USER_AGENT = os.getenv("REDDIT_USER_AGENT")
+
+# Posts déjà récupérés + filigrane created_utc, par requête normalisée
+STORE_DIR = os.getenv("REDDIT_STORE_DIR", "data/store")
+STORE_MAX = int(os.getenv("REDDIT_STORE_MAX", 5000))
+
+# Recherche éclatée : chaque mot-clé OR (requête avec virgules) est cherché à part
+# dans chacun de ces subreddits (vide = r/all), par un pool borné
+SUBREDDITS     = [s.strip() for s in os.getenv("REDDIT_SUBREDDITS", "").split(",") if s.strip()]
+SEARCH_WORKERS = int(os.getenv("REDDIT_SEARCH_WORKERS", 4))
@@ -0,0 +1,34 @@
+"""
+Stockage local des posts Reddit déjà récupérés, par requête normalisée
+(utils.store.QueryStore, un fichier JSON par requête) :
+
+    {"query":        requête normalisée,
+     "watermark":    created_utc du post le plus récent vu (filigrane),
+     "covered_from": epoch ; tout ce qui est publié entre covered_from et
+                     le filigrane est dans le store (None = rien de couvert),
+     "fetched_at":   epoch du dernier parcours du listing,
+     "posts":        [{id, title, url, created_utc}, ...] du plus récent au plus ancien}
+
+Une requête répétée ne parcourt donc que les posts plus récents que le
+filigrane et, si la fenêtre commence avant covered_from, la suite plus
+ancienne du listing.
+"""
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.store import QueryStore, normalize_query  # noqa: F401
+
+
+class PostStore(QueryStore):
+    ITEMS = "posts"
+    EMPTY = {"watermark": None, "covered_from": None, "fetched_at": 0}
+
+    def order(self, post):
+        return post["created_utc"]
+
+    def merge(self, entry, posts):
+        """Comme QueryStore.merge, puis avance le filigrane."""
+        merged = super().merge(entry, posts)
+        if merged:
+            newest = merged[0]["created_utc"]
+            entry["watermark"] = max(entry["watermark"] or newest, newest)
+        return merged
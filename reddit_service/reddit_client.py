@@ -1,27 +1,150 @@
 import praw
-from config import REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT
+import heapq
+import os, sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import (REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET, REDDIT_USER_AGENT,
+                    STORE_DIR, STORE_MAX, SUBREDDITS, SEARCH_WORKERS)
 from datetime import datetime
+from post_store import PostStore
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.search import compile_query
 
-reddit = praw.Reddit(
-    client_id=REDDIT_CLIENT_ID,
-    client_secret=REDDIT_CLIENT_SECRET,
-    user_agent=REDDIT_USER_AGENT
-)
 
-def fetch_reddit_posts(query: str, limit: int = 20):
-    """Fetch up to `limit` recent reddit posts using pagination."""
+def make_reddit():
+    return praw.Reddit(
+        client_id=REDDIT_CLIENT_ID,
+        client_secret=REDDIT_CLIENT_SECRET,
+        user_agent=REDDIT_USER_AGENT
+    )
+
+
+reddit = make_reddit()
+
+# praw.Reddit n'est pas thread-safe : les recherches passent par un pool
+# de longue durée et chaque thread du pool garde sa propre instance
+_local = threading.local()
+_POOL  = ThreadPoolExecutor(max_workers=SEARCH_WORKERS, thread_name_prefix='reddit')
+
+
+def _reddit():
+    if getattr(_local, 'reddit', None) is None:
+        _local.reddit = make_reddit()
+    return _local.reddit
+
+
+STORE = PostStore(STORE_DIR, STORE_MAX)
+
+def _post(submission):
+    return {
+        'id':          submission.id,
+        'title':       submission.title,
+        'url':         submission.url,
+        'created_utc': submission.created_utc
+    }
+
+
+def walk_listing(listing, stop_before=None, limit=None):
+    """
+    Parcourt un listing trié du plus récent au plus ancien.
+
+    S'arrête dès qu'un post a created_utc < `stop_before` (début de la
+    fenêtre ou filigrane déjà vu) : praw ne demande alors plus de pages.
+    Returns (posts, reason) avec reason 'bound', 'limit' ou 'end'.
+    """
     posts = []
-    for submission in reddit.subreddit('all').search(query, sort='new', limit=None):
-        posts.append({
-            'id':          submission.id,
-            'title':       submission.title,
-            'url':         submission.url,
-            'created_utc': submission.created_utc
-        })
-        if len(posts) >= limit:
+    for submission in listing:
+        if stop_before is not None and submission.created_utc < stop_before:
+            return posts, 'bound'
+        posts.append(_post(submission))
+        if limit and len(posts) >= limit:
+            return posts, 'limit'
+    return posts, 'end'
+
+
+def _in_window(posts, lo, hi):
+    return [p for p in posts
+            if (lo is None or p['created_utc'] >= lo) and (hi is None or p['created_utc'] < hi)]
+
+
+def _fetch_unit(subreddit, keyword, limit, lo, hi):
+    """
+    Posts of one search unit (subreddit × keyword), newest first, within [lo, hi).
+
+    Pagination stops as soon as created_utc falls below `lo`. Posts are kept
+    in STORE per unit: a repeat search only walks the posts newer than its
+    created_utc watermark, plus the older part of the window that was never
+    covered (resumed with `after`).
+    """
+    key = keyword if subreddit == 'all' else f"r/{subreddit} {keyword}"
+    sub = _reddit().subreddit(subreddit)
+    with STORE.lock(key):
+        entry   = STORE.load(key)
+        covered = entry['covered_from']
+
+        # 1) posts plus récents que le filigrane, ou toute la fenêtre si rien n'est couvert
+        bound   = max(entry['watermark'], lo or 0) if covered is not None else lo
+        listing = sub.search(keyword, sort='new', limit=None)
+        posts, reason = walk_listing(listing, bound, limit)
+        STORE.merge(entry, posts)
+        if reason == 'limit':
+            covered = posts[-1]['created_utc']    # trou sous le plus vieux post reçu
+        elif covered is None or (lo is not None and bound == lo and covered < lo):
+            covered = lo or 0                     # filigrane sous la fenêtre : on repart de lo
+        entry['fetched_at'] = time.time()
+
+        # 2) suite plus ancienne de la fenêtre jamais couverte, si elle peut encore servir
+        missing = limit - len(_in_window(entry['posts'], lo, hi)) if limit else None
+        if reason == 'bound' and lo is not None and lo < covered and (missing is None or missing > 0):
+            resume  = min((p for p in entry['posts'] if p['created_utc'] >= covered),
+                          key=lambda p: p['created_utc'], default=None)
+            params  = {'after': f"t3_{resume['id']}"} if resume else {}
+            listing = sub.search(keyword, sort='new', limit=None, params=params)
+            posts, reason = walk_listing(listing, lo, missing)
+            STORE.merge(entry, posts)
+            covered = posts[-1]['created_utc'] if reason == 'limit' else lo
+
+        entry['covered_from'] = covered
+        STORE.save(entry)
+
+    return _in_window(entry['posts'], lo, hi)[:limit]
+
+
+def search_units(query, subreddits=None):
+    """
+    (subreddit, keyword) searches for a query: OR-keywords of a comma query
+    (same split as utils.search) × REDDIT_SUBREDDITS, or the raw query on r/all.
+    """
+    keywords = compile_query(query).keywords or ((query or '').strip(),)
+    return [(sub, kw) for sub in (subreddits or SUBREDDITS or ['all']) for kw in keywords]
+
+
+def fetch_reddit_posts(query: str, limit: int = 20, start=None, end=None, subreddits=None):
+    """
+    Fetch up to `limit` recent reddit posts, newest first, within [start, end).
+
+    A comma query is split into its OR-keywords and each keyword is searched
+    separately (in every configured subreddit) on the bounded search pool,
+    instead of sending the raw comma string as one search. The per-unit
+    streams are merged by created_utc and deduplicated by submission id.
+    """
+    lo = start.timestamp() if start else None
+    hi = end.timestamp() if end else None
+    units   = search_units(query, subreddits)
+    streams = list(_POOL.map(lambda u: _fetch_unit(u[0], u[1], limit, lo, hi), units))
+
+    posts, seen = [], set()
+    for p in heapq.merge(*streams, key=lambda p: -p['created_utc']):
+        if p['id'] in seen:
+            continue
+        seen.add(p['id'])
+        posts.append(p)
+        if limit and len(posts) >= limit:
             break
     return posts
 
+
 def search_posts(query, max_results=50):
     results = []
     for submission in reddit.subreddit("all").search(query, limit=None):
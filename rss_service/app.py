@@ -1,54 +1,85 @@
 from flask import Flask, request, jsonify
-from rss_scraper import collect_all, save_articles, fetch_rss_articles
+from rss_scraper import collect_all, save_articles, fetch_rss_articles, FEED_CACHE
+from entry_index import EntryIndex
+from poller import Poller
+from config import POLL_INTERVAL, CACHE_MAX_AGE
 from flask_cors import CORS
 import re, sys, os
-from dateutil import parser
-from datetime import date
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.search import match_query
+from utils.search import QueryMatcher
+from utils.dates import parse_window, filter_window
+from utils import paging
+from utils.sentiment import annotate
 from langdetect import detect  # optional
 import tldextract          # optional
 
 app = Flask(__name__)
 CORS(app)
 
+# index mémoire rafraîchi en tâche de fond ; /articles le lit dès qu'il est prêt
+INDEX  = EntryIndex(CACHE_MAX_AGE)
+POLLER = Poller(INDEX, POLL_INTERVAL)
+
+@app.before_request
+def _start_poller():
+    # lancé à la première requête et non à l'import (tests, outils) ; avec le
+    # reloader de debug, seul le processus qui sert les requêtes le lance
+    POLLER.start()
+
 @app.route("/collect", methods=["GET"])
 def collect_rss():
-    articles = collect_all("feeds.txt")
+    errors   = []
+    articles = collect_all("feeds.txt", errors=errors)
     path     = save_articles(articles)
-    return jsonify({"status": "ok", "count": len(articles), "fichier": path})
+    return jsonify({"status": "ok", "count": len(articles), "fichier": path, "errors": errors})
 
-@app.route('/articles')
-def articles():
-    q              = request.args.get('q','').lower()
-    ex             = [w for w in re.split(r"[,\s]+", request.args.get('exclude','').lower()) if w]
-    start_str      = request.args.get('start')
-    start          = parser.isoparse(start_str).date() if start_str else date(2023,1,1)
-    end_str        = request.args.get('end')
-    end            = parser.isoparse(end_str).date() if end_str else date.today()
-
-    arts = fetch_rss_articles()
-    normalized = []
-    for a in arts:
+@app.route("/cache", methods=["GET"])
+def cache_stats():
+    """Compteurs du cache des flux (hits = 304 réutilisés)."""
+    return jsonify(FEED_CACHE.stats())
+
+@app.route("/poller", methods=["GET"])
+def poller_status():
+    """État de l'ordonnanceur : flux suivis, en cours, en échec, prochaine échéance."""
+    return jsonify({**POLLER.status(), "freshness": INDEX.freshness()})
+
+def _normalize(arts, dts, matcher):
+    for a, dt in zip(arts, dts):
         title = a.get('title','')
         link  = a.get('link','')
-        # date filter\        
-        try:
-            dt = parser.isoparse(a.get('published'))
-        except:
-            continue
-        if dt.date() < start or dt.date() > end: continue
+        # date filter
+        if dt is None: continue
         # text filters
-        if not match_query(q, title.lower()): continue
-        if ex and any(w in title.lower() for w in ex): continue
+        if not matcher(title): continue
 
-        normalized.append({
+        yield {
             'service': 'rss',
             'title':   title,
             'url':     link,
             'date':    dt.isoformat()
-        })
-    return jsonify(normalized)
+        }
+
+@app.route('/articles')
+def articles():
+    # next page of a previous result (?cursor=), nothing is fetched again
+    page = paging.resume()
+    if page is not None:
+        return page
+
+    q              = request.args.get('q','').lower()
+    matcher        = QueryMatcher(q, request.args.get('exclude',''))
+    start, end     = parse_window(request.args.get('start'), request.args.get('end'))
+
+    if INDEX.ready:
+        arts   = INDEX.between(start, end)
+        errors = INDEX.errors
+    else:
+        errors = []  # flux en échec, renvoyés avec la réponse
+        arts = fetch_rss_articles(errors=errors)
+    dts = filter_window((a.get('published') for a in arts), start, end)
+    # liste complète, pages ?limit= ou flux ?stream=1 (voir utils.paging)
+    return paging.respond(annotate(_normalize(arts, dts, matcher)),
+                          {'errors': errors, 'freshness': INDEX.freshness()})
 
 if __name__ == "__main__":
     app.run(port=5002, debug=True)
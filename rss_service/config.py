@@ -0,0 +1,25 @@
+import os
+from dotenv import load_dotenv
+load_dotenv()
+
+# Téléchargement des flux : taille du pool et délai maximal par flux (secondes)
+FEED_WORKERS = int(os.getenv("RSS_FEED_WORKERS", 8))
+FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", 10))
+
+# Cache des flux (requêtes conditionnelles ETag / Last-Modified)
+CACHE_PATH      = os.getenv("RSS_CACHE_PATH", "data/cache/feeds.json")
+CACHE_MAX_FEEDS = int(os.getenv("RSS_CACHE_MAX_FEEDS", 2000))
+# Rétention (secondes) : un flux du cache non relu depuis CACHE_MAX_AGE est
+# oublié, comme les articles de l'index publiés avant
+CACHE_MAX_AGE   = float(os.getenv("RSS_CACHE_MAX_AGE", 30 * 86400))
+
+# Polling en tâche de fond pour /articles (0 = désactivé, fetch à la demande) ;
+# sert aussi d'intervalle initial pour un flux encore inconnu
+POLL_INTERVAL = float(os.getenv("RSS_POLL_INTERVAL", 300))
+
+# Ordonnancement adaptatif par flux (secondes)
+MIN_INTERVAL     = float(os.getenv("RSS_MIN_INTERVAL", 300))
+MAX_INTERVAL     = float(os.getenv("RSS_MAX_INTERVAL", 6 * 3600))
+MAX_BACKOFF      = float(os.getenv("RSS_MAX_BACKOFF", 24 * 3600))
+POLL_CONCURRENCY = int(os.getenv("RSS_POLL_CONCURRENCY", 16))
+POLL_TICK        = float(os.getenv("RSS_POLL_TICK", 5))
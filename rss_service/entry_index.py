@@ -0,0 +1,116 @@
+"""
+Index mémoire des articles RSS, alimenté par le poller.
+
+Les articles sont dédupliqués par leur id (md5 du lien, comme parse_rss)
+et gardés triés par date de publication : une requête sur une fenêtre de
+dates se fait par recherche dichotomique (bisect) au lieu d'un parcours.
+
+L'index est borné comme le FeedCache : un article disparaît quand plus
+aucun flux de feeds.txt ne le référence (`retain_feeds`), ou quand il a
+été publié il y a plus de `max_age` secondes (`prune`).
+"""
+import threading
+import time
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta, time as dtime
+
+
+class EntryIndex:
+    def __init__(self, max_age=None):
+        self.max_age = max_age
+        self._items  = {}   # id -> article
+        self._keys   = []   # [(datetime de publication, id)] trié
+        self._feeds  = {}   # id -> {url des flux qui le listent}
+        self._lock   = threading.Lock()
+        self.evictions    = 0
+        self.refreshed_at = None   # fin du dernier passage du poller (epoch)
+        self.errors       = []     # flux en échec lors de ce passage
+
+    def __len__(self):
+        return len(self._items)
+
+    @property
+    def ready(self):
+        return self.refreshed_at is not None
+
+    def _cutoff(self):
+        """Date de publication la plus ancienne gardée (None = pas de limite)."""
+        return datetime.utcfromtimestamp(time.time() - self.max_age) if self.max_age else None
+
+    def upsert(self, articles, feed=None):
+        """Ajoute / met à jour les articles du flux `feed` ; renvoie le nombre de nouveaux."""
+        added, cutoff = 0, self._cutoff()
+        with self._lock:
+            for a in articles:
+                uid = a["id"]
+                key = (datetime.fromisoformat(a["published"]), uid)
+                if cutoff is not None and key[0] < cutoff:
+                    continue            # déjà hors rétention
+                if feed is not None:
+                    self._feeds.setdefault(uid, set()).add(feed)
+                old = self._items.get(uid)
+                if old is None:
+                    added += 1
+                elif old["published"] != a["published"]:
+                    old_key = (datetime.fromisoformat(old["published"]), uid)
+                    del self._keys[bisect_left(self._keys, old_key)]
+                else:
+                    self._items[uid] = a
+                    continue
+                self._items[uid] = a
+                insort(self._keys, key)
+        return added
+
+    def _drop(self, uids):
+        uids = set(uids)
+        if uids:
+            self._keys = [k for k in self._keys if k[1] not in uids]
+            for uid in uids:
+                del self._items[uid]
+                self._feeds.pop(uid, None)
+            self.evictions += len(uids)
+        return len(uids)
+
+    def retain_feeds(self, urls):
+        """Oublie les articles qu'aucun des flux `urls` ne liste plus ; renvoie leur nombre."""
+        urls = set(urls)
+        with self._lock:
+            gone = []
+            for uid, feeds in self._feeds.items():
+                feeds &= urls           # en place : les flux retirés sont oubliés partout
+                if not feeds:
+                    gone.append(uid)
+            return self._drop(gone)
+
+    def prune(self):
+        """Oublie les articles publiés avant la rétention ; renvoie leur nombre."""
+        cutoff = self._cutoff()
+        if cutoff is None:
+            return 0
+        with self._lock:
+            # les clés sont triées par date : les trop anciennes sont en tête
+            return self._drop(uid for _, uid in self._keys[:bisect_left(self._keys, (cutoff,))])
+
+    def mark_refreshed(self, errors=()):
+        with self._lock:
+            self.refreshed_at = time.time()
+            self.errors = list(errors)
+
+    def between(self, start, end):
+        """Articles publiés entre les dates `start` et `end` (incluses), du plus récent au plus ancien."""
+        lo = (datetime.combine(start, dtime.min),)
+        hi = (datetime.combine(end + timedelta(days=1), dtime.min),)
+        with self._lock:
+            i, j = bisect_left(self._keys, lo), bisect_left(self._keys, hi)
+            return [self._items[uid] for _, uid in reversed(self._keys[i:j])]
+
+    def freshness(self):
+        with self._lock:
+            return {
+                "refreshed_at": datetime.utcfromtimestamp(self.refreshed_at).isoformat() + "Z"
+                                if self.refreshed_at else None,
+                "age_seconds":  round(time.time() - self.refreshed_at, 1)
+                                if self.refreshed_at else None,
+                "entries":      len(self._items),
+                "evictions":    self.evictions,
+            }
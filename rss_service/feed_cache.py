@@ -0,0 +1,122 @@
+"""
+Cache persistant des flux RSS.
+
+Pour chaque URL on garde les validateurs HTTP (ETag / Last-Modified) et
+les entrées déjà parsées : un 304 Not Modified réutilise directement ces
+entrées, sans re-télécharger ni re-parser le flux.
+
+Le cache est borné en nombre de flux (éviction LRU) et en âge (un flux non
+relu depuis `max_age` secondes est oublié), et sauvegardé en JSON pour
+survivre aux redémarrages.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class FeedCache:
+    def __init__(self, path, max_feeds=2000, max_age=None):
+        self.path      = path
+        self.max_feeds = max_feeds
+        self.max_age   = max_age
+        self._feeds    = OrderedDict()   # url -> {"etag", "modified", "feed", "fetched_at"}
+        self._lock     = threading.Lock()
+        self._dirty    = False
+        self.counters  = {"hits": 0, "misses": 0, "errors": 0, "evictions": 0, "bytes": 0}
+        self._load()
+
+    # --- persistance ----------------------------------------------------
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return  # cache corrompu : on repart de zéro
+        for url, item in data.get("feeds", {}).items():
+            self._feeds[url] = item
+        self._evict()
+
+    def save(self):
+        """Écrit le cache sur disque (atomique) s'il a changé."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"feeds": dict(self._feeds)}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def _evict(self):
+        # ordre LRU = ordre de fetched_at : le flux le plus ancien est en tête
+        cutoff = time.time() - self.max_age if self.max_age else None
+        while self._feeds:
+            oldest = next(iter(self._feeds.values()))
+            expired = cutoff is not None and oldest.get("fetched_at", 0) < cutoff
+            if len(self._feeds) <= self.max_feeds and not expired:
+                return
+            self._feeds.popitem(last=False)
+            self.counters["evictions"] += 1
+            self._dirty = True
+
+    # --- accès ------------------------------------------------------------
+    def validators(self, url):
+        """En-têtes conditionnels à envoyer pour `url` (vide si inconnu)."""
+        with self._lock:
+            item = self._feeds.get(url)
+            if not item:
+                return {}
+            headers = {}
+            if item.get("etag"):
+                headers["If-None-Match"] = item["etag"]
+            if item.get("modified"):
+                headers["If-Modified-Since"] = item["modified"]
+            return headers
+
+    def hit(self, url):
+        """304 reçu : renvoie les entrées parsées en cache."""
+        with self._lock:
+            item = self._feeds.get(url)
+            if item is None:
+                return None
+            self._feeds.move_to_end(url)
+            item["fetched_at"] = time.time()
+            self.counters["hits"] += 1
+            self._dirty = True
+            return item["feed"]
+
+    def store(self, url, feed, etag=None, modified=None, size=0):
+        """200 reçu : mémorise le flux parsé et ses validateurs."""
+        with self._lock:
+            self._feeds[url] = {
+                "etag":       etag,
+                "modified":   modified,
+                "feed":       feed,
+                "fetched_at": time.time(),
+            }
+            self._feeds.move_to_end(url)
+            self.counters["misses"] += 1
+            self.counters["bytes"]  += size
+            self._dirty = True
+            self._evict()
+
+    def error(self):
+        with self._lock:
+            self.counters["errors"] += 1
+
+    def stats(self):
+        with self._lock:
+            done = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "feeds":    len(self._feeds),
+                "hit_rate": round(self.counters["hits"] / done, 3) if done else 0.0,
+            }
@@ -0,0 +1,101 @@
+"""
+Poller de fond : interroge les flux de feeds.txt selon l'ordonnanceur
+adaptatif (scheduler.py) et alimente l'EntryIndex servi par /articles.
+
+Un premier passage complet remplit l'index au démarrage ; ensuite seuls
+les flux arrivés à échéance sont interrogés, `POLL_CONCURRENCY` au plus.
+Quand feeds.txt change, l'index oublie les articles des flux retirés ;
+après chaque passage, ceux sortis de la rétention.
+"""
+import threading
+import time
+import traceback
+
+from config import (MIN_INTERVAL, MAX_INTERVAL, MAX_BACKOFF,
+                    POLL_CONCURRENCY, POLL_TICK)
+from rss_scraper import FEED_CACHE, fetch_feeds, feed_articles, read_feed_urls
+from scheduler import FeedScheduler
+
+
+class Poller:
+    def __init__(self, index, interval, feeds_file="feeds.txt"):
+        self.index      = index
+        self.interval   = interval
+        self.feeds_file = feeds_file
+        self.scheduler  = FeedScheduler(MIN_INTERVAL, MAX_INTERVAL, MAX_BACKOFF,
+                                        default_interval=interval)
+        self.failing    = {}   # url -> dernière erreur
+        self._urls      = None # liste de flux du dernier passage
+        self._lock      = threading.Lock()
+        self._thread    = None
+        self._stop      = threading.Event()
+
+    def _poll(self, urls):
+        feeds, errors = fetch_feeds(urls, max_workers=POLL_CONCURRENCY, cache=FEED_CACHE)
+        now = time.time()
+        added = 0
+        with self._lock:
+            for url, feed in feeds.items():
+                if self._urls is not None and url not in self._urls:
+                    continue            # retiré de feeds.txt pendant le téléchargement
+                added += self.index.upsert(feed_articles(feed), feed=url)
+                self.scheduler.record_success(url, [e["published"] for e in feed["entries"]], now)
+                self.failing.pop(url, None)
+            for err in errors:
+                self.scheduler.record_failure(err["url"], now)
+                self.failing[err["url"]] = err
+            self.index.prune()
+            self.index.mark_refreshed(self.failing.values())
+        return added
+
+    def _sync(self, urls, now):
+        """Aligne ordonnanceur et index sur feeds.txt (appelé sous self._lock)."""
+        self.scheduler.sync(urls, now)
+        if set(urls) != self._urls:
+            self._urls = set(urls)
+            self.index.retain_feeds(self._urls)
+            for url in list(self.failing):
+                if url not in self._urls:
+                    del self.failing[url]
+
+    def run_once(self):
+        """Passage complet sur tous les flux (remplissage initial)."""
+        urls = read_feed_urls(self.feeds_file)
+        with self._lock:
+            self._sync(urls, time.time())
+            urls = self.scheduler.due(float("inf"), len(urls))
+        return self._poll(urls)
+
+    def tick(self):
+        """Interroge les flux arrivés à échéance ; renvoie le nb de nouveaux articles."""
+        now = time.time()
+        with self._lock:
+            self._sync(read_feed_urls(self.feeds_file), now)
+            urls = self.scheduler.due(now, POLL_CONCURRENCY)
+        return self._poll(urls) if urls else 0
+
+    def _loop(self):
+        try:
+            self.run_once()
+        except Exception:
+            traceback.print_exc()
+        while not self._stop.wait(POLL_TICK):
+            try:
+                self.tick()
+            except Exception:
+                traceback.print_exc()  # on garde le thread en vie
+
+    def start(self):
+        """Lance le thread de fond (une seule fois ; sans effet si interval <= 0)."""
+        with self._lock:
+            if self.interval <= 0 or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="rss-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        with self._lock:
+            return self.scheduler.status(time.time())
@@ -43,102 +43,220 @@
 
 
 import feedparser
+import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 import os
+import time
 import hashlib
 import json
+from config import FEED_WORKERS, FEED_TIMEOUT, CACHE_PATH, CACHE_MAX_FEEDS, CACHE_MAX_AGE
+from feed_cache import FeedCache
 
 # --- Paramètres personnalisables ---
 KEYWORDS = ["sonko", "diomaye", "newdealtechnologique", "mntc"]
 START_DATE = datetime(2025, 7, 1)  # articles à partir de cette date
 
+HEADERS = {"User-Agent": "comTracker-rss/1.0 (+feedparser)"}
+
+# cache partagé par /collect et /articles (voir feed_cache.py)
+FEED_CACHE = FeedCache(CACHE_PATH, CACHE_MAX_FEEDS, CACHE_MAX_AGE)
+
 def contains_keywords(text):
     text = text.lower()
     return any(kw in text for kw in KEYWORDS)
 
-def parse_rss(url):
-    feed = feedparser.parse(url)
-    articles = []
+def read_feed_urls(feeds_file="feeds.txt"):
+    with open(feeds_file, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
 
+# ---------------------------------------------------------------------
+# Téléchargement
+# ---------------------------------------------------------------------
+def _simplify(feed):
+    """Réduit un résultat feedparser à un dict JSON-sérialisable."""
+    entries = []
     for entry in feed.entries:
         pub_date = None
-        if "published_parsed" in entry and entry.published_parsed:
+        if entry.get("published_parsed"):
             pub_date = datetime(*entry.published_parsed[:6])
-        elif "updated_parsed" in entry and entry.updated_parsed:
+        elif entry.get("updated_parsed"):
             pub_date = datetime(*entry.updated_parsed[:6])
-        else:
-            continue  # impossible de déterminer la date
 
+        entries.append({
+            "title":     entry.get("title", ""),
+            "summary":   entry.get("summary", ""),
+            "link":      entry.get("link", ""),
+            "published": pub_date.isoformat() if pub_date else None,
+            "tags":      [tag["term"] for tag in entry.get("tags", [])],
+        })
+    return {"title": feed.feed.get("title", ""), "entries": entries}
+
+def download_feed(url, timeout=FEED_TIMEOUT, cache=None, conditional=True):
+    """
+    Télécharge et parse un flux. `timeout` borne la durée *totale* du
+    téléchargement (un serveur qui distille les octets ne bloque pas).
+    Avec `cache`, la requête est conditionnelle et un 304 renvoie les
+    entrées déjà parsées. Lève une exception en cas d'échec.
+    """
+    headers = dict(HEADERS)
+    if cache is not None and conditional:
+        headers.update(cache.validators(url))
+
+    started, evicted = time.monotonic(), False
+    try:
+        with requests.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+            if resp.status_code == 304:
+                feed = cache.hit(url) if cache is not None else None
+                if feed is not None:
+                    return feed
+                evicted = True
+            else:
+                resp.raise_for_status()
+                chunks = []
+                for chunk in resp.iter_content(64 * 1024):
+                    chunks.append(chunk)
+                    if time.monotonic() - started > timeout:
+                        raise TimeoutError(f"délai dépassé ({timeout}s)")
+                etag, modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+        if not evicted:
+            body = b"".join(chunks)
+            feed = feedparser.parse(body)
+            if feed.bozo and not feed.entries:
+                raise ValueError(f"flux illisible : {feed.get('bozo_exception')}")
+    except Exception:
+        if cache is not None:
+            cache.error()
+        raise
+
+    if evicted:
+        # entrée évincée entre-temps : on redemande le flux complet, hors du
+        # try ci-dessus pour qu'un échec de la relance ne compte qu'une erreur
+        return download_feed(url, timeout, cache, conditional=False)
+
+    feed = _simplify(feed)
+    if cache is not None:
+        cache.store(url, feed, etag=etag, modified=modified, size=len(body))
+    return feed
+
+def fetch_feeds(urls, max_workers=FEED_WORKERS, timeout=FEED_TIMEOUT, cache=None):
+    """
+    Télécharge les flux en parallèle avec un pool borné.
+
+    Renvoie (feeds, errors) :
+      feeds  = {url: {"title", "entries"}} pour les flux lus
+      errors = [{"url", "error"}] pour les flux en échec (le reste continue)
+    `max_workers=1` revient au mode séquentiel ; `cache` (FeedCache) active
+    les requêtes conditionnelles et est sauvegardé en fin de tournée.
+    """
+    feeds, errors = {}, []
+    if not urls:
+        return feeds, errors
+
+    started = {}
+    def _run(url):
+        started[url] = time.monotonic()
+        return download_feed(url, timeout, cache)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls))))
+    pending = {pool.submit(_run, url): url for url in urls}
+    try:
+        while pending:
+            done, _ = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+            for fut in done:
+                url = pending.pop(fut)
+                try:
+                    feeds[url] = fut.result()
+                except Exception as e:
+                    errors.append({"url": url, "error": f"{type(e).__name__}: {e}"})
+
+            # un flux qui dépasse son délai est abandonné : on n'attend pas
+            # le thread, qui finira de lui-même (délai socket de requests)
+            now = time.monotonic()
+            for fut, url in list(pending.items()):
+                if url in started and now - started[url] > timeout:
+                    del pending[fut]
+                    errors.append({"url": url, "error": f"TimeoutError: délai dépassé ({timeout}s)"})
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    if cache is not None:
+        cache.save()
+    return feeds, errors
+
+# ---------------------------------------------------------------------
+# Mise en forme
+# ---------------------------------------------------------------------
+def _relevant_entries(feed):
+    """Entrées datées, postérieures à START_DATE et contenant un mot-clé."""
+    for entry in feed["entries"]:
+        if not entry["published"]:
+            continue  # impossible de déterminer la date
+        pub_date = datetime.fromisoformat(entry["published"])
         if pub_date < START_DATE:
             continue  # trop ancien
 
-        title = entry.title
-        summary = entry.get("summary", "")
-        full_text = title + "\n\n" + summary
-
+        full_text = f"{entry['title']}\n\n{entry['summary']}"
         if not contains_keywords(full_text):
             continue  # pas pertinent
+        yield entry, pub_date, full_text
 
-        uid = hashlib.md5(entry.link.encode()).hexdigest()
-        article = {
-            "id": uid,
-            "date": pub_date.isoformat(),
-            "source": "rss",
-            "texte": full_text,
-            "métadonnées": {
-                "lien": entry.link,
-                "source_title": feed.feed.get("title", ""),
-                "tags": [tag["term"] for tag in entry.get("tags", [])] if "tags" in entry else []
-            }
+def _to_article(entry, pub_date, full_text, feed):
+    uid = hashlib.md5(entry["link"].encode()).hexdigest()
+    return {
+        "id": uid,
+        "date": pub_date.isoformat(),
+        "source": "rss",
+        "texte": full_text,
+        "métadonnées": {
+            "lien": entry["link"],
+            "source_title": feed["title"],
+            "tags": entry["tags"]
         }
-        articles.append(article)
-    return articles
-
-def collect_all(feeds_file="feeds.txt"):
-    articles = []
-    with open(feeds_file, "r") as f:
-        urls = f.read().splitlines()
-    for url in urls:
-        articles.extend(parse_rss(url))
-    return articles
+    }
 
-def fetch_rss_articles(feeds_file="feeds.txt"):
-    articles = []
-    with open(feeds_file, encoding="utf-8") as f:
-        feed_urls = [line.strip() for line in f if line.strip()]
-
-    for url in feed_urls:
-        feed = feedparser.parse(url)
-        for entry in feed.entries:
-            # 1) déterminer la date de publication
-            pub_date = None
-            if getattr(entry, "published_parsed", None):
-                pub_date = datetime(*entry.published_parsed[:6])
-            elif getattr(entry, "updated_parsed", None):
-                pub_date = datetime(*entry.updated_parsed[:6])
-            else:
-                continue
+def parse_rss(url):
+    feed = _simplify(feedparser.parse(url))
+    return [_to_article(e, d, t, feed) for e, d, t in _relevant_entries(feed)]
 
-            # 2) date >= START_DATE ?
-            if pub_date < START_DATE:
-                continue
+def collect_all(feeds_file="feeds.txt", errors=None):
+    """
+    Collecte complète au format brut. Les flux en échec sont ajoutés à
+    `errors` (si fourni) au lieu d'interrompre la collecte.
+    """
+    urls = read_feed_urls(feeds_file)
+    feeds, failed = fetch_feeds(urls, cache=FEED_CACHE)
+    if errors is not None:
+        errors.extend(failed)
 
-            # 3) constituer le texte à filtrer
-            title   = entry.get("title", "")
-            summary = entry.get("summary", "")
-            full_text = f"{title}\n\n{summary}"
+    articles = []
+    for url in urls:  # ordre de feeds.txt
+        feed = feeds.get(url)
+        if feed:
+            articles.extend(_to_article(e, d, t, feed) for e, d, t in _relevant_entries(feed))
+    return articles
 
-            # 4) mot-clé présent ?
-            if not contains_keywords(full_text):
-                continue
+def feed_articles(feed):
+    """Articles au format frontend pour un flux déjà téléchargé."""
+    return [{
+        "id":        hashlib.md5(entry["link"].encode()).hexdigest(),
+        "title":     entry["title"],
+        "link":      entry["link"],
+        "published": pub_date.isoformat()
+    } for entry, pub_date, _ in _relevant_entries(feed)]
 
-            # 5) on normalise le format pour le frontend
-            articles.append({
-                "title":     title,
-                "link":      entry.get("link"),
-                "published": pub_date.isoformat()
-            })
+def fetch_rss_articles(feeds_file="feeds.txt", errors=None):
+    """Articles au format frontend ; voir collect_all pour `errors`."""
+    urls = read_feed_urls(feeds_file)
+    feeds, failed = fetch_feeds(urls, cache=FEED_CACHE)
+    if errors is not None:
+        errors.extend(failed)
 
+    articles = []
+    for url in urls:
+        feed = feeds.get(url)
+        if feed:
+            articles.extend(feed_articles(feed))
     return articles
 
 def save_articles(articles):
@@ -0,0 +1,151 @@
+"""
+Ordonnanceur adaptatif des flux RSS.
+
+Chaque flux a son propre intervalle de polling, appris à partir des dates
+de ses entrées : un flux qui publie toutes les heures est interrogé
+souvent, un flux dormant rarement. Les flux en échec reculent en backoff
+exponentiel et chaque échéance reçoit un peu de jitter pour étaler la
+charge. `due()` ne rend jamais plus de `limit` flux à la fois, ce qui
+plafonne la concurrence globale.
+
+Toutes les méthodes prennent `now` (epoch) pour pouvoir être simulées.
+"""
+import heapq
+import math
+import random
+from datetime import datetime, timezone
+
+# Intervalle de polling = sqrt(intervalle de publication * REFERENCE) :
+# à budget de requêtes égal, c'est la répartition qui minimise le délai
+# moyen de découverte. Un flux qui publie toutes les 30 min est interrogé
+# toutes les 30 min, un flux 100x plus lent seulement 10x moins souvent.
+REFERENCE   = 1800
+SMOOTHING   = 0.5   # poids de la nouvelle estimation (moyenne exponentielle)
+WINDOW      = 20    # nb d'entrées récentes utilisées pour estimer le rythme
+
+
+class FeedState:
+    __slots__ = ("url", "interval", "next_due", "failures", "last_polled", "in_flight")
+
+    def __init__(self, url, interval, next_due):
+        self.url         = url
+        self.interval    = interval
+        self.next_due    = next_due
+        self.failures    = 0
+        self.last_polled = None
+        self.in_flight   = False
+
+
+def _epoch(value):
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class FeedScheduler:
+    def __init__(self, min_interval=300, max_interval=6 * 3600, max_backoff=24 * 3600,
+                 default_interval=None, jitter=0.1, rng=None):
+        self.min_interval     = min_interval
+        self.max_interval     = max_interval
+        self.max_backoff      = max_backoff
+        self.default_interval = default_interval or min_interval
+        self.jitter           = jitter
+        self.rng              = rng or random.Random()
+        self.feeds            = {}   # url -> FeedState
+        self._heap            = []   # [(next_due, url)] avec suppression paresseuse
+        self.requests         = 0
+
+    # --- liste des flux ---------------------------------------------------
+    def sync(self, urls, now):
+        """Aligne l'ordonnanceur sur la liste de flux (ajouts / retraits)."""
+        urls = set(urls)
+        for url in list(self.feeds):
+            if url not in urls:
+                del self.feeds[url]
+        for url in urls - set(self.feeds):
+            # premier passage étalé sur l'intervalle minimal
+            self._schedule(FeedState(url, self.default_interval, 0), now + self.rng.uniform(0, self.min_interval))
+
+    def _schedule(self, state, when):
+        state.next_due = when
+        self.feeds[state.url] = state
+        heapq.heappush(self._heap, (when, state.url))
+
+    def _jittered(self, delay):
+        return delay * self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    # --- sélection ----------------------------------------------------------
+    def due(self, now, limit):
+        """Flux à interroger maintenant, au plus `limit` (y compris ceux déjà en cours)."""
+        in_flight = sum(1 for s in self.feeds.values() if s.in_flight)
+        picked = []
+        while self._heap and self._heap[0][0] <= now and len(picked) + in_flight < limit:
+            when, url = heapq.heappop(self._heap)
+            state = self.feeds.get(url)
+            if state is None or state.next_due != when or state.in_flight:
+                continue  # entrée périmée
+            state.in_flight = True
+            picked.append(url)
+        self.requests += len(picked)
+        return picked
+
+    def next_due_in(self, now):
+        while self._heap:
+            when, url = self._heap[0]
+            state = self.feeds.get(url)
+            if state is not None and state.next_due == when and not state.in_flight:
+                return max(0.0, when - now)
+            heapq.heappop(self._heap)
+        return None
+
+    # --- retour d'un polling -----------------------------------------------
+    def estimate(self, entry_times, now):
+        """Intervalle de publication estimé (s) à partir des dates d'entrées."""
+        times = sorted((_epoch(t) for t in entry_times if t), reverse=True)[:WINDOW]
+        if len(times) < 2:
+            return None
+        gap = (times[0] - times[-1]) / (len(times) - 1)
+        # un flux silencieux depuis longtemps est traité comme dormant
+        silence = now - times[0]
+        return max(gap, silence / 2)
+
+    def record_success(self, url, entry_times, now):
+        state = self.feeds.get(url)
+        if state is None:
+            return
+        gap = self.estimate(entry_times, now)
+        if gap is None:
+            target = state.interval * 1.5            # rien à apprendre : on ralentit
+        else:
+            target = math.sqrt(gap * REFERENCE)
+        interval = SMOOTHING * target + (1 - SMOOTHING) * state.interval
+        state.interval    = min(self.max_interval, max(self.min_interval, interval))
+        state.failures    = 0
+        state.last_polled = now
+        state.in_flight   = False
+        self._schedule(state, now + self._jittered(state.interval))
+
+    def record_failure(self, url, now):
+        state = self.feeds.get(url)
+        if state is None:
+            return
+        state.failures   += 1
+        state.last_polled = now
+        state.in_flight   = False
+        delay = min(self.max_backoff, state.interval * 2 ** state.failures)
+        self._schedule(state, now + self._jittered(delay))
+
+    def status(self, now):
+        polled = [s.last_polled for s in self.feeds.values() if s.last_polled]
+        return {
+            "feeds":          len(self.feeds),
+            "in_flight":      sum(1 for s in self.feeds.values() if s.in_flight),
+            "failing":        sum(1 for s in self.feeds.values() if s.failures),
+            "requests":       self.requests,
+            "next_due_in":    self.next_due_in(now),
+            "oldest_poll_age": round(now - min(polled), 1) if polled else None,
+        }
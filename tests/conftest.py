@@ -0,0 +1,39 @@
+"""
+Chaque service s'exécute depuis son dossier et importe ses modules à plat
+(`app`, `config`...) : la fixture `service` charge un service comme
+`python app.py` le ferait, puis retire ses modules pour le suivant.
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def _flat_modules(folder):
+    return {f[:-3] for f in os.listdir(folder) if f.endswith(".py")} | {
+        d for d in os.listdir(folder) if os.path.isfile(os.path.join(folder, d, "__init__.py"))}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    loaded = []
+
+    def load(name, module="app"):
+        folder = os.path.join(ROOT, name)
+        names  = _flat_modules(folder)
+        for mod in [m for m in sys.modules if m.split(".")[0] in names]:
+            monkeypatch.delitem(sys.modules, mod)
+        monkeypatch.chdir(folder)
+        monkeypatch.syspath_prepend(folder)
+        loaded.append(names)
+        return importlib.import_module(module)
+
+    yield load
+    for names in loaded:
+        for mod in [m for m in sys.modules if m.split(".")[0] in names]:
+            del sys.modules[mod]
@@ -0,0 +1,25 @@
+"""utils.disk_cache.DiskCache : clé sans le secret, TTL, `keep`."""
+import os
+import time
+
+from utils.disk_cache import DiskCache
+
+
+def test_hit_ignores_secret_and_expires(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60, secret="api_key")
+    cache.put({"q": "sonko", "api_key": "a"}, {"items": [1]})
+    assert cache.get({"q": "sonko", "api_key": "b"}) == {"items": [1]}
+    assert cache.get({"q": "diomaye"}) is None
+
+    path = cache._path({"q": "sonko"})
+    os.utime(path, (time.time() - 120, time.time() - 120))
+    assert cache.get({"q": "sonko"}) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "hit_rate": 0.333}
+
+
+def test_keep_and_zero_ttl(tmp_path):
+    cache = DiskCache(str(tmp_path), ttl=60, keep=lambda d: "error" not in d)
+    cache.put({"q": "x"}, {"error": "quota"})
+    assert cache.get({"q": "x"}) is None
+    DiskCache(str(tmp_path), ttl=0).put({"q": "y"}, {})
+    assert cache.get({"q": "y"}) is None
@@ -0,0 +1,24 @@
+"""Gateway : clé de dédoublonnage, noms des sources dans /stats."""
+import pytest
+
+
+@pytest.mark.parametrize("url, key", [
+    ("https://www.Seneweb.com/news/a/?utm_source=x&b=2#top", "seneweb.com/news/a?b=2"),
+    ("http://example.org:8080/x", "example.org:8080/x"),
+    # mal formées : gardées telles quelles au lieu de lever ValueError
+    ("http://host:abc/x", "http://host:abc/x"),
+    (" http://[::1/x ", "http://[::1/x"),
+])
+def test_canonical_url(service, url, key):
+    assert service("gateway_service", "fanout").canonical_url(url) == key
+
+
+def test_stats_top_sources_use_frontend_labels(service):
+    client = service("gateway_service").app.test_client()
+    arts = [{"service": "rss", "date": "2025-07-21T10:00:00"},
+            {"service": "RSS", "date": "2025-07-21T11:00:00"},   # déjà étiqueté par le frontend
+            {"service": "presse", "date": "2025-07-21T12:00:00"},
+            {"url": "https://seneweb.com/a", "date": "2025-07-21T12:00:00"}]
+    stats = client.post("/stats", json={"articles": arts}).get_json()["stats"]
+    assert stats["topSources"] == [{"name": "RSS", "count": 2}, {"name": "Presse", "count": 1},
+                                   {"name": "seneweb.com", "count": 1}]
@@ -0,0 +1,57 @@
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture
+def linkedin(service, monkeypatch):
+    app = service("linkedin_service")
+    client = __import__("linkedin_client")
+    calls = []
+
+    def no_serpapi(self):
+        calls.append(self.params_dict)
+        raise AssertionError("appel SerpAPI inattendu")
+
+    monkeypatch.setattr(client.GoogleSearch, "get_dict", no_serpapi)
+    monkeypatch.setattr(client.CACHE, "ttl", 0)      # pas de réponse en cache disque non plus
+    return app, client, calls
+
+
+def _posts(name):
+    with open(os.path.join("data", name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("query, export", [
+    ("alioune sall", "alioune-sall.json"),
+    ("alioune sall ministere de la communiation", "alioune-sall-ministere-de-la-communiation.json"),
+])
+def test_full_query_files_are_served_without_serpapi(linkedin, query, export):
+    _, client, calls = linkedin
+    records, report = client.collect_posts(query, 1000)
+    assert [r.item for r in records] == _posts(export)
+    assert report["export"] == export and report["fetched"] == []
+    assert calls == []
+
+
+@pytest.mark.parametrize("keyword", ["sonko", "trump", "diomaye"])
+def test_single_keyword_files_are_usable_for_any_budget(linkedin, keyword):
+    _, client, calls = linkedin
+    records, report = client.collect_posts(keyword, 1000)
+    assert [r.item for r in records] == _posts(f"{keyword}.json")
+    assert report["hits"] == 1 and report["fetched"] == []
+    assert calls == []
+
+
+def test_articles_match_the_old_file_based_handler(linkedin):
+    app, _, calls = linkedin
+    c = app.app.test_client()
+    # même filtre que l'ancien /articles : phrase exacte dans titre + description
+    expected = [p["url"] for p in _posts("alioune-sall.json")
+                if "alioune sall" in f"{p['title']}\n\n{p.get('description') or ''}".lower()]
+    got = c.get("/articles", query_string={"q": "alioune sall"}).get_json()["articles"]
+    assert [a["url"] for a in got] == expected
+    assert c.get("/articles", query_string={"q": "sonko"}).get_json()["articles"]
+    assert calls == []
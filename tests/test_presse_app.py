@@ -0,0 +1,11 @@
+"""Le rafraîchissement des sites presse ne démarre pas à l'import."""
+
+
+def test_refresh_starts_on_first_request(service, monkeypatch):
+    app = service("presse_service")
+    assert app.SITES._thread is None
+    started = []
+    monkeypatch.setattr(app.SITES, "_loop", lambda: started.append(1))
+    app.app.test_client().get("/no-such-route")
+    app.SITES._thread.join(1)
+    assert started == [1]
@@ -0,0 +1,108 @@
+"""
+rss_service : EntryIndex borné comme le FeedCache (les articles des flux
+retirés de feeds.txt et ceux publiés avant la rétention sont oubliés),
+poller lancé à la première requête, relance après un 304 évincé.
+"""
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+DAY = 86400
+
+
+def article(uid, days_ago):
+    published = datetime.utcnow() - timedelta(days=days_ago)
+    return {"id": uid, "title": uid, "link": f"https://example.org/{uid}",
+            "published": published.replace(microsecond=0).isoformat()}
+
+
+def everything(index):
+    return {a["id"] for a in index.between(date(2000, 1, 1), date.today() + timedelta(days=1))}
+
+
+def test_prune_by_age(service):
+    index = service("rss_service", "entry_index").EntryIndex(max_age=30 * DAY)
+    added = index.upsert([article("new", 1), article("edge", 29), article("old", 40)], feed="a")
+    assert added == 2                   # "old" est déjà hors rétention
+    assert everything(index) == {"new", "edge"}
+
+    index.max_age = 10 * DAY
+    assert index.prune() == 1
+    assert everything(index) == {"new"}
+    assert index.freshness()["evictions"] == 1
+
+
+def test_retain_feeds(service):
+    index = service("rss_service", "entry_index").EntryIndex()
+    index.upsert([article("a1", 1), article("shared", 2)], feed="https://a/rss")
+    index.upsert([article("b1", 1), article("shared", 2)], feed="https://b/rss")
+
+    assert index.retain_feeds(["https://a/rss"]) == 1
+    assert everything(index) == {"a1", "shared"}
+    # "shared" n'est plus rattaché à b : il part avec a
+    assert index.retain_feeds([]) == 2
+    assert len(index) == 0
+
+
+def test_poller_forgets_removed_feeds(service, monkeypatch, tmp_path):
+    poller = service("rss_service", "poller")
+    index  = service("rss_service", "entry_index").EntryIndex(max_age=30 * DAY)
+    feeds  = {url: [article(url[-1] + str(i), i) for i in range(3)]
+              for url in ("https://x/a", "https://x/b")}
+    monkeypatch.setattr(poller, "fetch_feeds",
+                        lambda urls, **kw: ({u: {"url": u, "title": "", "entries": []} for u in urls}, []))
+    monkeypatch.setattr(poller, "feed_articles", lambda feed: feeds[feed["url"]])
+
+    feeds_file = tmp_path / "feeds.txt"
+    feeds_file.write_text("https://x/a\nhttps://x/b\n")
+    p = poller.Poller(index, 300, feeds_file=str(feeds_file))
+    assert p.run_once() == 6
+
+    feeds_file.write_text("https://x/a\n")
+    p.tick()
+    assert everything(index) == {"a0", "a1", "a2"}
+
+
+def test_feed_cache_max_age(service, tmp_path):
+    FeedCache = service("rss_service", "feed_cache").FeedCache
+    cache = FeedCache(str(tmp_path / "feeds.json"), max_feeds=10, max_age=DAY)
+    cache.store("https://old/rss", {"title": "", "entries": []})
+    cache._feeds["https://old/rss"]["fetched_at"] = time.time() - 2 * DAY
+    cache.store("https://new/rss", {"title": "", "entries": []})
+    assert cache.stats()["feeds"] == 1 and cache.stats()["evictions"] == 1
+
+
+def test_poller_starts_on_first_request(service, monkeypatch):
+    app = service("rss_service")
+    assert app.POLLER._thread is None       # l'import ne lance rien
+    started = []
+    monkeypatch.setattr(app.POLLER, "_loop", lambda: started.append(1))
+    app.app.test_client().get("/cache")
+    app.POLLER._thread.join(1)
+    assert started == [1]
+
+
+def test_failed_304_retry_counts_one_error(service, monkeypatch, tmp_path):
+    scraper = service("rss_service", "rss_scraper")
+    cache = scraper.FeedCache(str(tmp_path / "feeds.json"))
+
+    class NotModified:
+        status_code = 304
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            return False
+
+    calls = []
+    def get(url, headers, **kw):
+        calls.append(headers)
+        if len(calls) == 1:
+            return NotModified()        # 304, mais l'entrée a été évincée
+        raise ConnectionError("down")
+    monkeypatch.setattr(scraper.requests, "get", get)
+
+    with pytest.raises(ConnectionError):
+        scraper.download_feed("https://x/rss", cache=cache)
+    assert len(calls) == 2 and "If-None-Match" not in calls[1]
+    assert cache.stats()["errors"] == 1
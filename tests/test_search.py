@@ -0,0 +1,93 @@
+import random
+import re
+
+import pytest
+
+from utils import search
+from utils.search import QueryMatcher, match_query, split_exclude
+
+WORDS = ["sonko", "diomaye", "faye", "Ousmane", "SÉNÉGAL", "dakar", "pastef",
+         "foot", "ball", "football", "président", "mctn", "new", "deal", "é"]
+SPACES = [" ", "  ", "\t", "\n", " ", " ", ""]
+
+
+def reference(q, ex, text):
+    """Filtre historique des services : match_query puis any(w in text for w in ex)."""
+    q_raw = (q or "").strip().lower()
+    if not q_raw:
+        ok = True
+    else:
+        low = (text or "").lower()
+        if "," in q_raw:
+            ok = any(kw and kw in low for kw in (k.strip() for k in q_raw.split(",")))
+        else:
+            ok = re.sub(r"\s+", " ", q_raw) in re.sub(r"\s+", " ", low)
+    return ok and not (ex and any(w in (text or "").lower() for w in ex))
+
+
+@pytest.fixture(params=["pyahocorasick", "regex"])
+def backend(request, monkeypatch):
+    if request.param == "pyahocorasick" and search.ahocorasick is None:
+        pytest.skip("pyahocorasick non installé")
+    if request.param == "regex":
+        monkeypatch.setattr(search, "ahocorasick", None)
+    return request.param
+
+
+@pytest.mark.parametrize("q, ex, text, expected", [
+    # phrase : mots consécutifs, espaces quelconques
+    ("ousmane sonko", (), "Le président Ousmane   Sonko à Dakar", True),
+    ("ousmane sonko", (), "Ousmane\n\tSonko", True),
+    ("ousmane sonko", (), "Sonko Ousmane", False),
+    ("ousmane sonko", (), "ousmane-sonko", False),
+    # OR par virgules
+    ("sonko,diomaye", (), "Diomaye Faye", True),
+    ("sonko, diomaye ,", (), "rien à voir", False),
+    (",", (), "n'importe quoi", False),
+    # requête vide : tout passe, sauf les exclus
+    ("", (), "n'importe quoi", True),
+    ("  ", ("foot",), "Football à Dakar", False),
+    # accents et casse : comparaison en minuscules, accents gardés
+    ("sénégal", (), "Le SÉNÉGAL vote", True),
+    ("senegal", (), "Le SÉNÉGAL vote", False),
+    ("PRÉSIDENT", (), "le président", True),
+    # exclusion par sous-chaîne, insensible à la casse
+    ("sonko", ("foot",), "Sonko et le FOOTBALL", False),
+    ("sonko", ("foot",), "Sonko à l'assemblée", True),
+    ("sonko,faye", ("ball", "pastef"), "Faye, Pastef", False),
+])
+def test_cases(backend, q, ex, text, expected):
+    m = QueryMatcher(q, ex)
+    assert m(text) is expected
+    assert m.filter([text]) == [expected]
+    assert m.filter([text.lower()], lowered=True) == [expected]
+    assert m.matches(text) == match_query(q, text) == reference(q, (), text)
+
+
+def test_exclude_string_is_split():
+    assert QueryMatcher("", "foot, Ball pastef").exclude == ("foot", "ball", "pastef")
+    assert split_exclude(" FOOT,,ball\tpastef ") == ["foot", "ball", "pastef"]
+
+
+def _rand_text(rng, n):
+    return "".join(rng.choice(WORDS) + rng.choice(SPACES) for _ in range(n))
+
+
+def _rand_query(rng):
+    kind = rng.random()
+    if kind < 0.1:
+        return rng.choice(["", " ", ",", " , "])
+    if kind < 0.5:
+        return _rand_text(rng, rng.randint(1, 3))
+    return ",".join(_rand_text(rng, rng.randint(0, 2)) for _ in range(rng.randint(2, 4)))
+
+
+def test_random_equivalence(backend):
+    rng = random.Random(7)
+    for _ in range(1500):
+        q  = _rand_query(rng)
+        ex = split_exclude(" ".join(rng.sample(WORDS, rng.randint(0, 2))))
+        m  = QueryMatcher(q, ex)
+        corpus = [_rand_text(rng, rng.randint(0, 12)) for _ in range(20)] + [None, ""]
+        assert m.filter(corpus) == [reference(q, ex, t) for t in corpus], (q, ex)
+        assert [m.matches(t) for t in corpus] == [reference(q, (), t) for t in corpus], q
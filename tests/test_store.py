@@ -0,0 +1,31 @@
+"""utils.store.QueryStore et ses deux sous-classes (twitter, reddit)."""
+from utils.store import QueryStore, normalize_query
+
+
+def test_roundtrip_and_merge(tmp_path):
+    store = QueryStore(str(tmp_path), max_items=3)
+    entry = store.load("  Sonko   Diomaye ")
+    assert entry == {"query": "sonko diomaye", "items": []}
+    store.merge(entry, [{"id": 1}, {"id": 3}])
+    store.merge(entry, [{"id": 2}, {"id": 3, "v": "new"}, {"id": 0}])
+    assert entry["items"] == [{"id": 3, "v": "new"}, {"id": 2}, {"id": 1}]
+    store.save(entry)
+    assert store.load("sonko diomaye") == entry
+    assert store.lock("SONKO diomaye") is store.lock(normalize_query("sonko  diomaye"))
+
+
+def test_service_stores(service, tmp_path):
+    TweetStore = service("twitter_service", "tweet_store").TweetStore
+    tweets = TweetStore(str(tmp_path / "tw"))
+    entry = tweets.load("q")
+    assert entry["since_id"] is None and entry["tweets"] == []
+    tweets.merge(entry, [{"id_str": "9"}, {"id_str": "10"}])
+    assert [t["id_str"] for t in entry["tweets"]] == ["10", "9"]   # ordre numérique
+
+    PostStore = service("reddit_service", "post_store").PostStore
+    posts = PostStore(str(tmp_path / "rd"))
+    entry = posts.load("q")
+    posts.merge(entry, [{"id": "a", "created_utc": 5}, {"id": "b", "created_utc": 7}])
+    assert [p["id"] for p in entry["posts"]] == ["b", "a"] and entry["watermark"] == 7
+    posts.merge(entry, [{"id": "c", "created_utc": 1}])
+    assert entry["watermark"] == 7
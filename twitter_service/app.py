@@ -1,68 +1,79 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import re, sys, os
-from datetime import datetime, date
-from dateutil import parser
-from twitter_client import fetch_tweets
+import sys, os
+from twitter_client import fetch_tweets, LIMITER
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from utils.search import match_query
-from utils.lang import detect_language, extract_country
+from utils.search import QueryMatcher
+from utils.lang import detect_languages, extract_country
+from utils.dates import parse_window, filter_window, window_bounds
+from utils import paging
+from utils.sentiment import annotate
 
 app = Flask(__name__)
 CORS(app)
 
+def _normalize(candidates, lang_filter, country_filter):
+    # language detection in batches (cached, see utils.lang) so items stream out early
+    for batch in paging.batched(candidates, 200):
+        langs = detect_languages(text for _, text, _ in batch)
+        for (t, text, dt), lang in zip(batch, langs):
+            if lang_filter and lang != lang_filter:
+                continue
+
+            url = f"https://twitter.com/i/web/status/{t.get('id_str')}"
+            cc  = extract_country(url)
+            if country_filter and cc != country_filter:
+                continue
+
+            yield {
+                'service': 'twitter',
+                'id':       t.get('id_str'),
+                'title':    text,
+                'url':      url,
+                'date':     dt.isoformat(),
+                'langue':   lang,
+                'country':  cc
+            }
+
 @app.route('/articles', methods=['GET'])
 def articles():
+    # next page of a previous result (?cursor=), nothing is fetched again
+    page = paging.resume()
+    if page is not None:
+        return page
+
     q              = request.args.get('q', '')
-    ex             = [w for w in re.split(r"[,\s]+", request.args.get('exclude', '').lower()) if w]
+    matcher        = QueryMatcher(q, request.args.get('exclude', ''))
     lang_filter    = request.args.get('lang', '').lower()
     country_filter = request.args.get('country', '').lower()
     n              = int(request.args.get('n', 200))  # fetch at least 200 tweets
 
     # default date window Jan 1, 2023 - today
-    start_str = request.args.get('start')
-    start = parser.isoparse(start_str).date() if start_str else date(2023, 1, 1)
-    end_str = request.args.get('end')
-    end = parser.isoparse(end_str).date() if end_str else date.today()
+    start, end = parse_window(request.args.get('start'), request.args.get('end'))
 
-    tweets = fetch_tweets(q, n)
-    normalized = []
-    for t in tweets:
+    # window pushed down to the API; repeat queries only fetch the delta.
+    # never blocks on the rate limit: partial results + retry_after instead
+    tweets, retry_after = fetch_tweets(q, n, *window_bounds(start, end))
+    keep   = matcher.filter(t.get('text', '') for t in tweets)
+    dts    = filter_window((t.get('created_at') for t in tweets), start, end)
+    candidates = []
+    for t, kept, dt in zip(tweets, keep, dts):
         text = t.get('text', '')
-        dt = None
-        try:
-            dt = parser.isoparse(t.get('created_at'))
-        except:
-            try:
-                dt = parser.parse(t.get('created_at'))
-            except:
-                dt = None
-        if not dt or dt.date() < start or dt.date() > end:
-            continue
-        if not match_query(q, text.lower()):
-            continue
-        if ex and any(w in text.lower() for w in ex):
-            continue
-
-        lang = detect_language(text)
-        if lang_filter and lang != lang_filter:
+        if dt is None or not kept:
             continue
+        candidates.append((t, text, dt))
 
-        url = f"https://twitter.com/i/web/status/{t.get('id_str')}"
-        cc  = extract_country(url)
-        if country_filter and cc != country_filter:
-            continue
+    # full list, ?limit= pages or ?stream=1 NDJSON (see utils.paging)
+    resp = paging.respond(annotate(_normalize(candidates, lang_filter, country_filter)),
+                          {'partial': bool(retry_after), 'retry_after': retry_after})
+    if retry_after:
+        resp.headers['Retry-After'] = str(retry_after)
+    return resp
 
-        normalized.append({
-            'service': 'twitter',
-            'id':       t.get('id_str'),
-            'title':    text,
-            'url':      url,
-            'date':     dt.isoformat(),
-            'langue':   lang,
-            'country':  cc
-        })
-    return jsonify(normalized)
+@app.route('/ratelimit', methods=['GET'])
+def ratelimit():
+    """Remaining search/recent budget shared by all requests."""
+    return jsonify(LIMITER.snapshot())
 
 if __name__ == "__main__":
     app.run(port=5001, debug=True)
@@ -0,0 +1,99 @@
+"""
+Token bucket partagé pour l'endpoint search/recent de l'API Twitter v2.
+
+Le seau est recalé sur les en-têtes renvoyés par l'API
+(x-rate-limit-limit / -remaining / -reset) après chaque appel, 429 compris.
+Quand il est vide on ne dort pas : l'appelant arrête la pagination et
+renvoie ce qu'il a, avec `retry_after()` secondes à attendre.
+
+Plusieurs requêtes Flask peuvent paginer en même temps : chacune ouvre un
+`lease()` et, quand il reste peu de jetons, un jeton est gardé pour
+chaque autre requête active afin qu'aucune ne reparte les mains vides.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Lease:
+    __slots__ = ("limiter", "used")
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.used    = 0
+
+    def acquire(self) -> bool:
+        return self.limiter._take(self)
+
+
+class RateLimiter:
+    def __init__(self, limit=450, window=15 * 60):
+        self.limit     = limit        # app-only auth : 450 requêtes / 15 min
+        self.window    = window
+        self.remaining = limit
+        self.reset_at  = time.time() + window
+        self.active    = 0            # leases ouverts
+        self._lock     = threading.Lock()
+
+    def _refill(self, now):
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at  = now + self.window
+
+    def update(self, headers, now=None):
+        """Recale le seau sur les en-têtes x-rate-limit-* d'une réponse."""
+        try:
+            limit     = int(headers["x-rate-limit-limit"])
+            remaining = int(headers["x-rate-limit-remaining"])
+            reset_at  = float(headers["x-rate-limit-reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._lock:
+            self.limit = limit
+            # des appels concurrents ont pu consommer depuis : on garde le plus bas
+            if reset_at > self.reset_at + 1:
+                self.remaining = remaining
+            else:
+                self.remaining = min(self.remaining, remaining)
+            self.reset_at = reset_at
+
+    def exhaust(self, reset_at=None):
+        """429 reçu sans en-têtes exploitables."""
+        with self._lock:
+            self.remaining = 0
+            if reset_at:
+                self.reset_at = reset_at
+
+    def _take(self, lease) -> bool:
+        with self._lock:
+            self._refill(time.time())
+            if self.remaining <= 0:
+                return False
+            # jetons réservés pour la première page des autres requêtes actives
+            if lease.used > 0 and self.remaining <= self.active - 1:
+                return False
+            self.remaining -= 1
+            lease.used += 1
+            return True
+
+    @contextmanager
+    def lease(self):
+        with self._lock:
+            self.active += 1
+        try:
+            yield Lease(self)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def retry_after(self, now=None) -> int:
+        now = now or time.time()
+        with self._lock:
+            if self.remaining > max(0, self.active - 1) and now < self.reset_at:
+                return 0
+            return max(1, int(self.reset_at - now + 1))
+
+    def snapshot(self):
+        with self._lock:
+            return {"limit": self.limit, "remaining": self.remaining,
+                    "reset_at": int(self.reset_at), "active": self.active}
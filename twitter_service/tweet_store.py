@@ -0,0 +1,28 @@
+"""
+Stockage local des tweets déjà récupérés, par requête normalisée
+(utils.store.QueryStore, un fichier JSON par requête) :
+
+    {"query":        requête normalisée,
+     "since_id":     id du tweet le plus récent vu (filigrane),
+     "covered_from", "covered_to": ISO UTC ; tout ce qui est publié dans
+                     cet intervalle est dans le store (None = rien de couvert),
+     "fetched_at":   epoch du dernier appel à l'API,
+     "tweets":       [{id_str, text, created_at}, ...] du plus récent au plus ancien}
+
+Une requête répétée ne demande donc à l'API que le delta (since_id) et,
+si la fenêtre demandée commence avant covered_from, le trou plus ancien.
+"""
+import os, sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.store import QueryStore, normalize_query  # noqa: F401
+
+
+class TweetStore(QueryStore):
+    ITEMS = "tweets"
+    EMPTY = {"since_id": None, "covered_from": None, "covered_to": None, "fetched_at": 0}
+
+    def item_id(self, tweet):
+        return tweet["id_str"]
+
+    def order(self, tweet):
+        return int(tweet["id_str"])
@@ -1,58 +1,212 @@
 import os
 import tweepy
-from datetime import datetime
+from datetime import datetime, timedelta
 import time
 from datetime import timezone
+from requests.adapters import HTTPAdapter
+from rate_limit import RateLimiter
+from tweet_store import TweetStore
 
 BEARER_TOKEN = os.getenv("BEARER_TOKEN")
+# pour tester contre une fausse API locale (ex. http://127.0.0.1:8000)
+API_BASE = os.getenv("TWITTER_API_BASE")
 
-client = tweepy.Client(bearer_token=BEARER_TOKEN)
+SEARCH_ROUTE = "/2/tweets/search/recent"
+LIMITER = RateLimiter()   # partagé par toutes les requêtes du processus
+
+# tweets déjà récupérés + filigrane since_id, par requête normalisée
+STORE = TweetStore(os.getenv("TWITTER_STORE_DIR", "data/store"),
+                   int(os.getenv("TWITTER_STORE_MAX", 5000)))
+# pas de nouvel appel pour le delta si le dernier date de moins de REFRESH s
+REFRESH = float(os.getenv("TWITTER_REFRESH", 60))
+# search/recent ne remonte pas au-delà de 7 jours, et end_time >= now - 10 s
+RECENT_WINDOW = timedelta(days=7) - timedelta(minutes=1)
+END_MARGIN    = timedelta(seconds=10)
+
+
+class _Client(tweepy.Client):
+    """tweepy.Client qui tient LIMITER à jour avec les en-têtes de chaque réponse."""
+
+    def request(self, method, route, params=None, json=None, user_auth=False):
+        try:
+            response = super().request(method, route, params, json, user_auth)
+        except tweepy.TooManyRequests as e:
+            if route == SEARCH_ROUTE:
+                LIMITER.update(e.response.headers)
+                LIMITER.exhaust()
+            raise
+        if route == SEARCH_ROUTE:
+            LIMITER.update(response.headers)
+        return response
+
+
+class _BaseURLAdapter(HTTPAdapter):
+    def __init__(self, base):
+        super().__init__()
+        self.base = base.rstrip("/")
+
+    def send(self, request, **kwargs):
+        request.url = self.base + request.url[len("https://api.twitter.com"):]
+        return super().send(request, **kwargs)
+
+
+client = _Client(bearer_token=BEARER_TOKEN)
+if API_BASE:
+    client.session.mount("https://api.twitter.com", _BaseURLAdapter(API_BASE))
 
 def search_tweets(query, max_results=50):
-    try:
-        response = client.search_recent_tweets(
-            query=query,
-            max_results=min(max_results, 100),
-            tweet_fields=["created_at", "lang", "author_id"]
-        )
-        tweets = []
-        if response.data:
-            for tweet in response.data:
-                tweets.append({
-                    "id": tweet.id,
-                    "date": tweet.created_at.isoformat(),
-                    "source": "twitter",
-                    "texte": tweet.text,
-                    "utilisateur": tweet.author_id,
-                    "métadonnées": {"langue": tweet.lang}
-                })
-        return tweets
-
-    except tweepy.TooManyRequests as e:
-        print("🛑 Limite atteinte, on attend 15 minutes...")
-        time.sleep(15 * 60)
-        return search_tweets(query, max_results)
-    
-def fetch_tweets(q: str, n: int = 20):
-    """Fetch up to `n` recent tweets matching query using pagination."""
+    """Une page de résultats ; [] si le quota est épuisé (pas d'attente)."""
+    with LIMITER.lease() as lease:
+        if not lease.acquire():
+            print(f"🛑 Limite atteinte, réessayer dans {LIMITER.retry_after()}s")
+            return []
+        try:
+            response = client.search_recent_tweets(
+                query=query,
+                max_results=min(max_results, 100),
+                tweet_fields=["created_at", "lang", "author_id"]
+            )
+        except tweepy.TooManyRequests:
+            print(f"🛑 Limite atteinte, réessayer dans {LIMITER.retry_after()}s")
+            return []
+
     tweets = []
-    next_token = None
-    while len(tweets) < n:
-        resp = client.search_recent_tweets(
-            query=q,
-            max_results=min(n - len(tweets), 100),
-            tweet_fields=['id', 'created_at', 'text'],
-            next_token=next_token
-        )
-        if resp.data:
-            for t in resp.data:
-                dt = t.created_at.astimezone(timezone.utc).isoformat()
-                tweets.append({
-                    'id_str':     str(t.id),
-                    'text':       t.text,
-                    'created_at': dt
-                })
-        next_token = getattr(resp.meta, 'next_token', None) if hasattr(resp, 'meta') else None
-        if not next_token:
-            break
+    if response.data:
+        for tweet in response.data:
+            tweets.append({
+                "id": tweet.id,
+                "date": tweet.created_at.isoformat(),
+                "source": "twitter",
+                "texte": tweet.text,
+                "utilisateur": tweet.author_id,
+                "métadonnées": {"langue": tweet.lang}
+            })
     return tweets
+    
+def _parse(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+def _paginate(lease, q, budget, **params):
+    """
+    Pages de search/recent (du plus récent au plus ancien) jusqu'à la fin
+    des résultats ou `budget` tweets.
+
+    Returns (tweets, newest_id, complete, limited).
+    """
+    tweets, newest_id, next_token = [], None, None
+    while len(tweets) < budget:
+        if not lease.acquire():
+            return tweets, newest_id, False, True
+        try:
+            resp = client.search_recent_tweets(
+                query=q,
+                max_results=max(10, min(budget - len(tweets), 100)),
+                tweet_fields=['id', 'created_at', 'text'],
+                next_token=next_token,
+                **params
+            )
+        except tweepy.TooManyRequests:
+            return tweets, newest_id, False, True
+        meta = resp.meta or {}
+        if newest_id is None and meta.get('newest_id'):
+            newest_id = meta['newest_id']
+        for t in resp.data or ():
+            tweets.append({
+                'id_str':     str(t.id),
+                'text':       t.text,
+                'created_at': t.created_at.astimezone(timezone.utc).isoformat()
+            })
+        next_token = meta.get('next_token')
+        if not next_token:
+            return tweets, newest_id, True, False
+    return tweets, newest_id, False, False
+
+
+def _count_between(entry, lo, hi):
+    lo_iso, hi_iso = lo.isoformat(), hi.isoformat()
+    return sum(1 for t in entry['tweets'] if lo_iso <= t['created_at'] < hi_iso)
+
+
+def _newer_id(a, b):
+    if not a or not b:
+        return a or b
+    return a if int(a) > int(b) else b
+
+
+def fetch_tweets(q: str, n: int = 20, start=None, end=None):
+    """
+    Fetch up to `n` recent tweets matching query, newest first.
+
+    `start`/`end` (aware datetimes, end exclusive) are pushed down to the API as
+    start_time/end_time, clamped to the 7-day search/recent window. Tweets
+    are kept in STORE per normalized query: a repeated query only asks the
+    API for tweets newer than its since_id watermark, plus the older part of
+    the window that was never covered when fewer than `n` covered tweets
+    are known.
+
+    Returns (tweets, retry_after): when the rate-limit budget runs out the
+    tweets gathered so far are returned with the number of seconds to wait
+    before retrying (0 when the fetch was complete).
+    """
+    now   = datetime.now(timezone.utc)
+    floor = now - RECENT_WINDOW
+    lo    = max(start or floor, floor)
+    hi    = min(end or now, now - END_MARGIN)
+    retry_after = 0
+
+    with STORE.lock(q):
+        entry = STORE.load(q)
+        covered_from = _parse(entry['covered_from'])
+        covered_to   = _parse(entry.get('covered_to'))
+        with LIMITER.lease() as lease:
+            limited = False
+
+            # 1) partie récente : delta au-dessus du filigrane, ou fetch complet
+            if lo < hi and not (covered_to and hi - covered_to < timedelta(seconds=REFRESH)):
+                params = {'end_time': hi} if hi < now - END_MARGIN else {}
+                contiguous = covered_to is not None and covered_to >= lo
+                newest = entry['tweets'][0]['created_at'] if entry['tweets'] else None
+                if contiguous and entry['since_id'] and newest and _parse(newest) > floor:
+                    params['since_id'] = entry['since_id']
+                elif contiguous:
+                    params['start_time'] = max(covered_to, lo)
+                else:
+                    params['start_time'] = lo        # rien d'exploitable : on repart de lo
+                tweets, newest_id, complete, limited = _paginate(lease, q, n, **params)
+                if tweets or complete:
+                    STORE.merge(entry, tweets)
+                    entry['since_id']   = _newer_id(entry['since_id'], newest_id or (tweets[0]['id_str'] if tweets else None))
+                    entry['fetched_at'] = time.time()
+                    if not complete:
+                        # trou entre l'ancien filigrane et le plus vieux tweet reçu
+                        covered_from = _parse(tweets[-1]['created_at'])
+                    elif not contiguous:
+                        covered_from = lo
+                    covered_to = hi
+
+            # 2) partie ancienne de la fenêtre jamais couverte, seulement s'il
+            #    manque des tweets : n tweets déjà couverts sous hi suffisent
+            #    (les n plus récents sont connus, l'ancienne partie serait coupée)
+            if (not limited and covered_from and lo < covered_from
+                    and _count_between(entry, covered_from, hi) < n):
+                tweets, _, complete, limited = _paginate(
+                    lease, q, n, start_time=lo, end_time=covered_from)
+                STORE.merge(entry, tweets)
+                covered_from = lo if complete else (_parse(tweets[-1]['created_at']) if tweets else covered_from)
+
+            if limited:
+                retry_after = LIMITER.retry_after()
+
+        if covered_from and len(entry['tweets']) >= STORE.max_items:
+            # store plein : les plus anciens tweets en sont sortis
+            covered_from = max(covered_from, _parse(entry['tweets'][-1]['created_at']))
+
+        entry['covered_from'] = covered_from.isoformat() if covered_from else None
+        entry['covered_to']   = covered_to.isoformat() if covered_to else None
+        STORE.save(entry)
+
+    start_iso = start.isoformat() if start else ''
+    end_iso   = end.isoformat() if end else '~'
+    tweets = [t for t in entry['tweets'] if start_iso <= t['created_at'] < end_iso]
+    return tweets[:n], retry_after
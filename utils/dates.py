@@ -0,0 +1,140 @@
+"""
+Date normalisation shared by every /articles handler.
+
+`to_utc` turns whatever a source gives us into a timezone-aware UTC
+datetime (or None):
+
+* datetime objects (naive ones are taken as UTC)
+* epoch seconds / milliseconds, as numbers or numeric strings
+* ISO-8601 strings, via the C-level datetime.fromisoformat fast path
+* relative forms: "3h", "2d", "4w", "today", "Aujourd'hui", "hier",
+  "il y a 3 heures", "5 minutes ago"...
+* anything else dateutil can parse (slow path, only when needed)
+
+`filter_window` is the batch version used by the date-window filters.
+"""
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from dateutil import parser, relativedelta
+
+UTC = timezone.utc
+DEFAULT_START = date(2023, 1, 1)
+
+_EPOCH_RX = re.compile(r"[+-]?\d{9,13}(?:\.\d+)?")
+# “3h”, “2d”, “4w”, “1m” (mois, comme SerpAPI/LinkedIn), “1y”
+_SHORT_RX = re.compile(r"(?P<num>\d+)\s*(?P<unit>[hdwmy])")
+_LONG_RX = re.compile(
+    r"(?:il y a\s+)?(?P<num>\d+)\s*"
+    r"(?P<unit>min(?:ute)?s?|h(?:ou)?rs?|heures?|days?|jours?|weeks?|semaines?|months?|mois|years?|ans?)"
+    r"(?:\s+ago)?"
+)
+_TODAY = {"today", "now", "aujourd'hui", "aujourd’hui", "maintenant"}
+_YESTERDAY = {"yesterday", "hier"}
+
+
+def _delta(num: int, unit: str):
+    u = unit[0]
+    if unit.startswith("min"):
+        return timedelta(minutes=num)
+    if u == "h":
+        return timedelta(hours=num)
+    if u in "dj":
+        return timedelta(days=num)
+    if u in "ws":
+        return timedelta(weeks=num)
+    if unit.startswith("mo") or unit == "m":
+        return relativedelta.relativedelta(months=num)
+    return relativedelta.relativedelta(years=num)   # “y”, “year”, “an”
+
+
+def _aware(dt: datetime) -> datetime:
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+
+
+def _from_epoch(value: float):
+    if abs(value) > 1e11:          # millisecondes
+        value /= 1000.0
+    try:
+        return datetime.fromtimestamp(value, UTC)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def to_utc(value, now: datetime = None):
+    """Normalise `value` to an aware UTC datetime; None if it can't be read."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return _aware(value)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=UTC)
+    if isinstance(value, (int, float)):
+        return _from_epoch(float(value))
+
+    raw = str(value).strip()
+    if not raw:
+        return None
+    # 1) ISO-8601 — by far the most common case
+    try:
+        return _aware(datetime.fromisoformat(raw))
+    except ValueError:
+        pass
+    # 2) epoch sent as a string (Reddit created_utc, …)
+    if _EPOCH_RX.fullmatch(raw):
+        return _from_epoch(float(raw))
+    # 3) relative / French forms
+    low = raw.lower()
+    now = now or datetime.now(UTC)
+    if low in _TODAY:
+        return now
+    if low in _YESTERDAY:
+        return now - timedelta(days=1)
+    m = _SHORT_RX.fullmatch(low) or _LONG_RX.fullmatch(low)
+    if m:
+        return now - _delta(int(m["num"]), m["unit"])
+    # 4) last resort: dateutil
+    try:
+        return _aware(parser.parse(raw))
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def to_utc_many(values, now: datetime = None) -> list:
+    """to_utc over a list; repeated raw values are parsed once."""
+    now = now or datetime.now(UTC)
+    seen = {}
+    out = []
+    for v in values:
+        key = v if isinstance(v, (str, int, float)) else None
+        if key is not None and key in seen:
+            out.append(seen[key])
+            continue
+        dt = to_utc(v, now)
+        if key is not None:
+            seen[key] = dt
+        out.append(dt)
+    return out
+
+
+def parse_window(start_str: str = None, end_str: str = None):
+    """`start`/`end` query parameters → (start_date, end_date), defaults 2023-01-01 → today."""
+    start = to_utc(start_str).date() if start_str else DEFAULT_START
+    end = to_utc(end_str).date() if end_str else datetime.now(UTC).date()
+    return start, end
+
+
+def window_bounds(start: date, end: date):
+    """Whole-day window [start, end] → half-open UTC datetimes [lo, hi)."""
+    lo = datetime(start.year, start.month, start.day, tzinfo=UTC)
+    hi = datetime(end.year, end.month, end.day, tzinfo=UTC) + timedelta(days=1)
+    return lo, hi
+
+
+def filter_window(values, start: date, end: date, now: datetime = None) -> list:
+    """
+    Batch date-window filter: for each raw value, its UTC datetime when
+    it falls within [start, end] (whole days), otherwise None.
+    """
+    lo, hi = window_bounds(start, end)
+    return [dt if dt is not None and lo <= dt < hi else None for dt in to_utc_many(values, now)]
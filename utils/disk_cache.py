@@ -0,0 +1,56 @@
+"""
+TTL disk cache of raw API responses, one JSON file per request.
+
+A response is keyed by its request parameters, minus the API key
+(`secret`), and served from disk while it is less than `ttl` seconds old:
+a repeated collection then costs no API call or quota. `keep(data)`
+decides what is worth storing (e.g. not error payloads). Used by
+youtube_service (search.list pages) and linkedin_service (SerpAPI).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class DiskCache:
+    def __init__(self, directory, ttl, secret="key", keep=None):
+        self.directory = directory
+        self.ttl       = ttl
+        self.secret    = secret
+        self.keep      = keep
+        self._lock     = threading.Lock()
+        self.counters  = {"hits": 0, "misses": 0}
+
+    def _path(self, params):
+        key = json.dumps({k: v for k, v in params.items() if k != self.secret}, sort_keys=True)
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, params):
+        path, data = self._path(params), None
+        try:
+            if time.time() - os.path.getmtime(path) < self.ttl:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        with self._lock:
+            self.counters["hits" if data is not None else "misses"] += 1
+        return data
+
+    def put(self, params, data):
+        if not self.ttl or (self.keep is not None and not self.keep(data)):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(params)
+        tmp  = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def stats(self):
+        with self._lock:
+            done = self.counters["hits"] + self.counters["misses"]
+            return {**self.counters,
+                    "hit_rate": round(self.counters["hits"] / done, 3) if done else 0.0}
@@ -1,9 +1,42 @@
-from langdetect import detect_langs
+import hashlib
+import os
+import pathlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from langdetect import DetectorFactory, detect_langs
 import tldextract
+from tldextract.remote import lenient_netloc
 
+# langdetect is random by default: the same text can come back with a
+# different language from one call to the next. A fixed seed makes it stable.
+DetectorFactory.seed = 0
 
-def detect_language(text: str, threshold: float = 0.8) -> str:
-    """Detect language of text. Returns '' if unsure."""
+MIN_LETTERS   = int(os.getenv("LANG_MIN_LETTERS", 12))    # below: too short, ''
+CACHE_SIZE    = int(os.getenv("LANG_CACHE_SIZE", 50000))
+POOL_MIN_BATCH = int(os.getenv("LANG_POOL_MIN_BATCH", 500))  # misses before using processes
+POOL_WORKERS  = int(os.getenv("LANG_POOL_WORKERS", 0)) or None  # None = os.cpu_count()
+
+# Public suffix list shipped with the repo (utils/data), so tldextract never
+# goes to the network. Refresh it by replacing the file; its "// VERSION:"
+# header is exposed as PSL_VERSION.
+PSL_FILE = os.getenv("PSL_FILE") or os.path.join(os.path.dirname(__file__), "data", "public_suffix_list.dat")
+HOST_CACHE_SIZE = int(os.getenv("COUNTRY_CACHE_SIZE", 8192))
+
+_cache = OrderedDict()          # (digest, threshold) -> lang
+_cache_lock = threading.Lock()
+_pool = None
+_pool_lock = threading.Lock()
+stats = {"hits": 0, "misses": 0, "short": 0}
+
+
+def _seed():
+    DetectorFactory.seed = 0
+
+
+def _detect(text: str, threshold: float) -> str:
     try:
         langs = detect_langs(text)
         if not langs:
@@ -14,12 +47,147 @@ def detect_language(text: str, threshold: float = 0.8) -> str:
         return ''
 
 
+def _too_short(text: str) -> bool:
+    letters = 0
+    for ch in text:
+        if ch.isalpha():
+            letters += 1
+            if letters >= MIN_LETTERS:
+                return False
+    return True
+
+
+def _key(text: str, threshold: float):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest(), threshold
+
+
+def _cache_get(key):
+    with _cache_lock:
+        lang = _cache.get(key)
+        if lang is not None:
+            _cache.move_to_end(key)
+            stats["hits"] += 1
+        return lang
+
+
+def _cache_put(key, lang):
+    with _cache_lock:
+        _cache[key] = lang
+        stats["misses"] += 1
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS, initializer=_seed)
+        return _pool
+
+
+def detect_language(text: str, threshold: float = 0.8) -> str:
+    """Detect language of text. Returns '' if unsure."""
+    text = text or ''
+    if _too_short(text):
+        stats["short"] += 1
+        return ''
+    key = _key(text, threshold)
+    lang = _cache_get(key)
+    if lang is None:
+        lang = _detect(text, threshold)
+        _cache_put(key, lang)
+    return lang
+
+
+def detect_languages(texts, threshold: float = 0.8) -> list:
+    """
+    Batch version of detect_language (same results, same order).
+
+    Identical texts are detected once, cached texts are free, and when
+    more than POOL_MIN_BATCH texts are left the work is spread over a
+    process pool.
+    """
+    texts = [t or '' for t in texts]
+    out = [''] * len(texts)
+    todo = OrderedDict()                # key -> (text, [positions])
+    for i, text in enumerate(texts):
+        if _too_short(text):
+            stats["short"] += 1
+            continue
+        key = _key(text, threshold)
+        if key in todo:
+            todo[key][1].append(i)
+            continue
+        lang = _cache_get(key)
+        if lang is not None:
+            out[i] = lang
+        else:
+            todo[key] = (text, [i])
+
+    if not todo:
+        return out
+    pending = [text for text, _ in todo.values()]
+    workers = POOL_WORKERS or os.cpu_count() or 1
+    if len(pending) >= POOL_MIN_BATCH and workers > 1:
+        chunk = max(1, len(pending) // (4 * workers))
+        langs = list(_get_pool().map(_detect, pending, [threshold] * len(pending), chunksize=chunk))
+    else:
+        langs = [_detect(text, threshold) for text in pending]
+
+    for (key, (_, positions)), lang in zip(todo.items(), langs):
+        _cache_put(key, lang)
+        for i in positions:
+            out[i] = lang
+    return out
+
+
+def _psl_version(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8") as f:
+            for _, line in zip(range(20), f):
+                if line.startswith("// VERSION:"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return ''
+
+
+PSL_VERSION = _psl_version(PSL_FILE)
+_tld = tldextract.TLDExtract(
+    suffix_list_urls=(pathlib.Path(PSL_FILE).resolve().as_uri(),),
+    cache_dir=None,              # nothing written to ~/.cache
+    fallback_to_snapshot=True,   # file missing: tldextract's own snapshot
+)
+_tld("example.sn")               # load the list now rather than on the first request
+
+
+@lru_cache(maxsize=HOST_CACHE_SIZE)
+def _country_for_host(host: str) -> str:
+    last = _tld(host).suffix.split('.')[-1].lower()
+    if len(last) == 2:
+        return last
+    return 'us' if last == 'com' else ''
+
+
 def extract_country(url: str) -> str:
     """Return two-letter country code from URL suffix if available."""
     if not url:
         return ''
-    ext = tldextract.extract(url)
-    last = ext.suffix.split('.')[-1].lower()
-    if len(last) == 2:
-        return last
-    return 'us' if last == 'com' else ''
\ No newline at end of file
+    return _country_for_host(lenient_netloc(url).lower())
+
+
+def extract_countries(urls) -> list:
+    """extract_country for a whole result set (hosts are resolved once)."""
+    hosts = {}
+    out = []
+    for url in urls:
+        if not url:
+            out.append('')
+            continue
+        host = lenient_netloc(url).lower()
+        cc = hosts.get(host)
+        if cc is None:
+            cc = hosts[host] = _country_for_host(host)
+        out.append(cc)
+    return out
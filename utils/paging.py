@@ -0,0 +1,197 @@
+"""
+Streaming and cursor pagination shared by every /articles handler.
+
+Handlers build their normalized items as a generator (filters applied
+item by item) and hand it to `respond(items, meta)`, which reads the
+request arguments:
+
+* nothing extra      -> the historical response, unchanged: the full
+                        envelope {"articles": [...], **meta}, or a bare
+                        list when meta is None (reddit)
+* limit=N            -> the first N items plus "next_cursor" (None on the
+                        last page); the rest of the generator is kept
+                        server-side for RESULT_TTL seconds
+* cursor=...         -> the next page of that result (same limit unless
+                        given again), without redoing the upstream work
+                        (handlers call `resume()` first)
+* stream=1 / format=ndjson
+                     -> application/x-ndjson, one item per line as soon
+                        as it passes the filters, then a trailer line
+                        {"done": true, "count": n, "next_cursor": ..., **meta}
+
+Cursors are opaque; an expired or unknown cursor answers 410 and the
+client starts over without it.
+"""
+import base64
+import binascii
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from itertools import islice
+
+from flask import Response, jsonify, request
+
+RESULT_TTL  = float(os.getenv("PAGING_RESULT_TTL", 600))
+MAX_RESULTS = int(os.getenv("PAGING_MAX_RESULTS", 64))
+MAX_LIMIT   = int(os.getenv("PAGING_MAX_LIMIT", 1000))
+
+
+def batched(iterable, size):
+    """Lists of `size` items (batch language detection without waiting for everything)."""
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Result:
+    """A handler's generator, consumed lazily and remembered for later pages."""
+
+    def __init__(self, items, meta):
+        self.items   = []
+        self.source  = iter(items)
+        self.meta    = meta
+        self.done    = False
+        self.lock    = threading.Lock()
+        self.touched = time.monotonic()
+
+    def _fill(self, i):
+        # called with the lock held
+        while i >= len(self.items) and not self.done:
+            try:
+                self.items.append(next(self.source))
+            except StopIteration:
+                self.done = True
+        return i < len(self.items)
+
+    def page(self, offset, limit):
+        for i in range(offset, offset + limit):
+            with self.lock:
+                if not self._fill(i):
+                    return
+                item = self.items[i]
+            yield item
+
+    def has(self, i):
+        with self.lock:
+            return self._fill(i)
+
+
+class ResultStore:
+    def __init__(self, ttl=RESULT_TTL, max_results=MAX_RESULTS):
+        self.ttl         = ttl
+        self.max_results = max_results
+        self._results    = OrderedDict()   # id -> _Result
+        self._lock       = threading.Lock()
+
+    def add(self, items, meta):
+        rid, result = uuid.uuid4().hex, _Result(items, meta)
+        with self._lock:
+            self._evict()
+            self._results[rid] = result
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+        return rid, result
+
+    def get(self, rid):
+        with self._lock:
+            self._evict()
+            result = self._results.get(rid)
+            if result is not None:
+                result.touched = time.monotonic()
+                self._results.move_to_end(rid)
+            return result
+
+    def _evict(self):
+        now = time.monotonic()
+        for rid in [r for r, res in self._results.items() if now - res.touched > self.ttl]:
+            del self._results[rid]
+
+
+RESULTS = ResultStore()
+
+
+def encode_cursor(rid, offset, limit):
+    raw = json.dumps({"r": rid, "o": offset, "l": limit}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return data["r"], int(data["o"]), int(data["l"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        return None, None, None
+
+
+def _limit():
+    raw = request.args.get("limit")
+    if not raw:
+        return None
+    try:
+        return max(1, min(int(raw), MAX_LIMIT))
+    except ValueError:
+        return None
+
+
+def _streaming():
+    return request.args.get("stream") == "1" or request.args.get("format") == "ndjson"
+
+
+def _ndjson(items, trailer):
+    def generate():
+        count = 0
+        for item in items:
+            count += 1
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+        yield json.dumps({"done": True, "count": count, **trailer()}, ensure_ascii=False) + "\n"
+    return Response(generate(), mimetype="application/x-ndjson",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+def _page(rid, result, offset, limit):
+    """(items of the page, trailer()) ; the next cursor is known once the page is consumed."""
+    def trailer():
+        more = result.has(offset + limit)
+        return {"next_cursor": encode_cursor(rid, offset + limit, limit) if more else None,
+                **(result.meta or {})}
+    return result.page(offset, limit), trailer
+
+
+def resume():
+    """Response for ?cursor=..., or None when the request has no cursor."""
+    cursor = request.args.get("cursor")
+    if not cursor:
+        return None
+    rid, offset, limit = decode_cursor(cursor)
+    result = RESULTS.get(rid) if rid else None
+    if result is None:
+        return jsonify({"error": "cursor expired or unknown, restart without cursor"}), 410
+    items, trailer = _page(rid, result, offset, _limit() or limit)
+    if _streaming():
+        return _ndjson(items, trailer)
+    items = list(items)
+    return jsonify({"articles": items, **trailer()})
+
+
+def respond(items, meta=None):
+    """/articles response for a generator of normalized items (see module doc)."""
+    limit = _limit()
+    if limit is None:
+        if _streaming():
+            return _ndjson(items, lambda: {"next_cursor": None, **(meta or {})})
+        items = list(items)
+        return jsonify(items if meta is None else {"articles": items, **meta})
+
+    rid, result = RESULTS.add(items, meta)
+    page, trailer = _page(rid, result, 0, limit)
+    if _streaming():
+        return _ndjson(page, trailer)
+    page = list(page)
+    return jsonify({"articles": page, **trailer()})
@@ -1,4 +1,16 @@
 import re
+from functools import lru_cache
+
+try:                                   # optional : pip install pyahocorasick
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_WS = re.compile(r"\s+")
+_EXCLUDE_SPLIT = re.compile(r"[,\s]+")
+
+_INCLUDE, _EXCLUDE = 1, 2
+
 
 def match_query(q_raw: str, text: str) -> bool:
     """
@@ -11,14 +23,122 @@ def match_query(q_raw: str, text: str) -> bool:
     "Jonh Abraham Cena"       ➜  exact phrase match
     "jean,Abraham,Cena"       ➜  match any of the 3 tokens
     """
-    q_raw = (q_raw or "").strip().lower()
-    if not q_raw:
-        return True         
-    text = (text or "").lower()
-
-    if "," in q_raw:         
-        return any(kw and kw in text for kw in (k.strip() for k in q_raw.split(",")))
-    else:                    
-        norm_text = re.sub(r"\s+", " ", text)
-        norm_q    = re.sub(r"\s+", " ", q_raw)
-        return norm_q in norm_text
+    return compile_query(q_raw).matches(text)
+
+
+@lru_cache(maxsize=256)
+def compile_query(q_raw: str, exclude=()) -> "QueryMatcher":
+    return QueryMatcher(q_raw, exclude)
+
+
+def split_exclude(raw: str) -> list:
+    """Split an `exclude` parameter on commas / whitespace (lower-cased)."""
+    return [w for w in _EXCLUDE_SPLIT.split((raw or "").lower()) if w]
+
+
+class QueryMatcher:
+    """
+    `match_query` + exclude list, compiled once per request.
+
+    All keywords (OR-keywords of the query and exclude words) go into a
+    single multi-pattern automaton, so each text is scanned once instead
+    of once per keyword. Uses pyahocorasick when installed, otherwise a
+    compiled regex alternation. Semantics are exactly those of
+    `match_query` followed by `any(w in text.lower() for w in exclude)`.
+
+    >>> m = QueryMatcher("sonko,diomaye", "football")
+    >>> m.filter(["Sonko à Dakar", "Diomaye et le football", "rien"])
+    [True, False, False]
+    """
+
+    def __init__(self, q_raw: str = "", exclude=()):
+        q = (q_raw or "").strip().lower()
+        if isinstance(exclude, str):
+            exclude = split_exclude(exclude)
+        self.exclude  = tuple(w.lower() for w in exclude if w)
+        self.match_all = not q
+        self.keywords = ()
+        self._phrase  = None            # str (no whitespace) or compiled regex
+
+        if q and "," in q:
+            self.keywords = tuple(kw for kw in (k.strip() for k in q.split(",")) if kw)
+        elif q:
+            tokens = _WS.split(q)
+            if len(tokens) == 1:
+                self._phrase = q
+            else:
+                # "a b" in re.sub(r"\s+", " ", text)  <=>  a\s+b in text
+                self._phrase = re.compile(r"\s+".join(map(re.escape, tokens)))
+
+        self._automaton = None
+        if ahocorasick is not None and (self.keywords or self.exclude):
+            flags = {}
+            for kw in self.keywords:
+                flags[kw] = flags.get(kw, 0) | _INCLUDE
+            for w in self.exclude:
+                flags[w] = flags.get(w, 0) | _EXCLUDE
+            self._automaton = ahocorasick.Automaton()
+            for word, flag in flags.items():
+                self._automaton.add_word(word, flag)
+            self._automaton.make_automaton()
+        self._kw_rx = self._alternation(self.keywords)
+        self._ex_rx = self._alternation(self.exclude)
+
+    @staticmethod
+    def _alternation(words):
+        if not words:
+            return None
+        # longest first only matters for speed, any hit is enough
+        return re.compile("|".join(map(re.escape, sorted(set(words), key=len, reverse=True))))
+
+    # ------------------------------------------------------------------
+    def _phrase_in(self, text: str) -> bool:
+        if isinstance(self._phrase, str):
+            return self._phrase in text
+        return self._phrase.search(text) is not None
+
+    def _scan(self, text: str, use_exclude: bool):
+        """Return (keyword hit, excluded) for an already lower-cased text."""
+        if self._automaton is not None:
+            hit = 0
+            for _, flag in self._automaton.iter(text):
+                hit |= flag
+                if hit & _EXCLUDE if use_exclude else hit & _INCLUDE:
+                    break
+            return bool(hit & _INCLUDE), use_exclude and bool(hit & _EXCLUDE)
+        included = self._kw_rx is not None and self._kw_rx.search(text) is not None
+        excluded = use_exclude and self._ex_rx is not None and self._ex_rx.search(text) is not None
+        return included, excluded
+
+    def _decide(self, text: str, use_exclude: bool, lowered: bool = False) -> bool:
+        text = (text or "") if lowered else (text or "").lower()
+        included, excluded = False, False
+        if self.keywords or use_exclude:
+            included, excluded = self._scan(text, use_exclude)
+        if excluded:
+            return False
+        if self.match_all:
+            return True
+        if self._phrase is not None:
+            return self._phrase_in(text)
+        return included                 # OR-keywords (False for q=",")
+
+    # ------------------------------------------------------------------
+    def matches(self, text: str) -> bool:
+        """Same result as match_query(q, text)."""
+        return self._decide(text, False)
+
+    def excluded(self, text: str) -> bool:
+        return bool(self.exclude) and self._scan((text or "").lower(), True)[1]
+
+    def __call__(self, text: str) -> bool:
+        """Keep `text`: matches the query and contains no excluded word."""
+        return self._decide(text, bool(self.exclude))
+
+    def filter(self, texts, lowered: bool = False) -> list:
+        """
+        Include/exclude decision for each text, in a single pass per text.
+        `lowered=True` when the texts are already lower-cased.
+        """
+        use_exclude = bool(self.exclude)
+        return [self._decide(t, use_exclude, lowered) for t in texts]
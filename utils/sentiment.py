@@ -0,0 +1,288 @@
+"""
+Lexicon-based sentiment for French and English texts.
+
+The lexicons are plain files (utils/data/sentiment_fr.tsv, sentiment_en.tsv,
+or SENTIMENT_LEXICONS=path1:path2), one "term<TAB>weight" per line, or
+"term<TAB>neg" for a negation word. "réussi*" accepts any word ending,
+"*n't" any word start; a multi-word term ("pas mal") wins over its parts.
+
+A text's score is the sum of the weights of the whole-word terms it
+contains. A term that follows a negation ("pas", "sans", "not",
+"don't"...) by at most NEGATION_WINDOW words, in the same clause, counts
+NEGATION_FACTOR times its weight. The label is "positive" (> 0),
+"negative" (< 0) or "neutral".
+
+`score_many` scores a batch in a single pass: the texts are joined and
+lower-cased once, every term and negation is found by one multi-pattern
+automaton (pyahocorasick when installed, otherwise one compiled regex
+alternation), and matches are mapped back to their text. Scores are
+cached by content hash (blake2b), like utils.lang.
+
+>>> labels(["Très bonne nouvelle", "Ce n'est pas une bonne nouvelle", "RAS"])
+['positive', 'negative', 'neutral']
+"""
+import hashlib
+import os
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate, islice
+
+try:                                   # optional : pip install pyahocorasick
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_DATA = os.path.join(os.path.dirname(__file__), "data")
+LEXICON_FILES = [p for p in os.getenv("SENTIMENT_LEXICONS", "").split(os.pathsep) if p] or [
+    os.path.join(_DATA, "sentiment_fr.tsv"), os.path.join(_DATA, "sentiment_en.tsv")]
+NEGATION_WINDOW = int(os.getenv("SENTIMENT_NEGATION_WINDOW", 3))   # words between negation and term
+NEGATION_FACTOR = float(os.getenv("SENTIMENT_NEGATION_FACTOR", -0.5))
+CACHE_SIZE      = int(os.getenv("SENTIMENT_CACHE_SIZE", 50000))
+BATCH_SIZE      = 200
+
+NEG = "neg"
+# a negation does not reach past the end of its clause
+_BREAK = re.compile(r"[.!?;:,()\n\x00]")
+
+_cache = OrderedDict()          # digest -> score
+_cache_lock = threading.Lock()
+stats = {"hits": 0, "misses": 0}
+
+
+def load_lexicon(paths) -> dict:
+    """{term: weight or NEG} from lexicon files; later files override earlier ones."""
+    lexicon = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for n, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    term, value = line.rsplit("\t", 1)
+                    lexicon[term.strip().lower()] = NEG if value.strip() == NEG else float(value)
+                except ValueError:
+                    raise ValueError(f"{path}:{n}: expected 'term<TAB>weight' or 'term<TAB>neg'") from None
+    return lexicon
+
+
+def _trie_pattern(terms) -> str:
+    """
+    Regex alternation of (core, right boundary) terms factored as a trie:
+    at each position the engine follows one branch instead of trying
+    every term, and the longest term wins.
+    """
+    trie = {}
+    for core, right in terms:
+        node = trie
+        for ch in core:
+            node = node.setdefault(ch, {})
+        node[""] = right
+
+    def emit(node):
+        alts = [re.escape(ch) + emit(child) for ch, child in node.items() if ch]
+        if "" in node:
+            alts.append("(?![^\\W_])" if node[""] else "")
+        return alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+
+    return emit(trie)
+
+
+class Analyzer:
+    """Scores texts against one lexicon (see module doc); no cache."""
+
+    # left-bounded terms shorter than this ("ne", "no", "n'") are only looked
+    # for after a space: otherwise they hit inside most words
+    SHORT = 3
+
+    def __init__(self, lexicon, window=NEGATION_WINDOW, factor=NEGATION_FACTOR):
+        self.window = window
+        self.factor = factor
+        # core -> (weight or None for a negation, check left boundary, check right boundary)
+        terms = {}
+        for term, value in lexicon.items():
+            core = term.strip("*")
+            if core:
+                terms[core] = (None if value == NEG else value,
+                               not term.startswith("*"), not term.endswith("*"))
+        self._terms = list(terms.items())
+        self._index = {core: i for i, (core, _) in enumerate(self._terms)}
+
+        self._automaton = None
+        self._rx = None
+        if ahocorasick is not None and self._terms:
+            self._automaton = ahocorasick.Automaton()
+            for i, (core, (_, left, right)) in enumerate(self._terms):
+                key = core
+                if left and len(core) < self.SHORT:
+                    key, left = " " + core, False      # the space is the boundary
+                self._automaton.add_word(key, (i, len(key) - len(core), len(key), left, right))
+            self._automaton.make_automaton()
+        elif self._terms:
+            bounded = [(core, right) for core, (_, left, right) in self._terms if left]
+            free    = [(core, right) for core, (_, left, right) in self._terms if not left]
+            self._rx = re.compile("|".join(
+                ([f"(?<![^\\W_]){_trie_pattern(bounded)}"] if bounded else [])
+                + ([_trie_pattern(free)] if free else [])))
+
+    def _matches(self, corpus):
+        """(start, end, term index) of whole-word terms, left to right, without overlaps."""
+        if self._rx is not None:
+            index = self._index
+            return [(m.start(), m.end(), index[m.group()]) for m in self._rx.finditer(corpus)]
+        if self._automaton is None:
+            return []
+        # letters and digits make words (\w without "_", like the regex).
+        # Hits come by end position: a hit that starts inside the first kept
+        # hit it overlaps loses to it, otherwise it is longer than all the
+        # kept hits it overlaps and replaces them (leftmost, then longest).
+        size, out, reached = len(corpus), [], 0
+        for last, (i, skip, length, left, right) in self._automaton.iter(corpus):
+            start, end = last - length + 1, last + 1
+            if left and start and corpus[start - 1].isalnum():
+                continue
+            if right and end < size and corpus[end].isalnum():
+                continue
+            start += skip
+            if start < reached:         # overlaps the last kept hit
+                j = len(out) - 1
+                while j and out[j - 1][1] > start:
+                    j -= 1
+                if out[j][0] < start:
+                    continue
+                del out[j:]
+            out.append((start, end, i))
+            reached = end
+        return out
+
+    def _negated(self, corpus, neg_end, start) -> bool:
+        gap = corpus[neg_end:start]
+        return _BREAK.search(gap) is None and len(gap.split()) <= self.window
+
+    def scores(self, texts) -> list:
+        """Score of each text, in a single pass over all of them."""
+        texts = [t or "" for t in texts]
+        if not texts:
+            return []
+        # each text starts with a space (see SHORT) and ends with a separator
+        joined = " " + "\x00 ".join(texts)
+        corpus = joined.lower()
+        if len(corpus) != len(joined):     # rare letters whose lower case is longer
+            texts  = [t.lower() for t in texts]
+            corpus = " " + "\x00 ".join(texts)
+        corpus = corpus.replace("’", "'")
+        starts = [0, *accumulate(len(t) + 2 for t in texts[:-1])]
+
+        out = [0.0] * len(texts)
+        terms = self._terms
+        ends  = starts[1:] + [len(corpus)]
+        doc, neg_end, upto = 0, None, ends[0]
+        for start, end, i in self._matches(corpus):
+            if start >= upto:           # next text with a match
+                doc, neg_end = bisect_right(starts, start) - 1, None
+                upto = ends[doc]
+            weight = terms[i][1][0]
+            if weight is None:
+                neg_end = end
+                continue
+            if neg_end is not None and self._negated(corpus, neg_end, start):
+                weight *= self.factor
+            out[doc] += weight
+        return out
+
+    def score(self, text: str) -> float:
+        return self.scores([text])[0]
+
+
+ANALYZER = Analyzer(load_lexicon(LEXICON_FILES))
+
+
+def _key(text: str):
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def score_many(texts, cache=True) -> list:
+    """
+    ANALYZER.scores with a cache: identical texts are scored once, cached
+    texts are free, the rest go through the analyzer in one batch.
+    cache=False scores a one-off batch straight away, without hashing it
+    or evicting the texts that will be asked for again.
+    """
+    if not cache:
+        return ANALYZER.scores(texts)
+    texts = [t or "" for t in texts]
+    keys  = [_key(t) if t else None for t in texts]
+    out   = [0.0] * len(texts)
+    todo  = {}                          # key -> (text, [positions])
+    with _cache_lock:
+        cached = _cache.get
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            if key in todo:
+                todo[key][1].append(i)
+                continue
+            value = cached(key)
+            if value is not None:
+                _cache.move_to_end(key)
+                stats["hits"] += 1
+                out[i] = value
+            else:
+                todo[key] = (texts[i], [i])
+    if not todo:
+        return out
+
+    scores = ANALYZER.scores(text for text, _ in todo.values())
+    with _cache_lock:
+        for (key, (_, positions)), value in zip(todo.items(), scores):
+            _cache[key] = value
+            for i in positions:
+                out[i] = value
+        stats["misses"] += len(todo)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return out
+
+
+def score(text: str) -> float:
+    return score_many([text])[0]
+
+
+def label(value: float) -> str:
+    return "positive" if value > 0 else "negative" if value < 0 else "neutral"
+
+
+def labels(texts, cache=True) -> list:
+    """Label of each text (batch, cached unless cache=False)."""
+    return [label(s) for s in score_many(texts, cache)]
+
+
+def item_text(item) -> str:
+    """Text scored for a normalized record: title, description, texte (each once)."""
+    title, desc, texte = item.get("title"), item.get("description"), item.get("texte")
+    if not texte:                       # the usual record
+        return f"{title} {desc}" if title and desc and desc != title else title or desc or ""
+    parts = []
+    for value in (title, desc, texte):
+        if value and value not in parts:
+            parts.append(value)
+    return " ".join(parts)
+
+
+def annotate(items, size=BATCH_SIZE):
+    """
+    Add a "sentiment" label to normalized records, `size` at a time, so a
+    streamed /articles response still starts early. Records that already
+    carry one keep it.
+    """
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        todo = [a for a in batch if not a.get("sentiment")]
+        for a, lab in zip(todo, labels(item_text(a) for a in todo)):
+            a["sentiment"] = lab
+        yield from batch
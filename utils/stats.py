@@ -0,0 +1,132 @@
+"""
+Aggregate statistics over normalized /articles records.
+
+Server-side version of `computeStats` from frontend/src/App.jsx, returning
+the same compact payload
+
+    {"totalMentions", "topSources": [{"name", "count"}],
+     "timeline": [{"date", "count"}], "sentiment": {"positive", "negative", "neutral"},
+     "bucket"}
+
+Records are turned into columns once (source, UTC epoch seconds,
+sentiment label) and aggregated with NumPy:
+
+* sources: counted once; ties keep first-appearance order, like the
+  stable sort in the browser; "service", else the URL host, else "Inconnu"
+* timeline: epoch seconds floored to the bucket ("day", "week" starting
+  Monday, or "hour"); ISO dates go through numpy's datetime64 parser,
+  anything else through utils.dates.to_utc
+* sentiment: a record's own "sentiment" label (every service adds one,
+  see utils.sentiment), otherwise the records without one are scored in
+  one batch by utils.sentiment, outside its cache
+"""
+import re
+from collections import Counter
+
+import numpy as np
+
+from .dates import to_utc_many
+from .sentiment import item_text, labels as sentiment_labels
+
+BUCKETS = {"hour": 3600, "day": 86400, "week": 7 * 86400}
+# 1970-01-01 was a Thursday: shift by 3 days so weeks start on Monday
+_WEEK_SHIFT = 3 * 86400
+_ISO_HEAD = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(?:[.+Z]|$)")
+# what may follow "YYYY-MM-DDTHH:MM:SS" in a UTC date (first character, then
+# the rest once the fraction is stripped)
+_UTC_NEXT  = {"", ".", "+", "Z"}
+_UTC_TAILS = {"", "+00:00", "Z"}
+_LABELS = ("positive", "negative", "neutral")
+_HOST = re.compile(r"[a-zA-Z][a-zA-Z0-9+.-]*://([^/?#]+)")
+
+
+def _host(a):
+    m = _HOST.match(a.get("url") or "")
+    return m.group(1) if m else "Inconnu"
+
+
+def _datetime64(value) -> bool:
+    try:
+        np.datetime64(value, "s")
+        return True
+    except ValueError:
+        return False
+
+
+def _epochs(values):
+    """UTC epoch seconds as float64, NaN when a date cannot be parsed."""
+    out  = np.full(len(values), np.nan)
+    # a cheap shape test on the end of the string; numpy then parses and
+    # validates the first 19 characters of the whole batch at once
+    iso  = [isinstance(v, str) and v[19:20] in _UTC_NEXT and v[19:].lstrip(".0123456789") in _UTC_TAILS
+            for v in values]
+    fast = [i for i, ok in enumerate(iso) if ok]
+    if fast:
+        try:
+            stamps = np.array([values[i][:19] for i in fast], dtype="datetime64[s]")
+        except ValueError:              # not a date after all: the strict test, one by one
+            for i in fast:
+                iso[i] = _ISO_HEAD.match(values[i]) is not None and _datetime64(values[i][:19])
+            fast = [i for i in fast if iso[i]]
+            stamps = np.array([values[i][:19] for i in fast], dtype="datetime64[s]")
+        out[fast] = stamps.astype(np.int64)
+    slow = [i for i, (v, ok) in enumerate(zip(values, iso)) if v and not ok]
+    if slow:
+        dts = to_utc_many(values[i] for i in slow)
+        out[slow] = [dt.timestamp() if dt is not None else np.nan for dt in dts]
+    return out
+
+
+def _label(value):
+    if isinstance(value, dict):
+        value = value.get("label")
+    return value if value in _LABELS else None
+
+
+def compute_stats(articles, bucket="day", top=5, names=None):
+    """
+    Compact statistics for a list of normalized records (see module doc).
+    `names` maps a source to the name shown (service id -> label), before counting.
+    """
+    bucket   = bucket if bucket in BUCKETS else "day"
+    articles = list(articles)
+    n        = len(articles)
+
+    # --- columns ---------------------------------------------------------
+    sources = [a.get("service") or _host(a) for a in articles]
+    if names:
+        sources = [names.get(s, s) for s in sources]
+    dates   = [a.get("date") for a in articles]
+    labels  = [_label(a.get("sentiment")) for a in articles]
+
+    # --- top sources -----------------------------------------------------
+    # most_common is a stable sort of first-appearance counts: ties keep that order
+    top_sources = [{"name": name, "count": count}
+                   for name, count in Counter(sources).most_common(top)]
+
+    # --- timeline ----------------------------------------------------------
+    timeline = []
+    epochs = _epochs(dates)
+    ok = np.isfinite(epochs)
+    if ok.any():
+        secs = epochs[ok].astype(np.int64)
+        size = BUCKETS[bucket]
+        shift = _WEEK_SHIFT if bucket == "week" else 0
+        keys, counts = np.unique((secs + shift) // size * size - shift, return_counts=True)
+        unit = "h" if bucket == "hour" else "D"
+        stamps = keys.astype("datetime64[s]").astype(f"datetime64[{unit}]").astype(str)
+        suffix = ":00" if bucket == "hour" else ""
+        timeline = [{"date": s + suffix, "count": int(c)} for s, c in zip(stamps, counts)]
+
+    # --- sentiment ---------------------------------------------------------
+    sentiment = dict.fromkeys(_LABELS, 0)
+    missing = [i for i, lab in enumerate(labels) if lab is None]
+    if missing:
+        texts = [item_text(articles[i]) for i in missing]
+        # a one-off batch: not worth hashing, and it would evict the service caches
+        for i, lab in zip(missing, sentiment_labels(texts, cache=False)):
+            labels[i] = lab
+    sentiment.update(Counter(labels))
+
+    return {"totalMentions": n, "topSources": top_sources, "timeline": timeline,
+            "sentiment": sentiment, "bucket": bucket}
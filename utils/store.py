@@ -0,0 +1,81 @@
+"""
+Local store of already-fetched items, one JSON file per normalized query
+(<directory>/<slug>.json), shared by the incremental collectors
+(twitter_service/tweet_store.py, reddit_service/post_store.py).
+
+A subclass says what it stores:
+
+    ITEMS  list field of the entry ("tweets", "posts")
+    EMPTY  the other fields of a new entry (watermark, coverage...)
+    item_id(item), order(item)  dedup key and sort key (newest first)
+
+`lock(query)` serialises two identical requests so only one of them pays
+the API delta; `save` writes atomically (tmp file + os.replace).
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+
+
+def normalize_query(q):
+    return " ".join((q or "").lower().split())
+
+
+def _slug(query):
+    base = re.sub(r"[^a-z0-9]+", "-", query).strip("-")[:40] or "q"
+    return f"{base}-{hashlib.md5(query.encode('utf-8')).hexdigest()[:8]}"
+
+
+class QueryStore:
+    ITEMS = "items"
+    EMPTY = {}
+
+    def __init__(self, directory, max_items=5000):
+        self.directory = directory
+        self.max_items = max_items
+        self._locks    = {}
+        self._guard    = threading.Lock()
+
+    def item_id(self, item):
+        return item["id"]
+
+    def order(self, item):
+        return item["id"]
+
+    def lock(self, query):
+        """Per-query lock."""
+        with self._guard:
+            return self._locks.setdefault(normalize_query(query), threading.Lock())
+
+    def path(self, query):
+        return os.path.join(self.directory, _slug(normalize_query(query)) + ".json")
+
+    def load(self, query):
+        query = normalize_query(query)
+        try:
+            with open(self.path(query), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        if not entry or entry.get("query") != query:
+            entry = {"query": query, **self.EMPTY, self.ITEMS: []}
+        return entry
+
+    def merge(self, entry, items):
+        """Add items (no duplicates), newest first, at most max_items."""
+        by_id = {self.item_id(i): i for i in entry[self.ITEMS]}
+        for i in items:
+            by_id[self.item_id(i)] = i
+        merged = sorted(by_id.values(), key=self.order, reverse=True)
+        entry[self.ITEMS] = merged[:self.max_items]
+        return merged
+
+    def save(self, entry):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(entry["query"])
+        tmp  = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp, path)
@@ -1,12 +1,15 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 from datetime import datetime
-import os, re, sys, json
+import os, sys, json
 
 # chemin vers utils
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from utils.search import match_query                         # noqa: E402
-from youtube_client import fetch_videos, search_youtube      # noqa: E402
+from utils.search import QueryMatcher                        # noqa: E402
+from utils.dates import parse_window, window_bounds          # noqa: E402
+from utils import paging                                     # noqa: E402
+from utils.sentiment import annotate                         # noqa: E402
+from youtube_client import fetch_videos, search_youtube, PAGES, QUOTA  # noqa: E402
 
 app = Flask(__name__)
 CORS(app)  # autorise le front-end
@@ -38,38 +41,54 @@ def collect_youtube():
 # -------------------------------------------------------------------------
 # Route utilisée par le front-end
 # -------------------------------------------------------------------------
+def _normalize(videos, keep):
+    for v, kept in zip(videos, keep):
+        title = v["title"]
+        if not kept:
+            continue
+
+        yield {
+            "service": "youtube",
+            "id": v["videoId"],
+            "title": title,
+            "date": v["publishedAt"],
+            "texte": title,
+            "auteur": v.get("channelTitle", ""),
+            "url": f"https://www.youtube.com/watch?v={v['videoId']}",
+        }
+
+
 @app.route("/articles", methods=["GET"])
 def articles():
+    # page suivante d'un résultat précédent (?cursor=) : aucun appel à l'API
+    page = paging.resume()
+    if page is not None:
+        return page
+
     q   = request.args.get("q", "")
-    ex  = [w for w in re.split(r"[,\s]+", request.args.get("exclude", "").lower()) if w]
+    matcher = QueryMatcher(q, request.args.get("exclude", ""))
     n   = int(request.args.get("n", 1000))
 
-    videos = fetch_videos(q, n)
+    # fenêtre par défaut 1er janv. 2023 → aujourd'hui, passée à l'API
+    start, end = parse_window(request.args.get("start"), request.args.get("end"))
 
-    results = []
-    for v in videos:
-        title = v["title"]
+    # pages en cache gratuites ; les autres décomptées du quota (moins de pages s'il baisse)
+    videos, report = fetch_videos(q, n, *window_bounds(start, end))
+    keep   = matcher.filter(v["title"] for v in videos)   # filtre inclure / exclure
+
+    # liste complète, pages ?limit= ou flux ?stream=1 (voir utils.paging)
+    return paging.respond(annotate(_normalize(videos, keep)), {
+        "partial":  report["downgraded"],
+        "cache":    {**report, "hit_rate": round(report["cache_hits"] / report["pages"], 3)
+                                           if report["pages"] else 0.0},
+        "quota":    QUOTA.snapshot(),
+    })
 
-        # filtre inclure / exclure
-        if q and not match_query(q, title):
-            continue
-        if ex and any(w in title.lower() for w in ex):
-            continue
 
-        results.append(
-            {
-                "service": "youtube",
-                "id": v["videoId"],
-                "title": title,
-                "date": v["publishedAt"],
-                "texte": title,
-                "auteur": v.get("channelTitle", ""),
-                "url": f"https://www.youtube.com/watch?v={v['videoId']}",
-                
-            }
-        )
-
-    return jsonify(results)
+@app.route("/quota", methods=["GET"])
+def quota():
+    """Quota du jour et efficacité du cache de pages depuis le démarrage."""
+    return jsonify({"quota": QUOTA.snapshot(), "cache": PAGES.stats()})
 
 
 if __name__ == "__main__":
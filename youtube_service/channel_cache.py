@@ -0,0 +1,72 @@
+"""
+Cache longue durée des métadonnées de chaînes YouTube.
+
+Le titre, le handle et la vignette d'une chaîne changent rarement : on les
+garde `ttl` secondes (une semaine par défaut) en mémoire, sauvegardés en
+JSON pour survivre aux redémarrages. Seules les chaînes absentes ou
+périmées sont redemandées à channels.list.
+"""
+import json
+import os
+import threading
+import time
+
+
+class ChannelCache:
+    def __init__(self, path, ttl=7 * 24 * 3600):
+        self.path      = path
+        self.ttl       = ttl
+        self._channels = {}          # channel_id -> {"title", "handle", "thumb", "fetched_at"}
+        self._lock     = threading.Lock()
+        self._dirty    = False
+        self.counters  = {"hits": 0, "misses": 0}
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._channels = json.load(f).get("channels", {})
+        except (OSError, ValueError):
+            self._channels = {}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"channels": dict(self._channels)}
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+
+    def get_many(self, channel_ids):
+        """Returns (found {id: meta}, missing [id]) ; missing sans doublons."""
+        now = time.time()
+        found, missing = {}, []
+        with self._lock:
+            for cid in dict.fromkeys(channel_ids):
+                meta = self._channels.get(cid)
+                if meta and now - meta["fetched_at"] < self.ttl:
+                    found[cid] = meta
+                else:
+                    missing.append(cid)
+            self.counters["hits"]   += len(found)
+            self.counters["misses"] += len(missing)
+        return found, missing
+
+    def put_many(self, metas):
+        now = time.time()
+        with self._lock:
+            for cid, meta in metas.items():
+                self._channels[cid] = {**meta, "fetched_at": now}
+            self._dirty = bool(metas) or self._dirty
+
+    def stats(self):
+        with self._lock:
+            return {**self.counters, "channels": len(self._channels)}
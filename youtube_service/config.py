@@ -3,3 +3,21 @@ from dotenv import load_dotenv
 load_dotenv()
 
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+
+# Base de l'API (surcharge possible pour tester contre une fausse API locale)
+API_URL = os.getenv("YOUTUBE_API_URL", "https://www.googleapis.com/youtube/v3")
+
+# Cache disque des pages search.list (secondes, 0 = désactivé)
+PAGE_CACHE_DIR = os.getenv("YOUTUBE_PAGE_CACHE_DIR", "data/cache/pages")
+PAGE_CACHE_TTL = float(os.getenv("YOUTUBE_PAGE_CACHE_TTL", 1800))
+
+# Quota journalier (unités) : réserve gardée pour /collect, et part maximale
+# du budget restant qu'une requête /articles peut dépenser
+DAILY_QUOTA   = int(os.getenv("YOUTUBE_DAILY_QUOTA", 10000))
+QUOTA_RESERVE = int(os.getenv("YOUTUBE_QUOTA_RESERVE", 500))
+REQUEST_SHARE = float(os.getenv("YOUTUBE_REQUEST_SHARE", 0.25))
+QUOTA_PATH    = os.getenv("YOUTUBE_QUOTA_PATH", "data/cache/quota.json")
+
+# Métadonnées des chaînes (titre, vignette) : changent rarement
+CHANNEL_CACHE_PATH = os.getenv("YOUTUBE_CHANNEL_CACHE_PATH", "data/cache/channels.json")
+CHANNEL_CACHE_TTL  = float(os.getenv("YOUTUBE_CHANNEL_CACHE_TTL", 7 * 24 * 3600))
@@ -0,0 +1,101 @@
+"""
+Comptabilité du quota journalier de l'API YouTube Data v3.
+
+Chaque appel coûte des unités (search.list = 100, videos/channels.list = 1)
+sur un budget de 10 000 par jour, remis à zéro à minuit heure du Pacifique.
+On décompte avant d'appeler : `take(cost)` refuse l'appel plutôt que de
+laisser la clé s'épuiser, et `pages_allowed()` réduit le nombre de pages
+d'une requête quand le budget restant baisse. Une réserve reste disponible
+pour les autres routes (/collect).
+
+L'état est sauvegardé en JSON pour survivre aux redémarrages.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+
+try:
+    from zoneinfo import ZoneInfo
+    _PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:                      # pas de base tz : on compte en UTC
+    from datetime import timezone
+    _PACIFIC = timezone.utc
+
+SEARCH_COST = 100
+
+
+def _today():
+    return datetime.now(_PACIFIC).date().isoformat()
+
+
+class QuotaAccountant:
+    def __init__(self, path, daily_limit=10000, reserve=0, request_share=1.0):
+        self.path          = path
+        self.daily_limit   = daily_limit
+        self.reserve       = reserve        # unités jamais dépensées par /articles
+        self.request_share = request_share  # part max du budget restant par requête
+        self.day           = _today()
+        self.spent         = 0
+        self._lock         = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError, TypeError):
+            return
+        if data.get("day") == self.day:
+            self.spent = int(data.get("spent", 0))
+
+    def _save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"day": self.day, "spent": self.spent}, f)
+        os.replace(tmp, self.path)
+
+    def _roll(self):
+        today = _today()
+        if today != self.day:
+            self.day, self.spent = today, 0
+
+    def remaining(self, reserve=True):
+        with self._lock:
+            self._roll()
+            left = self.daily_limit - self.spent - (self.reserve if reserve else 0)
+            return max(0, left)
+
+    def pages_allowed(self, wanted, cost=SEARCH_COST):
+        """Nombre de pages qu'une requête peut payer (0 = refus)."""
+        budget = self.remaining() * self.request_share
+        if wanted and budget < cost <= self.remaining():
+            budget = cost                   # toujours au moins une page tant qu'il en reste
+        return min(wanted, int(budget // cost))
+
+    def take(self, cost=SEARCH_COST, reserve=True):
+        """Décompte `cost` unités avant l'appel ; False si le budget ne le permet pas."""
+        with self._lock:
+            self._roll()
+            left = self.daily_limit - self.spent - (self.reserve if reserve else 0)
+            if cost > left:
+                return False
+            self.spent += cost
+            self._save()
+            return True
+
+    def exhaust(self):
+        """403 quotaExceeded : la clé est vide pour aujourd'hui, quoi qu'on ait compté."""
+        with self._lock:
+            self._roll()
+            self.spent = max(self.spent, self.daily_limit)
+            self._save()
+
+    def snapshot(self):
+        with self._lock:
+            self._roll()
+            return {"day": self.day, "limit": self.daily_limit, "spent": self.spent,
+                    "remaining": max(0, self.daily_limit - self.spent), "reserve": self.reserve}
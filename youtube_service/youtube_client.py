@@ -6,36 +6,118 @@ Deux fonctions :
 * search_youtube : version “riche” (récupère aussi la vignette du channel)
 """
 
+import math
+import os, sys
+import threading
+import httplib2
 import requests
 from googleapiclient.discovery import build
-from config import YOUTUBE_API_KEY
+from config import (YOUTUBE_API_KEY, API_URL, PAGE_CACHE_DIR, PAGE_CACHE_TTL,
+                    DAILY_QUOTA, QUOTA_RESERVE, REQUEST_SHARE, QUOTA_PATH,
+                    CHANNEL_CACHE_PATH, CHANNEL_CACHE_TTL)
+from channel_cache import ChannelCache
+from quota import QuotaAccountant, SEARCH_COST
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.disk_cache import DiskCache
+
+PAGES    = DiskCache(PAGE_CACHE_DIR, PAGE_CACHE_TTL)   # pages de search.list
+QUOTA    = QuotaAccountant(QUOTA_PATH, DAILY_QUOTA, QUOTA_RESERVE, REQUEST_SHARE)
+CHANNELS = ChannelCache(CHANNEL_CACHE_PATH, CHANNEL_CACHE_TTL)
+
+CHANNELS_PER_CALL = 50    # channels.list accepte jusqu'à 50 ids séparés par des virgules
+
+_service      = None
+_service_lock = threading.Lock()
+_local        = threading.local()
+
+
+def _youtube():
+    """Objet service googleapiclient construit une seule fois pour le processus."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            options = None
+            if not API_URL.startswith("https://www.googleapis.com"):      # fausse API locale
+                options = {"api_endpoint": API_URL.rsplit("/youtube/v3", 1)[0]}
+            _service = build("youtube", "v3", developerKey=YOUTUBE_API_KEY,
+                             client_options=options, cache_discovery=False)
+        return _service
+
+
+def _http():
+    """httplib2.Http n'est pas thread-safe : une connexion par thread."""
+    if getattr(_local, "http", None) is None:
+        _local.http = httplib2.Http(timeout=10)
+    return _local.http
+
+
+def _rfc3339(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ") if dt else None
+
+
+def _quota_exceeded(resp):
+    try:
+        errors = resp.json()["error"]["errors"]
+    except (ValueError, KeyError, TypeError):
+        return False
+    return any(e.get("reason") in ("quotaExceeded", "dailyLimitExceeded") for e in errors)
+
 
 # ---------------------------------------------------------------------
-def fetch_videos(q: str, n: int = 10):
+def fetch_videos(q: str, n: int = 10, start=None, end=None):
     """
-    Renvoie les `n` vidéos les plus récentes contenant `q`.
+    Renvoie les `n` vidéos les plus récentes contenant `q`, publiées dans
+    [start, end) (datetimes UTC, passés à l'API en publishedAfter/Before).
+
+    Les pages sont servies par le cache disque quand c'est possible ; les
+    autres sont décomptées du quota avant l'appel, et la requête s'arrête
+    plus tôt (moins de pages) quand le budget du jour ne suffit plus.
 
-    Clés retournées :
-      title, description, videoId, publishedAt, channelTitle
+    Returns (videos, report) ; report = {pages, cache_hits, quota_spent,
+    downgraded, refused}.
+    Clés des vidéos : title, description, videoId, publishedAt, url, channelTitle
     """
-    url = "https://www.googleapis.com/youtube/v3/search"
+    url = f"{API_URL}/search"
     videos, next_token = [], None
+    report = {"pages": 0, "cache_hits": 0, "quota_spent": 0,
+              "downgraded": False, "refused": False}
+    wanted = math.ceil(n / 50)
+    paid   = QUOTA.pages_allowed(wanted)   # pages qu'on accepte de payer pour cette requête
 
     while len(videos) < n:
         params = {
-            "key":        YOUTUBE_API_KEY,
             "q":          q,
             "part":       "snippet",
             "type":       "video",
             "order":      "date",
             "maxResults": min(50, n - len(videos)),
         }
+        if start:
+            params["publishedAfter"] = _rfc3339(start)
+        if end:
+            params["publishedBefore"] = _rfc3339(end)
         if next_token:
             params["pageToken"] = next_token
 
-        resp = requests.get(url, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+        data = PAGES.get(params)
+        if data is not None:
+            report["cache_hits"] += 1
+        else:
+            if report["quota_spent"] >= paid * SEARCH_COST or not QUOTA.take(SEARCH_COST):
+                report["downgraded"] = True
+                report["refused"]    = report["pages"] == 0
+                break
+            report["quota_spent"] += SEARCH_COST
+            resp = requests.get(url, params={**params, "key": YOUTUBE_API_KEY}, timeout=10)
+            if resp.status_code == 403 and _quota_exceeded(resp):
+                QUOTA.exhaust()
+                report["downgraded"] = True
+                report["refused"]    = report["pages"] == 0
+                break
+            resp.raise_for_status()
+            data = resp.json()
+            PAGES.put(params, data)
+        report["pages"] += 1
 
         for it in data.get("items", []):
             snip = it["snippet"]
@@ -57,33 +139,58 @@ def fetch_videos(q: str, n: int = 10):
         if not next_token:
             break
 
-    return videos
+    return videos, report
 
 
 # ---------------------------------------------------------------------
-def search_youtube(query, max_results=20):
-    """Version “riche” (utilisée par /collect) – garde ton code existant."""
-    youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
-    req = youtube.search().list(
-        q=query, part="snippet", type="video", maxResults=max_results
-    )
-    resp = req.execute()
+def fetch_channels(channel_ids):
+    """
+    Métadonnées {channel_id: {title, handle, thumb}} : cache d'abord, puis
+    un seul channels.list par lot de 50 ids manquants (1 unité chacun).
+    """
+    found, missing = CHANNELS.get_many(channel_ids)
+    fetched = {}
+    for i in range(0, len(missing), CHANNELS_PER_CALL):
+        batch = missing[i:i + CHANNELS_PER_CALL]
+        if not QUOTA.take(1, reserve=False):
+            break
+        resp = _youtube().channels().list(part="snippet", id=",".join(batch),
+                                          maxResults=CHANNELS_PER_CALL).execute(http=_http())
+        for item in resp.get("items", []):
+            snip = item["snippet"]
+            fetched[item["id"]] = {
+                "title":  snip.get("title", "YouTube"),
+                "handle": snip.get("customUrl"),
+                "thumb":  snip.get("thumbnails", {}).get("default", {}).get("url"),
+            }
+    if fetched:
+        CHANNELS.put_many(fetched)
+        CHANNELS.save()
+    return {**found, **fetched}
+
 
+def search_youtube(query, max_results=20):
+    """Version “riche” (utilisée par /collect) : un search.list + un channels.list groupé."""
     results = []
-    for item in resp["items"]:
+    if not QUOTA.take(SEARCH_COST, reserve=False):
+        return results
+    resp = _youtube().search().list(
+        q=query, part="snippet", type="video", maxResults=min(max_results, 50)
+    ).execute(http=_http())
+
+    items    = resp.get("items", [])
+    channels = fetch_channels([it["snippet"]["channelId"] for it in items])
+    for item in items:
         snip      = item["snippet"]
         video_id  = item["id"]["videoId"]
-        channel_id = snip["channelId"]
-
-        ch_resp = youtube.channels().list(part="snippet", id=channel_id).execute()
-        ch_snip = ch_resp["items"][0]["snippet"]
+        ch        = channels.get(snip["channelId"], {})
 
         results.append(
             {
                 "service":       "youtube",
-                "source":        ch_snip.get("title", "YouTube"),
-                "channelHandle": ch_snip.get("customUrl"),
-                "channelThumb":  ch_snip["thumbnails"]["default"]["url"],
+                "source":        ch.get("title") or snip.get("channelTitle") or "YouTube",
+                "channelHandle": ch.get("handle"),
+                "channelThumb":  ch.get("thumb"),
                 "id":            video_id,
                 "title":         snip["title"],
                 "description":   snip.get("description", ""),
@@ -91,6 +198,4 @@ def search_youtube(query, max_results=20):
                 "date":          snip["publishedAt"],
             }
         )
-    print(results[0])
     return results
-